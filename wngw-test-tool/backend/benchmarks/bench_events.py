@@ -0,0 +1,107 @@
+"""Allocation and serialization cost of live event records.
+
+Compares the slotted ``domain.events`` classes with the previous plain
+dataclasses that serialized through ``dataclasses.asdict``.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.bench_events --events 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+from wngw_app.domain.events import APCIMetadata, ASDUDescriptor, IEC104FrameEvent
+
+
+@dataclass
+class _PlainAPCIMetadata:
+    type: str
+    vs: int = -1
+    vr: int = -1
+
+
+@dataclass
+class _PlainASDUDescriptor:
+    typeId: int
+    cause: int
+    ca: int
+    ioa: Optional[int]
+    payload: dict[str, Any]
+
+
+@dataclass
+class _PlainFrameEvent:
+    kind: str
+    role: str
+    dir: str
+    ts: datetime
+    apci: _PlainAPCIMetadata
+    asdu: _PlainASDUDescriptor
+    raw: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["ts"] = self.ts.isoformat()
+        return data
+
+
+def _factory(event_cls: Any, apci_cls: Any, asdu_cls: Any) -> Callable[[int], Any]:
+    ts = datetime.now(timezone.utc)
+
+    def make(ioa: int) -> Any:
+        return event_cls(
+            kind="iec104.frame",
+            role="server",
+            dir="rx",
+            ts=ts,
+            apci=apci_cls(type="I", vs=ioa & 0x7FFF, vr=0),
+            asdu=asdu_cls(typeId=13, cause=3, ca=1, ioa=ioa, payload={"value": 1.5, "qds": 0}),
+        )
+
+    return make
+
+
+def _measure(name: str, make: Callable[[int], Any], count: int) -> None:
+    gc.collect()
+    tracemalloc.start()
+    events = [make(ioa) for ioa in range(count)]
+    allocated, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del events
+
+    gc.collect()
+    collections = sum(stat["collections"] for stat in gc.get_stats())
+    started = time.perf_counter()
+    events = [make(ioa) for ioa in range(count)]
+    created = time.perf_counter() - started
+    started = time.perf_counter()
+    for event in events:
+        event.to_dict()
+    serialized = time.perf_counter() - started
+    collections = sum(stat["collections"] for stat in gc.get_stats()) - collections
+    print(
+        f"{name:>8}: {allocated / count:>6,.0f} B/event, create {created / count * 1e9:>6,.0f} ns, "
+        f"to_dict {serialized / count * 1e9:>6,.0f} ns, {collections} GC runs"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=100_000)
+    args = parser.parse_args()
+    _measure(
+        "plain", _factory(_PlainFrameEvent, _PlainAPCIMetadata, _PlainASDUDescriptor), args.events
+    )
+    _measure("slotted", _factory(IEC104FrameEvent, APCIMetadata, ASDUDescriptor), args.events)
+
+
+if __name__ == "__main__":
+    main()
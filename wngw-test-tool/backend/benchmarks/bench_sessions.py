@@ -0,0 +1,136 @@
+"""Handler latency with many concurrent stations on one event loop.
+
+Every station is a client session sending spontaneous measured values; the
+latency is taken from ``send_asdu`` until the server handler has finished.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.bench_sessions --stations 1000 --max-handlers 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+LOCAL_LIB = Path(__file__).resolve().parents[1] / "local_iec104_lib" / "src"
+if str(LOCAL_LIB) not in sys.path:
+    sys.path.insert(0, str(LOCAL_LIB))
+
+from iec104 import (  # noqa: E402
+    ASDUHeader,
+    CauseOfTransmission,
+    IEC104Client,
+    IEC104Server,
+    MeasuredValueASDU,
+    MeasuredValueFloat,
+    TypeID,
+)
+
+
+def _measurement(station: int, ioa: int) -> MeasuredValueASDU:
+    header = ASDUHeader(
+        type_id=TypeID.M_ME_NC_1,
+        sequence=False,
+        vsq_number=1,
+        cause=CauseOfTransmission.SPONTANEOUS,
+        negative_confirm=False,
+        test=False,
+        originator_address=0,
+        common_address=station,
+        oa=None,
+    )
+    return MeasuredValueASDU(
+        header=header,
+        information_objects=(MeasuredValueFloat(ioa=ioa, value=float(ioa)),),
+    )
+
+
+async def _station(
+    client: IEC104Client, station: int, messages: int, interval: float, sent: dict
+) -> None:
+    for ioa in range(messages):
+        sent[station, ioa] = time.perf_counter()
+        await client.send_asdu(_measurement(station, ioa))
+        await asyncio.sleep(interval)
+
+
+async def run(
+    transport: str,
+    stations: int,
+    messages: int,
+    interval: float,
+    work: float,
+    max_handlers: int | None,
+) -> None:
+    sent: dict[tuple[int, int], float] = {}
+    latencies: list[float] = []
+    done = asyncio.Event()
+    expected = stations * messages
+
+    async def handler(session, asdu):
+        del session
+        await asyncio.sleep(work)
+        key = (asdu.header.common_address, asdu.information_objects[0].ioa)
+        latencies.append(time.perf_counter() - sent.pop(key))
+        if len(latencies) == expected:
+            done.set()
+
+    port = 0 if transport == "tcp" else 2404
+    server = IEC104Server(
+        "127.0.0.1", port, handler, transport=transport, max_concurrent_handlers=max_handlers
+    )
+    await server.start()
+    clients = [
+        await IEC104Client.connect("127.0.0.1", server.port, transport=transport)
+        for _ in range(stations)
+    ]
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _station(client, station, messages, interval, sent)
+            for station, client in enumerate(clients, start=1)
+        )
+    )
+    await asyncio.wait_for(done.wait(), timeout=60)
+    elapsed = time.perf_counter() - started
+    for client in clients:
+        await client.close()
+    await server.stop()
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{transport:>6}: {stations} stations, {len(latencies) / elapsed:>9,.0f} ASDUs/s, "
+        f"handler p50 {statistics.median(latencies) * 1e3:,.2f} ms, p99 {p99 * 1e3:,.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=1000)
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.01, help="seconds between sends")
+    parser.add_argument("--work", type=float, default=0.001, help="simulated handler seconds")
+    parser.add_argument("--max-handlers", type=int, default=None)
+    parser.add_argument("--transport", choices=["tcp", "memory"], action="append")
+    args = parser.parse_args()
+    for transport in args.transport or ["tcp", "memory"]:
+        asyncio.run(
+            run(
+                transport,
+                args.stations,
+                args.messages,
+                args.interval,
+                args.work,
+                args.max_handlers,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
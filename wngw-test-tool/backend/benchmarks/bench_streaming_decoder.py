@@ -0,0 +1,48 @@
+"""Throughput benchmark for ``iec104.StreamingAPDUDecoder``.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.bench_streaming_decoder
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+LOCAL_LIB = Path(__file__).resolve().parents[1] / "local_iec104_lib" / "src"
+if str(LOCAL_LIB) not in sys.path:
+    sys.path.insert(0, str(LOCAL_LIB))
+
+from iec104 import StreamingAPDUDecoder  # noqa: E402
+
+# I-frame carrying one M_SP_NA_1 object.
+FRAME = bytes.fromhex("680e0000000001010300010001000001")
+
+
+def run(frames: int, chunk_size: int) -> float:
+    stream = memoryview(FRAME * frames)
+    decoder = StreamingAPDUDecoder()
+    decoded = 0
+    started = time.perf_counter()
+    for offset in range(0, len(stream), chunk_size):
+        decoded += len(decoder.feed(stream[offset : offset + chunk_size]))
+    elapsed = time.perf_counter() - started
+    assert decoded == frames
+    return frames / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, action="append")
+    args = parser.parse_args()
+    for chunk_size in args.chunk_size or [16, 1460, 65536]:
+        rate = run(args.frames, chunk_size)
+        print(f"chunk={chunk_size:>6} B  {rate:>12,.0f} frames/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Loopback latency and throughput of the IEC-104 transports.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.bench_transport --sessions 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+LOCAL_LIB = Path(__file__).resolve().parents[1] / "local_iec104_lib" / "src"
+if str(LOCAL_LIB) not in sys.path:
+    sys.path.insert(0, str(LOCAL_LIB))
+
+from iec104 import (  # noqa: E402
+    ASDUHeader,
+    CauseOfTransmission,
+    IEC104Client,
+    IEC104Server,
+    SingleCommand,
+    SingleCommandASDU,
+    TypeID,
+)
+
+
+def _command(cause: CauseOfTransmission) -> SingleCommandASDU:
+    header = ASDUHeader(
+        type_id=TypeID.C_SC_NA_1,
+        sequence=False,
+        vsq_number=1,
+        cause=cause,
+        negative_confirm=False,
+        test=False,
+        originator_address=0,
+        common_address=1,
+        oa=None,
+    )
+    return SingleCommandASDU(
+        header=header,
+        information_objects=(SingleCommand(ioa=1, state=True, qualifier=0),),
+    )
+
+
+async def _session(client: IEC104Client, commands: int) -> list[float]:
+    activation = _command(CauseOfTransmission.ACTIVATION)
+    latencies = []
+    for _ in range(commands):
+        started = time.perf_counter()
+        await client.send_asdu(activation)
+        await client.recv()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def run(transport: str, sessions: int, commands: int) -> None:
+    confirmation = _command(CauseOfTransmission.ACTIVATION_CON)
+
+    async def handler(session, asdu):
+        del asdu
+        await session.send_asdu(confirmation)
+
+    port = 0 if transport == "tcp" else 2404
+    server = IEC104Server("127.0.0.1", port, handler, transport=transport)
+    await server.start()
+    clients = [
+        await IEC104Client.connect("127.0.0.1", server.port, transport=transport)
+        for _ in range(sessions)
+    ]
+    started = time.perf_counter()
+    results = await asyncio.gather(*(_session(client, commands) for client in clients))
+    elapsed = time.perf_counter() - started
+    for client in clients:
+        await client.close()
+    await server.stop()
+
+    latencies = sorted(value for result in results for value in result)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{transport:>6}: {sessions} sessions, {len(latencies) / elapsed:>10,.0f} round trips/s, "
+        f"p50 {statistics.median(latencies) * 1e6:,.0f} us, p99 {p99 * 1e6:,.0f} us"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--commands", type=int, default=1000)
+    parser.add_argument("--transport", choices=["tcp", "memory"], action="append")
+    args = parser.parse_args()
+    for transport in args.transport or ["tcp", "memory"]:
+        asyncio.run(run(transport, args.sessions, args.commands))
+
+
+if __name__ == "__main__":
+    main()
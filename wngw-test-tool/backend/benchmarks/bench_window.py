@@ -0,0 +1,89 @@
+"""Monitor-direction throughput over TCP loopback for different k/w settings.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.bench_window --frames 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+LOCAL_LIB = Path(__file__).resolve().parents[1] / "local_iec104_lib" / "src"
+if str(LOCAL_LIB) not in sys.path:
+    sys.path.insert(0, str(LOCAL_LIB))
+
+from iec104 import (  # noqa: E402
+    ASDUHeader,
+    CauseOfTransmission,
+    IEC104Client,
+    IEC104Server,
+    SessionParameters,
+    SingleCommand,
+    SingleCommandASDU,
+    SinglePointASDU,
+    SinglePointInformation,
+    TypeID,
+)
+
+SETTINGS = [(1, 1), (12, 1), (12, 8), (64, 48), (256, 192)]
+
+
+def _header(type_id: TypeID, cause: CauseOfTransmission) -> ASDUHeader:
+    return ASDUHeader(
+        type_id=type_id,
+        sequence=False,
+        vsq_number=1,
+        cause=cause,
+        negative_confirm=False,
+        test=False,
+        originator_address=0,
+        common_address=1,
+        oa=None,
+    )
+
+
+async def run(frames: int, k: int, w: int) -> None:
+    params = SessionParameters(k=k, w=w, t2=0.01)
+    spontaneous = SinglePointASDU(
+        header=_header(TypeID.M_SP_NA_1, CauseOfTransmission.SPONTANEOUS),
+        information_objects=(SinglePointInformation(ioa=1, value=True),),
+    )
+    trigger = SingleCommandASDU(
+        header=_header(TypeID.C_SC_NA_1, CauseOfTransmission.ACTIVATION),
+        information_objects=(SingleCommand(ioa=1, state=True, qualifier=0),),
+    )
+
+    async def handler(session, asdu):
+        del asdu
+        for _ in range(frames):
+            await session.send_asdu(spontaneous)
+
+    server = IEC104Server("127.0.0.1", 0, handler, params)
+    await server.start()
+    client = await IEC104Client.connect("127.0.0.1", server.port, params)
+    started = time.perf_counter()
+    await client.send_asdu(trigger)
+    for _ in range(frames):
+        await client.recv()
+    elapsed = time.perf_counter() - started
+    acks = client.session.stats.s_frames_sent
+    await client.close()
+    await server.stop()
+    print(f"k={k:>3} w={w:>3}  {frames / elapsed:>10,.0f} frames/s  {acks:>6} S-frames")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20_000)
+    args = parser.parse_args()
+    for k, w in SETTINGS:
+        asyncio.run(run(args.frames, k, w))
+
+
+if __name__ == "__main__":
+    main()
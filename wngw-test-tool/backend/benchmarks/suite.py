@@ -0,0 +1,404 @@
+"""Benchmark suite with JSON baselines and regression checks.
+
+Covers frame encode/decode, ``LiveBus`` fan-out, ``ProtocolStore`` throughput,
+signal-list import and command round trips through the adapters.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.suite --save-baseline          # record benchmarks/baseline.json
+    python -m benchmarks.suite                          # compare against it
+    python -m benchmarks.suite --quick --only codec,livebus --tolerance 0.3
+
+The exit status is 1 when a metric is worse than its baseline by more than
+``--tolerance`` (a fraction, default 0.15).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Literal
+
+LOCAL_LIB = Path(__file__).resolve().parents[1] / "local_iec104_lib" / "src"
+if str(LOCAL_LIB) not in sys.path:
+    sys.path.insert(0, str(LOCAL_LIB))
+
+from iec104 import (  # noqa: E402
+    ASDUHeader,
+    CauseOfTransmission,
+    MeasuredValueASDU,
+    MeasuredValueFloat,
+    TypeID,
+    decode_apdu,
+)
+from iec104.codec.encode import encode_i_frame  # noqa: E402
+
+from openpyxl import Workbook  # noqa: E402
+from wngw_app.domain.events import APCIMetadata, ASDUDescriptor, IEC104FrameEvent  # noqa: E402
+from wngw_app.domain.models import ProtocolEntry  # noqa: E402
+from wngw_app.services.iec104.adapter_lib import (  # noqa: E402
+    IEC104LibClientAdapterImpl,
+    IEC104LibServerAdapterImpl,
+)
+from wngw_app.services.livebus import LiveBus  # noqa: E402
+from wngw_app.services.protocol_store import ProtocolStore  # noqa: E402
+from wngw_app.services.signal_lists import read_signal_list  # noqa: E402
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+FORMAT_VERSION = 1
+
+Better = Literal["higher", "lower"]
+
+
+@dataclass(slots=True)
+class Metric:
+    value: float
+    unit: str
+    better: Better
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"value": self.value, "unit": self.unit, "better": self.better}
+
+
+@dataclass(slots=True)
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+    # Relative change in the "worse" direction; negative values are improvements.
+    regression: float
+
+
+Results = dict[str, Metric]
+
+
+def _best(run: Callable[[], float], repeat: int) -> float:
+    """Fastest of ``repeat`` timings, to suppress scheduling noise."""
+
+    return min(run() for _ in range(repeat))
+
+
+def _measurement(ioa: int, objects: int = 10) -> MeasuredValueASDU:
+    header = ASDUHeader(
+        type_id=TypeID.M_ME_NC_1,
+        sequence=False,
+        vsq_number=objects,
+        cause=CauseOfTransmission.SPONTANEOUS,
+        negative_confirm=False,
+        test=False,
+        originator_address=0,
+        common_address=1,
+        oa=None,
+    )
+    return MeasuredValueASDU(
+        header=header,
+        information_objects=[
+            MeasuredValueFloat(ioa=ioa + index, value=index * 0.5) for index in range(objects)
+        ],
+    )
+
+
+def _event(ioa: int) -> IEC104FrameEvent:
+    return IEC104FrameEvent(
+        kind="iec104.frame",
+        role="server",
+        dir="rx",
+        ts=datetime.now(timezone.utc),
+        apci=APCIMetadata(type="I", vs=ioa & 0x7FFF, vr=0),
+        asdu=ASDUDescriptor(typeId=13, cause=3, ca=1, ioa=ioa, payload={"value": 1.5}),
+    )
+
+
+def bench_codec(quick: bool) -> Results:
+    count = 20_000 if quick else 200_000
+    asdu = _measurement(100)
+    frame = encode_i_frame(asdu, 0, 0)
+
+    def encode() -> float:
+        started = time.perf_counter()
+        for seq in range(count):
+            encode_i_frame(asdu, seq & 0x7FFF, 0)
+        return time.perf_counter() - started
+
+    def decode() -> float:
+        started = time.perf_counter()
+        for _ in range(count):
+            decode_apdu(frame)
+        return time.perf_counter() - started
+
+    return {
+        "codec.encode_i_frame": Metric(count / _best(encode, 3), "frames/s", "higher"),
+        "codec.decode_apdu": Metric(count / _best(decode, 3), "frames/s", "higher"),
+    }
+
+
+def bench_livebus(quick: bool) -> Results:
+    count = 10_000 if quick else 50_000
+    events = [_event(ioa) for ioa in range(count)]
+    results: Results = {}
+    for subscribers in (1, 10, 100) if quick else (1, 10, 100, 1000):
+        bus = LiveBus(capacity=count)
+        subscriptions = [bus.subscribe() for _ in range(subscribers)]
+        started = time.perf_counter()
+        for event in events:
+            bus.publish_nowait(event)
+        published = time.perf_counter() - started
+        started = time.perf_counter()
+        for subscription in subscriptions:
+            subscription.read_nowait()
+        drained = time.perf_counter() - started
+        results[f"livebus.publish_ns.{subscribers}_subscribers"] = Metric(
+            published / count * 1e9, "ns/event", "lower"
+        )
+        results[f"livebus.deliveries.{subscribers}_subscribers"] = Metric(
+            count * subscribers / drained, "events/s", "higher"
+        )
+    return results
+
+
+def bench_protocol_store(quick: bool) -> Results:
+    count = 2_000 if quick else 20_000
+    entries = [
+        ProtocolEntry(
+            timestamp=datetime.now(timezone.utc),
+            result="confirmed",
+            payload={"ca": 1, "ioa": ioa, "value": True, "latency_ms": 1.25},
+        )
+        for ioa in range(count)
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        store = ProtocolStore(Path(directory))
+        started = time.perf_counter()
+        for entry in entries:
+            store.append("single", entry)
+        appended = time.perf_counter() - started
+        started = time.perf_counter()
+        store.append_many("bulk", entries)
+        appended_many = time.perf_counter() - started
+        started = time.perf_counter()
+        read = sum(1 for _ in store.read("bulk"))
+        reading = time.perf_counter() - started
+        timeline = [
+            ProtocolEntry(
+                timestamp=START + timedelta(milliseconds=index), result="ok", payload={"n": index}
+            )
+            for index in range(count * 10)
+        ]
+        store.append_many("timeline", timeline)
+        since = timeline[-count // 100].timestamp
+        started = time.perf_counter()
+        tail = sum(1 for _ in store.read("timeline", since=since))
+        tail_read = time.perf_counter() - started
+        buffered = ProtocolStore(Path(directory), buffered=True)
+        started = time.perf_counter()
+        for entry in entries:
+            buffered.append("buffered", entry)
+        queued = time.perf_counter() - started
+        buffered.close()
+        binary = ProtocolStore(Path(directory) / "binary", record_format="binary")
+        started = time.perf_counter()
+        binary.append_many("bulk", entries)
+        binary_appended = time.perf_counter() - started
+        started = time.perf_counter()
+        binary_read = sum(1 for _ in binary.read("bulk"))
+        binary_reading = time.perf_counter() - started
+        binary.close()
+        jsonl_bytes = (Path(directory) / "bulk.jsonl").stat().st_size
+        binary_bytes = sum(path.stat().st_size for path in (Path(directory) / "binary").rglob("*"))
+    assert read == count and tail == count // 100 and binary_read == count
+    return {
+        "protocol_store.append": Metric(count / appended, "entries/s", "higher"),
+        "protocol_store.append_buffered_ns": Metric(queued / count * 1e9, "ns/entry", "lower"),
+        "protocol_store.append_many": Metric(count / appended_many, "entries/s", "higher"),
+        "protocol_store.read": Metric(count / reading, "entries/s", "higher"),
+        "protocol_store.read_tail_ms": Metric(tail_read * 1e3, "ms", "lower"),
+        "protocol_store.binary_append_many": Metric(count / binary_appended, "entries/s", "higher"),
+        "protocol_store.binary_read": Metric(count / binary_reading, "entries/s", "higher"),
+        "protocol_store.binary_bytes_per_entry": Metric(binary_bytes / count, "bytes", "lower"),
+        "protocol_store.jsonl_bytes_per_entry": Metric(jsonl_bytes / count, "bytes", "lower"),
+    }
+
+
+def _signal_list_upload(rows: int) -> SimpleNamespace:
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["IOA", "Bezeichnung", "Einheit"])
+    for ioa in range(rows):
+        sheet.append([ioa, f"Signal {ioa}", "kV"])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return SimpleNamespace(filename="signals.xlsx", file=io.BytesIO(buffer.getvalue()))
+
+
+def bench_signal_list(quick: bool) -> Results:
+    results: Results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in (1_000, 10_000) if quick else (1_000, 10_000, 50_000, 200_000):
+            upload = _signal_list_upload(rows)
+            started = time.perf_counter()
+            result = read_signal_list(upload, Path(directory) / f"signals-{rows}.xlsx")
+            elapsed = time.perf_counter() - started
+            assert len(result["records"]) == rows
+            results[f"signal_list.read.{rows}_rows"] = Metric(rows / elapsed, "rows/s", "higher")
+    return results
+
+
+async def _round_trips(commands: int, directory: Path) -> list[float]:
+    live_bus = LiveBus()
+    server = IEC104LibServerAdapterImpl(live_bus, transport="memory")
+
+    async def confirm(session: Any, asdu: Any) -> None:
+        asdu.header.cause = CauseOfTransmission.ACTIVATION_CON
+        await session.send_asdu(asdu)
+
+    server.set_handler(confirm)
+    await server.start("127.0.0.1", 2499)
+    client = IEC104LibClientAdapterImpl(live_bus, ProtocolStore(directory), transport="memory")
+    latencies = []
+    try:
+        await client.connect("127.0.0.1", 2499)
+        for index in range(commands):
+            started = time.perf_counter()
+            await client.send_single_command(1, index, True)
+            await client.recv_once(timeout=5)
+            latencies.append(time.perf_counter() - started)
+    finally:
+        await client.close()
+        await server.stop()
+    return latencies
+
+
+def bench_round_trip(quick: bool) -> Results:
+    commands = 500 if quick else 5_000
+    with tempfile.TemporaryDirectory() as directory:
+        latencies = sorted(asyncio.run(_round_trips(commands, Path(directory))))
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)]
+    return {
+        "round_trip.p50_us": Metric(statistics.median(latencies) * 1e6, "us", "lower"),
+        "round_trip.p99_us": Metric(p99 * 1e6, "us", "lower"),
+        "round_trip.rate": Metric(len(latencies) / sum(latencies), "commands/s", "higher"),
+    }
+
+
+BENCHMARKS: dict[str, Callable[[bool], Results]] = {
+    "codec": bench_codec,
+    "livebus": bench_livebus,
+    "protocol_store": bench_protocol_store,
+    "signal_list": bench_signal_list,
+    "round_trip": bench_round_trip,
+}
+
+
+def run(names: list[str], quick: bool) -> Results:
+    results: Results = {}
+    for name in names:
+        results.update(BENCHMARKS[name](quick))
+    return results
+
+
+def to_document(results: Results, quick: bool) -> dict[str, Any]:
+    return {
+        "version": FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "quick": quick,
+        "metrics": {name: metric.to_dict() for name, metric in sorted(results.items())},
+    }
+
+
+def load_baseline(path: Path, *, quick: bool) -> Results:
+    document = json.loads(path.read_text(encoding="utf-8"))
+    if document.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported baseline version in {path}")
+    if document.get("quick", False) != quick:
+        # Workload sizes differ, so rates are not comparable.
+        raise ValueError(f"Baseline {path} was recorded with quick={document.get('quick')}")
+    return {
+        name: Metric(float(data["value"]), data["unit"], data["better"])
+        for name, data in document["metrics"].items()
+    }
+
+
+def compare(baseline: Results, current: Results) -> list[Comparison]:
+    """Compare the metrics present in both result sets."""
+
+    comparisons = []
+    for name in sorted(baseline.keys() & current.keys()):
+        old, new = baseline[name].value, current[name].value
+        if old <= 0:
+            continue
+        change = (new - old) / old
+        regression = -change if baseline[name].better == "higher" else change
+        comparisons.append(Comparison(name, old, new, regression))
+    return comparisons
+
+
+def _report(results: Results, comparisons: list[Comparison], tolerance: float) -> list[str]:
+    by_name = {comparison.name: comparison for comparison in comparisons}
+    regressions = []
+    for name, metric in sorted(results.items()):
+        line = f"{name:<44} {metric.value:>14,.1f} {metric.unit:<10}"
+        comparison = by_name.get(name)
+        if comparison is not None:
+            flag = ""
+            if comparison.regression > tolerance:
+                flag = "  REGRESSION"
+                regressions.append(name)
+            line += f" {-comparison.regression:>+8.1%} vs {comparison.baseline:,.1f}{flag}"
+        print(line)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", help=f"comma separated subset of {', '.join(BENCHMARKS)}")
+    parser.add_argument("--quick", action="store_true", help="smaller workloads")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--output", type=Path, help="also write the results to this file")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    names = args.only.split(",") if args.only else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results = run(names, args.quick)
+    document = json.dumps(to_document(results, args.quick), indent=2) + "\n"
+    if args.output is not None:
+        args.output.write_text(document, encoding="utf-8")
+
+    comparisons: list[Comparison] = []
+    if not args.save_baseline and args.baseline.exists():
+        try:
+            comparisons = compare(load_baseline(args.baseline, quick=args.quick), results)
+        except ValueError as exc:
+            parser.error(str(exc))
+    regressions = _report(results, comparisons, args.tolerance)
+
+    if args.save_baseline:
+        args.baseline.write_text(document, encoding="utf-8")
+        print(f"baseline written to {args.baseline}")
+    elif not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --save-baseline to record one")
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""APCI framing."""
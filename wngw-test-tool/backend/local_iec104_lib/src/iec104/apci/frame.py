@@ -0,0 +1,53 @@
+"""APCI frame formats and control field decoding."""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+from typing import Optional
+
+from ..errors import FrameError
+
+# start byte, APDU length, first and second control field word.
+APCI = struct.Struct("<BBHH")
+
+
+class FrameFormat(Enum):
+    I = "I"  # noqa: E741 - protocol name
+    S = "S"
+    U = "U"
+
+
+class UFunction(IntEnum):
+    STARTDT_ACT = 0x07
+    STARTDT_CON = 0x0B
+    STOPDT_ACT = 0x13
+    STOPDT_CON = 0x23
+    TESTFR_ACT = 0x43
+    TESTFR_CON = 0x83
+
+
+@dataclass(slots=True, frozen=True)
+class APCIFrame:
+    format: FrameFormat
+    length: int
+    send_seq: int = 0
+    recv_seq: int = 0
+    u_function: Optional[UFunction] = None
+
+    @classmethod
+    def decode(cls, apci: memoryview | bytes) -> "APCIFrame":
+        _start, length, first, second = APCI.unpack_from(apci)
+        if not first & 0x01:
+            return cls(FrameFormat.I, length, first >> 1, second >> 1)
+        if first & 0x03 == 0x01:
+            return cls(FrameFormat.S, length, recv_seq=second >> 1)
+        try:
+            function = UFunction(first & 0xFF)
+        except ValueError as exc:
+            raise FrameError(f"Unknown U-frame function 0x{first & 0xFF:02X}") from exc
+        return cls(FrameFormat.U, length, u_function=function)
+
+
+__all__ = ["APCI", "APCIFrame", "FrameFormat", "UFunction"]
@@ -0,0 +1 @@
+"""ASDU data model."""
@@ -0,0 +1,78 @@
+"""ASDU data unit identifier."""
+
+from __future__ import annotations
+
+import struct
+from typing import Optional
+
+from ..spec.constants import CauseOfTransmission, TypeID
+
+# type id, variable structure qualifier, cause of transmission, originator
+# address, common address.
+HEADER = struct.Struct("<BBBBH")
+HEADER_SIZE = HEADER.size
+
+
+class ASDUHeader:
+    __slots__ = (
+        "type_id",
+        "sequence",
+        "vsq_number",
+        "cause",
+        "negative_confirm",
+        "test",
+        "originator_address",
+        "common_address",
+        "oa",
+    )
+
+    def __init__(
+        self,
+        *,
+        type_id: TypeID,
+        sequence: bool,
+        vsq_number: int,
+        cause: CauseOfTransmission,
+        negative_confirm: bool,
+        test: bool,
+        originator_address: int,
+        common_address: int,
+        oa: Optional[int],
+    ) -> None:
+        self.type_id = type_id
+        self.sequence = sequence
+        self.vsq_number = vsq_number
+        self.cause = cause
+        self.negative_confirm = negative_confirm
+        self.test = test
+        self.originator_address = originator_address
+        self.common_address = common_address
+        self.oa = oa
+
+    def pack_into(
+        self,
+        buffer: bytearray | memoryview,
+        offset: int,
+        count: int,
+        *,
+        sequence: Optional[bool] = None,
+    ) -> None:
+        if sequence is None:
+            sequence = self.sequence
+        cot = int(self.cause)
+        if self.negative_confirm:
+            cot |= 0x40
+        if self.test:
+            cot |= 0x80
+        HEADER.pack_into(
+            buffer,
+            offset,
+            int(self.type_id),
+            count | (0x80 if sequence else 0),
+            cot,
+            self.originator_address if self.oa is None else self.oa,
+            self.common_address,
+        )
+
+
+__all__ = ["ASDUHeader", "HEADER", "HEADER_SIZE"]
@@ -0,0 +1,20 @@
+"""Built-in ASDU types; importing this package registers their codecs."""
+
+from .c_sc_na_1 import SingleCommand, SingleCommandASDU
+from .common import ASDU, InformationObject
+from .m_me_nc_1 import MeasuredValueASDU, MeasuredValueFloat
+from .m_sp_na_1 import SinglePointASDU, SinglePointInformation
+from .m_sp_tb_1 import SinglePointTimeASDU, SinglePointWithCP56Time
+
+__all__ = [
+    "ASDU",
+    "InformationObject",
+    "MeasuredValueASDU",
+    "MeasuredValueFloat",
+    "SingleCommand",
+    "SingleCommandASDU",
+    "SinglePointASDU",
+    "SinglePointInformation",
+    "SinglePointTimeASDU",
+    "SinglePointWithCP56Time",
+]
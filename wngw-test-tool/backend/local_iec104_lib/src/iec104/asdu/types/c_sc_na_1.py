@@ -0,0 +1,47 @@
+"""C_SC_NA_1 - single command."""
+
+from __future__ import annotations
+
+from ...codec.registry import register_type
+from ...spec.constants import TypeID
+from .common import ASDU, ObjectCodec
+
+
+class SingleCommand:
+    __slots__ = ("ioa", "state", "qualifier", "select")
+
+    def __init__(self, *, ioa: int, state: bool, qualifier: int, select: bool = False) -> None:
+        self.ioa = ioa
+        self.state = state
+        self.qualifier = qualifier
+        self.select = select
+
+
+class SingleCommandASDU(ASDU[SingleCommand]):
+    __slots__ = ()
+
+
+class _SingleCommandCodec(ObjectCodec[SingleCommand]):
+    __slots__ = ()
+
+    def fields(self, obj: SingleCommand) -> tuple[int]:
+        sco = (obj.qualifier & 0x1F) << 2
+        if obj.state:
+            sco |= 0x01
+        if obj.select:
+            sco |= 0x80
+        return (sco,)
+
+    def build(self, ioa: int, fields: tuple[int]) -> SingleCommand:
+        sco = fields[0]
+        return SingleCommand(
+            ioa=ioa,
+            state=bool(sco & 0x01),
+            qualifier=(sco >> 2) & 0x1F,
+            select=bool(sco & 0x80),
+        )
+
+
+register_type(_SingleCommandCodec(TypeID.C_SC_NA_1, "B", SingleCommandASDU))
+
+__all__ = ["SingleCommand", "SingleCommandASDU"]
@@ -0,0 +1,89 @@
+"""Building blocks shared by all ASDU types."""
+
+from __future__ import annotations
+
+import struct
+from typing import Any, Generic, Iterable, Protocol, Sequence, TypeVar
+
+from ...spec.constants import TypeID
+from ..header import ASDUHeader
+
+# Information object address: low 16 bits followed by the high octet.
+IOA = struct.Struct("<HB")
+IOA_SIZE = IOA.size
+
+
+class InformationObject(Protocol):
+    ioa: int
+
+
+ObjectT = TypeVar("ObjectT", bound=InformationObject)
+
+
+class ASDU(Generic[ObjectT]):
+    __slots__ = ("header", "information_objects")
+
+    def __init__(self, *, header: ASDUHeader, information_objects: Iterable[ObjectT]) -> None:
+        self.header = header
+        self.information_objects = list(information_objects)
+
+
+class ObjectCodec(Generic[ObjectT]):
+    """Precompiled wire layout of one information object type.
+
+    ``element`` describes the octets following the IOA, ``addressed`` the same
+    octets prefixed by the IOA (SQ=0). Subclasses only translate between an
+    information object and the flat field tuple of ``element``; the encode and
+    decode loops in ``iec104.codec`` stay the same for every type. Types that
+    support bulk encoding from value/quality columns also override ``columns``;
+    time tagged types set ``time_offset`` to the CP56Time2a position in
+    ``element``.
+    """
+
+    __slots__ = (
+        "type_id",
+        "asdu_class",
+        "element",
+        "addressed",
+        "time_offset",
+        "_element_format",
+        "_runs",
+    )
+
+    def __init__(
+        self,
+        type_id: TypeID,
+        element_format: str,
+        asdu_class: type[ASDU[Any]],
+        *,
+        time_offset: int | None = None,
+    ) -> None:
+        self.type_id = type_id
+        self.asdu_class = asdu_class
+        self.time_offset = time_offset
+        self.element = struct.Struct("<" + element_format)
+        self.addressed = struct.Struct("<HB" + element_format)
+        self._element_format = element_format
+        self._runs: dict[int, struct.Struct] = {}
+
+    def fields(self, obj: ObjectT) -> tuple[Any, ...]:
+        raise NotImplementedError
+
+    def build(self, ioa: int, fields: tuple[Any, ...]) -> ObjectT:
+        raise NotImplementedError
+
+    def columns(self, values: Sequence[Any], qualities: Sequence[int] | None) -> Iterable[Any]:
+        """Return the element fields of all objects as one flat iterable."""
+
+        raise NotImplementedError(f"{self.type_id.name} has no column layout")
+
+    def run(self, count: int) -> struct.Struct:
+        """Struct packing ``count`` consecutive elements of an SQ=1 ASDU at once."""
+
+        layout = self._runs.get(count)
+        if layout is None:
+            layout = self._runs[count] = struct.Struct("<" + self._element_format * count)
+        return layout
+
+
+__all__ = ["ASDU", "IOA", "IOA_SIZE", "InformationObject", "ObjectCodec"]
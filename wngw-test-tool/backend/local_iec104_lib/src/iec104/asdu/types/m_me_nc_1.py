@@ -0,0 +1,43 @@
+"""M_ME_NC_1 - measured value, short floating point."""
+
+from __future__ import annotations
+
+from itertools import chain, repeat
+from typing import Iterable, Sequence
+
+from ...codec.registry import register_type
+from ...spec.constants import TypeID
+from .common import ASDU, ObjectCodec
+
+
+class MeasuredValueFloat:
+    __slots__ = ("ioa", "value", "quality")
+
+    def __init__(self, *, ioa: int, value: float, quality: int = 0) -> None:
+        self.ioa = ioa
+        self.value = value
+        self.quality = quality
+
+
+class MeasuredValueASDU(ASDU[MeasuredValueFloat]):
+    __slots__ = ()
+
+
+class _MeasuredValueCodec(ObjectCodec[MeasuredValueFloat]):
+    __slots__ = ()
+
+    def fields(self, obj: MeasuredValueFloat) -> tuple[float, int]:
+        return (obj.value, obj.quality)
+
+    def build(self, ioa: int, fields: tuple[float, int]) -> MeasuredValueFloat:
+        return MeasuredValueFloat(ioa=ioa, value=fields[0], quality=fields[1])
+
+    def columns(
+        self, values: Sequence[float], qualities: Sequence[int] | None
+    ) -> Iterable[float | int]:
+        return chain.from_iterable(zip(values, repeat(0) if qualities is None else qualities))
+
+
+register_type(_MeasuredValueCodec(TypeID.M_ME_NC_1, "fB", MeasuredValueASDU))
+
+__all__ = ["MeasuredValueASDU", "MeasuredValueFloat"]
@@ -0,0 +1,44 @@
+"""M_SP_NA_1 - single-point information."""
+
+from __future__ import annotations
+
+from itertools import repeat
+from typing import Iterable, Sequence
+
+from ...codec.registry import register_type
+from ...spec.constants import TypeID
+from .common import ASDU, ObjectCodec
+
+
+class SinglePointInformation:
+    __slots__ = ("ioa", "value", "quality")
+
+    def __init__(self, *, ioa: int, value: bool, quality: int = 0) -> None:
+        self.ioa = ioa
+        self.value = value
+        self.quality = quality
+
+
+class SinglePointASDU(ASDU[SinglePointInformation]):
+    __slots__ = ()
+
+
+class _SinglePointCodec(ObjectCodec[SinglePointInformation]):
+    __slots__ = ()
+
+    def fields(self, obj: SinglePointInformation) -> tuple[int]:
+        return (obj.quality & 0xFE | (1 if obj.value else 0),)
+
+    def build(self, ioa: int, fields: tuple[int]) -> SinglePointInformation:
+        siq = fields[0]
+        return SinglePointInformation(ioa=ioa, value=bool(siq & 0x01), quality=siq & 0xFE)
+
+    def columns(self, values: Sequence[object], qualities: Sequence[int] | None) -> Iterable[int]:
+        if qualities is None:
+            qualities = repeat(0)  # type: ignore[assignment]
+        return [q & 0xFE | (1 if v else 0) for v, q in zip(values, qualities)]
+
+
+register_type(_SinglePointCodec(TypeID.M_SP_NA_1, "B", SinglePointASDU))
+
+__all__ = ["SinglePointASDU", "SinglePointInformation"]
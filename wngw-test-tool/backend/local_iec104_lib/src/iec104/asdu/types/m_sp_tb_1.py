@@ -0,0 +1,45 @@
+"""M_SP_TB_1 - single-point information with CP56Time2a time tag."""
+
+from __future__ import annotations
+
+from ...codec.registry import register_type
+from ...spec.constants import TypeID
+from ...spec.time import CP56Time2a
+from .common import ASDU, ObjectCodec
+
+
+class SinglePointWithCP56Time:
+    __slots__ = ("ioa", "value", "quality", "timestamp")
+
+    def __init__(self, *, ioa: int, value: bool, timestamp: CP56Time2a, quality: int = 0) -> None:
+        self.ioa = ioa
+        self.value = value
+        self.quality = quality
+        self.timestamp = timestamp
+
+
+class SinglePointTimeASDU(ASDU[SinglePointWithCP56Time]):
+    __slots__ = ()
+
+
+class _SinglePointTimeCodec(ObjectCodec[SinglePointWithCP56Time]):
+    __slots__ = ()
+
+    def fields(self, obj: SinglePointWithCP56Time) -> tuple[int, ...]:
+        return (obj.quality & 0xFE | (1 if obj.value else 0),) + obj.timestamp.fields()
+
+    def build(self, ioa: int, fields: tuple[int, ...]) -> SinglePointWithCP56Time:
+        siq = fields[0]
+        return SinglePointWithCP56Time(
+            ioa=ioa,
+            value=bool(siq & 0x01),
+            quality=siq & 0xFE,
+            timestamp=CP56Time2a.from_fields(*fields[1:]),
+        )
+
+
+register_type(
+    _SinglePointTimeCodec(TypeID.M_SP_TB_1, "BHBBBBB", SinglePointTimeASDU, time_offset=1)
+)
+
+__all__ = ["SinglePointTimeASDU", "SinglePointWithCP56Time"]
@@ -0,0 +1 @@
+"""APDU and ASDU encoding and decoding."""
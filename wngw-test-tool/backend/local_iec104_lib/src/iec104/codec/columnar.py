@@ -0,0 +1,102 @@
+"""Columnar NumPy decoding of measured value ASDUs.
+
+NumPy is an optional dependency; it is imported when a columnar function is
+first called.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable
+
+from ..asdu.header import HEADER, HEADER_SIZE
+from ..asdu.types.common import IOA, IOA_SIZE
+from ..errors import DecodeError, UnsupportedTypeError
+from ..spec.constants import TypeID
+from ..utils.buffers import BytesLike, as_byte_view
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import numpy as np
+
+
+@lru_cache(maxsize=1)
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ImportError("Columnar decoding requires the optional 'numpy' package") from exc
+    return numpy
+
+
+@lru_cache(maxsize=1)
+def _dtypes() -> tuple["np.dtype[Any]", "np.dtype[Any]", "np.dtype[Any]"]:
+    numpy = _numpy()
+    columns = numpy.dtype([("ioa", "<u4"), ("value", "<f4"), ("quality", "u1")])
+    # Packed wire layouts: IOA + IEEE STD 754 float + QDS (SQ=0) and float + QDS (SQ=1).
+    addressed = numpy.dtype(
+        [("ioa_low", "<u2"), ("ioa_high", "u1"), ("value", "<f4"), ("quality", "u1")]
+    )
+    element = numpy.dtype([("value", "<f4"), ("quality", "u1")])
+    return columns, addressed, element
+
+
+def measured_value_dtype() -> "np.dtype[Any]":
+    """Structured dtype ``(ioa uint32, value float32, quality uint8)``."""
+
+    return _dtypes()[0]
+
+
+def decode_measured_columns(asdus: Iterable[BytesLike]) -> "np.ndarray[Any, Any]":
+    """Decode a run of M_ME_NC_1 ASDUs into one structured array.
+
+    Each ASDU is viewed in place with ``numpy.frombuffer`` and copied column
+    by column into the result; no per-object Python objects are created. SQ=0
+    and SQ=1 ASDUs may be mixed.
+    """
+
+    numpy = _numpy()
+    columns, addressed, element = _dtypes()
+    parsed: list[tuple[memoryview, bool, int]] = []
+    total = 0
+    for data in asdus:
+        view = as_byte_view(data)
+        if len(view) < HEADER_SIZE:
+            raise DecodeError(f"ASDU too short: {len(view)} octets")
+        type_id, vsq, _cot, _oa, _ca = HEADER.unpack_from(view)
+        if type_id != TypeID.M_ME_NC_1:
+            raise UnsupportedTypeError(f"Expected M_ME_NC_1, got type id {type_id}")
+        sequence = bool(vsq & 0x80)
+        count = vsq & 0x7F
+        if sequence:
+            expected = HEADER_SIZE + IOA_SIZE + count * element.itemsize
+        else:
+            expected = HEADER_SIZE + count * addressed.itemsize
+        if len(view) != expected:
+            raise DecodeError(f"ASDU length {len(view)} does not match {count} objects")
+        parsed.append((view, sequence, count))
+        total += count
+
+    result = numpy.empty(total, dtype=columns)
+    ioa_column = result["ioa"]
+    value_column = result["value"]
+    quality_column = result["quality"]
+    position = 0
+    for view, sequence, count in parsed:
+        end = position + count
+        if sequence:
+            low, high = IOA.unpack_from(view, HEADER_SIZE)
+            first = low | high << 16
+            raw = numpy.frombuffer(view, element, count, HEADER_SIZE + IOA_SIZE)
+            ioa_column[position:end] = numpy.arange(first, first + count, dtype="<u4")
+        else:
+            raw = numpy.frombuffer(view, addressed, count, HEADER_SIZE)
+            ioa = ioa_column[position:end]
+            numpy.left_shift(raw["ioa_high"], 16, out=ioa, dtype="<u4")
+            ioa |= raw["ioa_low"]
+        value_column[position:end] = raw["value"]
+        quality_column[position:end] = raw["quality"]
+        position = end
+    return result
+
+
+__all__ = ["decode_measured_columns", "measured_value_dtype"]
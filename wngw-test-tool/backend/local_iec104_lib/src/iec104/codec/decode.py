@@ -0,0 +1,224 @@
+"""APDU decoding."""
+
+from __future__ import annotations
+
+import struct
+from array import array
+from typing import Any, Optional
+
+from ..apci.frame import APCIFrame, FrameFormat
+from ..asdu import types as _builtin_types  # noqa: F401 - registers the built-in codecs
+from ..asdu.header import HEADER, HEADER_SIZE, ASDUHeader
+from ..asdu.types.common import ASDU, IOA, IOA_SIZE
+from ..errors import DecodeError, FrameError, UnsupportedTypeError
+from ..spec.constants import (
+    APCI_LENGTH,
+    CONTROL_FIELD_LENGTH,
+    MAX_APDU_LENGTH,
+    MAX_FRAME_LENGTH,
+    START_BYTE,
+    CauseOfTransmission,
+)
+from ..spec.time import decode_epoch_ms
+from ..utils.buffers import BoundedBuffer, BytesLike, as_byte_view
+from .registry import get_codec, register_type
+
+RawFrame = tuple[memoryview, Optional[memoryview]]
+
+
+def _frame_length(length: int) -> int:
+    if length < CONTROL_FIELD_LENGTH or length > MAX_APDU_LENGTH:
+        raise FrameError(f"Invalid APDU length {length}")
+    return length + 2
+
+
+def _split(frame: memoryview) -> RawFrame:
+    if len(frame) > APCI_LENGTH:
+        return frame[:APCI_LENGTH], frame[APCI_LENGTH:]
+    return frame, None
+
+
+class StreamingAPDUDecoder:
+    """Split a TCP byte stream into APCI/ASDU views.
+
+    ``feed`` returns one ``(apci, asdu)`` pair per completed APDU. ``apci`` is a
+    view on the six APCI octets and ``asdu`` a view on the ASDU octets, or
+    ``None`` for S- and U-frames. Frames that arrive completely inside one chunk
+    are sliced straight out of the caller's buffer; only the bytes of a frame
+    that is split across chunks are carried over in a fixed-capacity
+    ``BoundedBuffer``. The views stay valid until the next ``feed`` or ``clear``
+    call and as long as the caller does not modify the buffer it passed in.
+    """
+
+    __slots__ = ("_pending",)
+
+    def __init__(self, capacity: int = MAX_FRAME_LENGTH * 2) -> None:
+        # A completed carried frame stays buffered while the next partial frame
+        # is written behind it, so two maximum-size frames must fit.
+        if capacity < MAX_FRAME_LENGTH * 2:
+            raise ValueError(f"capacity must be at least {MAX_FRAME_LENGTH * 2} bytes")
+        self._pending = BoundedBuffer(capacity)
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered bytes belonging to an incomplete frame."""
+
+        return len(self._pending)
+
+    def feed(self, data: BytesLike) -> list[RawFrame]:
+        view = as_byte_view(data)
+        frames: list[RawFrame] = []
+        carried = 0
+        if len(self._pending):
+            carried, view = self._complete_pending(view, frames)
+
+        size = len(view)
+        offset = 0
+        while size - offset >= 2:
+            if view[offset] != START_BYTE:
+                raise FrameError(f"Unexpected start byte 0x{view[offset]:02X}")
+            end = offset + _frame_length(view[offset + 1])
+            if end > size:
+                break
+            frames.append(_split(view[offset:end]))
+            offset = end
+        if offset < size:
+            if offset == size - 1 and view[offset] != START_BYTE:
+                raise FrameError(f"Unexpected start byte 0x{view[offset]:02X}")
+            self._pending.write(view[offset:])
+        if carried:
+            # Released only now so the tail written above cannot overwrite the
+            # carried frame returned to the caller.
+            self._pending.consume(carried)
+        return frames
+
+    def clear(self) -> None:
+        self._pending.clear()
+
+    def _complete_pending(self, view: memoryview, frames: list[RawFrame]) -> tuple[int, memoryview]:
+        pending = self._pending
+        if len(pending) == 1:
+            if not len(view):
+                return 0, view
+            pending.write(view[:1])
+            view = view[1:]
+        total = _frame_length(pending.peek(1))
+        missing = total - len(pending)
+        if len(view) < missing:
+            pending.write(view)
+            return 0, view[len(view) :]
+        pending.write(view[:missing])
+        frames.append(_split(pending.view(total)))
+        return total, view[missing:]
+
+
+def decode_asdu(view: BytesLike, *, with_oa: bool = False) -> ASDU[Any]:
+    """Decode one ASDU using the codec registered for its type identification."""
+
+    view = as_byte_view(view)
+    size = len(view)
+    if size < HEADER_SIZE:
+        raise DecodeError(f"ASDU too short: {size} octets")
+    type_id, vsq, cot, originator, common_address = HEADER.unpack_from(view)
+    codec = get_codec(type_id)
+    sequence = bool(vsq & 0x80)
+    count = vsq & 0x7F
+    header = ASDUHeader(
+        type_id=codec.type_id,
+        sequence=sequence,
+        vsq_number=count,
+        cause=CauseOfTransmission(cot & 0x3F),
+        negative_confirm=bool(cot & 0x40),
+        test=bool(cot & 0x80),
+        originator_address=originator,
+        common_address=common_address,
+        oa=originator if with_oa else None,
+    )
+
+    build = codec.build
+    if sequence:
+        element = codec.element
+        end = HEADER_SIZE + IOA_SIZE + count * element.size
+        if size != end:
+            raise DecodeError(f"ASDU length {size} does not match {count} objects")
+        low, high = IOA.unpack_from(view, HEADER_SIZE)
+        first = low | high << 16
+        body = view[HEADER_SIZE + IOA_SIZE : end]
+        objects = [
+            build(first + index, fields) for index, fields in enumerate(element.iter_unpack(body))
+        ]
+    else:
+        addressed = codec.addressed
+        end = HEADER_SIZE + count * addressed.size
+        if size != end:
+            raise DecodeError(f"ASDU length {size} does not match {count} objects")
+        objects = [
+            build(record[0] | record[1] << 16, record[2:])
+            for record in addressed.iter_unpack(view[HEADER_SIZE:end])
+        ]
+    return codec.asdu_class(header=header, information_objects=objects)
+
+
+def decode_timestamps(view: BytesLike) -> array[int]:
+    """Return the time tags of a time tagged ASDU as UTC epoch milliseconds.
+
+    No information objects or ``datetime`` instances are created, which makes
+    this suitable for ordering and delta computations over whole ASDUs.
+    """
+
+    view = as_byte_view(view)
+    if len(view) < HEADER_SIZE:
+        raise DecodeError(f"ASDU too short: {len(view)} octets")
+    type_id, vsq, _cot, _oa, _ca = HEADER.unpack_from(view)
+    codec = get_codec(type_id)
+    if codec.time_offset is None:
+        raise UnsupportedTypeError(f"{codec.type_id.name} carries no time tag")
+    count = vsq & 0x7F
+    if vsq & 0x80:
+        stride = codec.element.size
+        end = HEADER_SIZE + IOA_SIZE + count * stride
+    else:
+        stride = codec.addressed.size
+        end = HEADER_SIZE + count * stride
+    if len(view) != end:
+        raise DecodeError(f"ASDU length {len(view)} does not match {count} objects")
+    start = HEADER_SIZE + IOA_SIZE + codec.time_offset
+    stamps = array("q", bytes(8 * count))
+    for index, offset in enumerate(range(start, start + count * stride, stride)):
+        stamps[index] = decode_epoch_ms(view, offset)
+    return stamps
+
+
+def decode_apdu(
+    data: BytesLike, *, with_oa: bool = False
+) -> tuple[APCIFrame, Optional[ASDU[Any]], int]:
+    """Decode the first APDU in ``data``; returns the frame, its ASDU and octets used."""
+
+    view = as_byte_view(data)
+    if len(view) < APCI_LENGTH:
+        raise FrameError(f"APDU too short: {len(view)} octets")
+    if view[0] != START_BYTE:
+        raise FrameError(f"Unexpected start byte 0x{view[0]:02X}")
+    total = _frame_length(view[1])
+    if len(view) < total:
+        raise FrameError(f"APDU truncated: {len(view)} of {total} octets")
+    try:
+        frame = APCIFrame.decode(view)
+    except struct.error as exc:
+        raise FrameError(str(exc)) from exc
+    asdu = None
+    if frame.format is FrameFormat.I:
+        asdu = decode_asdu(view[APCI_LENGTH:total], with_oa=with_oa)
+    elif total != APCI_LENGTH:
+        raise FrameError(f"{frame.format.value}-frame must not carry an ASDU")
+    return frame, asdu, total
+
+
+__all__ = [
+    "RawFrame",
+    "StreamingAPDUDecoder",
+    "decode_apdu",
+    "decode_asdu",
+    "decode_timestamps",
+    "register_type",
+]
@@ -0,0 +1,237 @@
+"""ASDU encoding."""
+
+from __future__ import annotations
+
+import struct
+from typing import Any, Sequence
+
+from ..apci.frame import APCI, UFunction
+from ..asdu import types as _builtin_types  # noqa: F401 - registers the built-in codecs
+from ..asdu.header import HEADER_SIZE, ASDUHeader
+from ..asdu.types.common import ASDU, IOA, IOA_SIZE
+from ..errors import LengthError
+from ..spec.constants import (
+    APCI_LENGTH,
+    CONTROL_FIELD_LENGTH,
+    MAX_ASDU_LENGTH,
+    MAX_INFORMATION_OBJECTS,
+    SEQUENCE_MODULO,
+    START_BYTE,
+)
+from ..utils.buffers import BytesLike
+from .registry import get_codec, register_type
+
+
+def encoded_size(asdu: ASDU[Any]) -> int:
+    """Number of octets ``encode_asdu_into`` writes for ``asdu``."""
+
+    codec = get_codec(asdu.header.type_id)
+    count = len(asdu.information_objects)
+    if asdu.header.sequence:
+        return HEADER_SIZE + IOA_SIZE + count * codec.element.size
+    return HEADER_SIZE + count * codec.addressed.size
+
+
+def encode_asdu_into(buffer: bytearray | memoryview, offset: int, asdu: ASDU[Any]) -> int:
+    """Encode ``asdu`` into ``buffer`` at ``offset`` and return the octet count.
+
+    Information objects are packed directly into ``buffer`` with the codec's
+    precompiled structs; no intermediate bytes are created per object.
+    """
+
+    header = asdu.header
+    codec = get_codec(header.type_id)
+    objects = asdu.information_objects
+    count = len(objects)
+    if not 0 < count <= MAX_INFORMATION_OBJECTS:
+        raise LengthError(f"ASDU must carry 1-{MAX_INFORMATION_OBJECTS} objects, got {count}")
+    fields = codec.fields
+    try:
+        header.pack_into(buffer, offset, count)
+        position = offset + HEADER_SIZE
+        if header.sequence:
+            first = objects[0].ioa
+            IOA.pack_into(buffer, position, first & 0xFFFF, first >> 16)
+            position += IOA_SIZE
+            pack = codec.element.pack_into
+            step = codec.element.size
+            for obj in objects:
+                pack(buffer, position, *fields(obj))
+                position += step
+        else:
+            pack = codec.addressed.pack_into
+            step = codec.addressed.size
+            for obj in objects:
+                ioa = obj.ioa
+                pack(buffer, position, ioa & 0xFFFF, ioa >> 16, *fields(obj))
+                position += step
+    except struct.error as exc:
+        raise ValueError(f"Cannot encode {header.type_id!r}: {exc}") from exc
+    return position - offset
+
+
+def encode_asdu(asdu: ASDU[Any]) -> bytes:
+    size = encoded_size(asdu)
+    if size > MAX_ASDU_LENGTH:
+        raise LengthError(f"Encoded ASDU has {size} octets, at most {MAX_ASDU_LENGTH} allowed")
+    buffer = bytearray(size)
+    encode_asdu_into(buffer, 0, asdu)
+    return bytes(buffer)
+
+
+def encode_sequence_into(
+    buffer: bytearray | memoryview,
+    offset: int,
+    header: ASDUHeader,
+    ioa_start: int,
+    values: Sequence[Any],
+    qualities: Sequence[int] | None = None,
+) -> int:
+    """Pack an SQ=1 ASDU from value/quality columns in a single struct call.
+
+    ``values`` and ``qualities`` may be lists, ``array.array`` or NumPy arrays;
+    objects are addressed ``ioa_start``, ``ioa_start + 1``, ... The sequence flag
+    and object count of ``header`` are taken from the call, not from ``header``.
+    """
+
+    codec = get_codec(header.type_id)
+    if hasattr(values, "tolist"):
+        values = values.tolist()
+    if qualities is not None and hasattr(qualities, "tolist"):
+        qualities = qualities.tolist()
+    count = len(values)
+    if not 0 < count <= MAX_INFORMATION_OBJECTS:
+        raise LengthError(f"ASDU must carry 1-{MAX_INFORMATION_OBJECTS} objects, got {count}")
+    if qualities is not None and len(qualities) != count:
+        raise ValueError("values and qualities must have the same length")
+    layout = codec.run(count)
+    try:
+        header.pack_into(buffer, offset, count, sequence=True)
+        position = offset + HEADER_SIZE
+        IOA.pack_into(buffer, position, ioa_start & 0xFFFF, ioa_start >> 16)
+        layout.pack_into(buffer, position + IOA_SIZE, *codec.columns(values, qualities))
+    except struct.error as exc:
+        raise ValueError(f"Cannot encode {header.type_id!r}: {exc}") from exc
+    return HEADER_SIZE + IOA_SIZE + layout.size
+
+
+def encode_sequence(
+    header: ASDUHeader,
+    ioa_start: int,
+    values: Sequence[Any],
+    qualities: Sequence[int] | None = None,
+) -> bytes:
+    codec = get_codec(header.type_id)
+    size = HEADER_SIZE + IOA_SIZE + len(values) * codec.element.size
+    if size > MAX_ASDU_LENGTH:
+        raise LengthError(f"Encoded ASDU has {size} octets, at most {MAX_ASDU_LENGTH} allowed")
+    buffer = bytearray(size)
+    encode_sequence_into(buffer, 0, header, ioa_start, values, qualities)
+    return bytes(buffer)
+
+
+def _check_sequence(value: int, name: str) -> None:
+    if not 0 <= value < SEQUENCE_MODULO:
+        raise ValueError(f"{name} must be a 15-bit sequence number, got {value}")
+
+
+def build_i_frame(asdu_bytes: BytesLike, send_seq: int, recv_seq: int) -> bytes:
+    _check_sequence(send_seq, "send_seq")
+    _check_sequence(recv_seq, "recv_seq")
+    size = len(asdu_bytes)
+    if size > MAX_ASDU_LENGTH:
+        raise LengthError(f"ASDU has {size} octets, at most {MAX_ASDU_LENGTH} allowed")
+    frame = bytearray(APCI_LENGTH + size)
+    APCI.pack_into(frame, 0, START_BYTE, size + CONTROL_FIELD_LENGTH, send_seq << 1, recv_seq << 1)
+    frame[APCI_LENGTH:] = asdu_bytes
+    return bytes(frame)
+
+
+def build_i_frames(
+    asdus: Sequence[BytesLike], send_seq: int, recv_seq: int
+) -> tuple[bytearray, int]:
+    """Frame every ASDU of ``asdus`` as consecutive I-frames in one buffer.
+
+    Send sequence numbers start at ``send_seq`` and wrap modulo 2**15. Returns
+    the buffer and the send sequence number following the last frame.
+    """
+
+    _check_sequence(send_seq, "send_seq")
+    _check_sequence(recv_seq, "recv_seq")
+    sizes = [len(asdu) for asdu in asdus]
+    if sizes and max(sizes) > MAX_ASDU_LENGTH:
+        raise LengthError(f"ASDU has {max(sizes)} octets, at most {MAX_ASDU_LENGTH} allowed")
+    buffer = bytearray(sum(sizes) + APCI_LENGTH * len(sizes))
+    pack = APCI.pack_into
+    received = recv_seq << 1
+    position = 0
+    for asdu, size in zip(asdus, sizes):
+        pack(buffer, position, START_BYTE, size + CONTROL_FIELD_LENGTH, send_seq << 1, received)
+        position += APCI_LENGTH
+        buffer[position : position + size] = asdu
+        position += size
+        send_seq = (send_seq + 1) % SEQUENCE_MODULO
+    return buffer, send_seq
+
+
+def encode_i_frame(asdu: ASDU[Any], send_seq: int, recv_seq: int) -> bytes:
+    """Encode ``asdu`` and its APCI into one buffer without an intermediate copy."""
+
+    _check_sequence(send_seq, "send_seq")
+    _check_sequence(recv_seq, "recv_seq")
+    size = encoded_size(asdu)
+    if size > MAX_ASDU_LENGTH:
+        raise LengthError(f"Encoded ASDU has {size} octets, at most {MAX_ASDU_LENGTH} allowed")
+    frame = bytearray(APCI_LENGTH + size)
+    APCI.pack_into(frame, 0, START_BYTE, size + CONTROL_FIELD_LENGTH, send_seq << 1, recv_seq << 1)
+    encode_asdu_into(frame, APCI_LENGTH, asdu)
+    return bytes(frame)
+
+
+_ZEROS = memoryview(bytes(APCI_LENGTH + MAX_ASDU_LENGTH))
+
+
+def append_i_frame(buffer: bytearray, asdu: ASDU[Any], send_seq: int, recv_seq: int) -> int:
+    """Encode ``asdu`` as I-frame at the end of ``buffer``; returns the frame size."""
+
+    _check_sequence(send_seq, "send_seq")
+    _check_sequence(recv_seq, "recv_seq")
+    size = encoded_size(asdu)
+    if size > MAX_ASDU_LENGTH:
+        raise LengthError(f"Encoded ASDU has {size} octets, at most {MAX_ASDU_LENGTH} allowed")
+    offset = len(buffer)
+    buffer += _ZEROS[: APCI_LENGTH + size]
+    try:
+        APCI.pack_into(
+            buffer, offset, START_BYTE, size + CONTROL_FIELD_LENGTH, send_seq << 1, recv_seq << 1
+        )
+        encode_asdu_into(buffer, offset + APCI_LENGTH, asdu)
+    except Exception:
+        del buffer[offset:]
+        raise
+    return APCI_LENGTH + size
+
+
+def build_s_frame(recv_seq: int) -> bytes:
+    _check_sequence(recv_seq, "recv_seq")
+    return APCI.pack(START_BYTE, CONTROL_FIELD_LENGTH, 0x01, recv_seq << 1)
+
+
+def build_u_frame(function: UFunction) -> bytes:
+    return APCI.pack(START_BYTE, CONTROL_FIELD_LENGTH, int(function), 0)
+
+
+__all__ = [
+    "append_i_frame",
+    "build_i_frame",
+    "build_i_frames",
+    "build_s_frame",
+    "build_u_frame",
+    "encode_i_frame",
+    "encode_asdu",
+    "encode_asdu_into",
+    "encode_sequence",
+    "encode_sequence_into",
+    "encoded_size",
+    "register_type",
+]
@@ -0,0 +1,31 @@
+"""Registry of information object codecs keyed by type identification."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ..asdu.types.common import ObjectCodec
+from ..errors import UnsupportedTypeError
+
+_CODECS: dict[int, ObjectCodec[Any]] = {}
+
+
+def register_type(codec: ObjectCodec[Any]) -> ObjectCodec[Any]:
+    """Register ``codec`` for its type identification, replacing earlier entries."""
+
+    _CODECS[int(codec.type_id)] = codec
+    return codec
+
+
+def get_codec(type_id: int) -> ObjectCodec[Any]:
+    try:
+        return _CODECS[type_id]
+    except KeyError:
+        raise UnsupportedTypeError(f"No codec registered for type id {type_id}") from None
+
+
+def registered_types() -> tuple[int, ...]:
+    return tuple(sorted(_CODECS))
+
+
+__all__ = ["get_codec", "register_type", "registered_types"]
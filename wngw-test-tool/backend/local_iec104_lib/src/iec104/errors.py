@@ -0,0 +1,47 @@
+"""Exception hierarchy of the IEC-104 library."""
+
+from __future__ import annotations
+
+
+class IEC104Error(Exception):
+    """Base class for all IEC-104 errors."""
+
+
+class FrameError(IEC104Error):
+    """Raised when an APDU does not follow the APCI framing rules."""
+
+
+class LengthError(IEC104Error):
+    """Raised when a length field or a bounded buffer limit is violated."""
+
+
+class DecodeError(IEC104Error):
+    """Raised when ASDU octets cannot be decoded."""
+
+
+class UnsupportedTypeError(IEC104Error):
+    """Raised for ASDU type identifications without a registered codec."""
+
+
+class SequenceError(IEC104Error):
+    """Raised when a received I-frame carries an unexpected sequence number."""
+
+
+class HandshakeError(IEC104Error):
+    """Raised when STARTDT is not confirmed within T0."""
+
+
+class SessionClosedError(IEC104Error):
+    """Raised when sending or receiving on a closed session."""
+
+
+__all__ = [
+    "IEC104Error",
+    "FrameError",
+    "LengthError",
+    "DecodeError",
+    "UnsupportedTypeError",
+    "SequenceError",
+    "HandshakeError",
+    "SessionClosedError",
+]
@@ -0,0 +1 @@
+"""Sessions and transports."""
@@ -0,0 +1,46 @@
+"""In-process transport connecting two sessions without sockets."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ..apci.frame import UFunction
+from .session import IEC104Session
+
+
+class MemoryLink:
+    """Hands frames of one session directly to its peer session."""
+
+    __slots__ = ("_peer", "_closed")
+
+    def __init__(self, peer: IEC104Session) -> None:
+        self._peer = peer
+        self._closed = False
+
+    def send_i(self, asdu: Any, send_seq: int, recv_seq: int) -> None:
+        if not self._closed:
+            self._peer.handle_i_frame(asdu, send_seq, recv_seq)
+
+    def send_s(self, recv_seq: int) -> None:
+        if not self._closed:
+            self._peer.handle_s_frame(recv_seq)
+
+    def send_u(self, function: UFunction) -> None:
+        if not self._closed:
+            self._peer.handle_u_frame(function)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._peer.connection_lost(None)
+
+
+def connect_pair(client: IEC104Session, server: IEC104Session) -> None:
+    client.attach(MemoryLink(server))
+    server.attach(MemoryLink(client))
+
+
+__all__ = ["MemoryLink", "connect_pair"]
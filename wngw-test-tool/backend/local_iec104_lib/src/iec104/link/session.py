@@ -0,0 +1,309 @@
+"""IEC-104 session state shared by all transports."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, replace
+from typing import Any, Optional, Protocol
+
+from ..apci.frame import UFunction
+from ..errors import HandshakeError, SequenceError, SessionClosedError
+from ..spec.constants import SEQUENCE_MODULO
+
+logger = logging.getLogger(__name__)
+
+_CLOSED = object()
+
+
+@dataclass(slots=True)
+class SessionParameters:
+    originator_address: int = 0
+    k: int = 12
+    w: int = 8
+    t0: float = 30.0
+    t1: float = 15.0
+    t2: float = 10.0
+    # Received ASDUs queued for ``recv`` before acknowledgements are withheld;
+    # 0 disables the limit.
+    max_pending_rx: int = 0
+
+    def __post_init__(self) -> None:
+        if not 0 < self.k < SEQUENCE_MODULO:
+            raise ValueError(f"k must be between 1 and {SEQUENCE_MODULO - 1}")
+        if not 0 < self.w <= self.k:
+            raise ValueError("w must be between 1 and k")
+        if self.max_pending_rx < 0:
+            raise ValueError("max_pending_rx must not be negative")
+
+    def with_oa(self, oa: int) -> "SessionParameters":
+        return replace(self, originator_address=oa)
+
+
+@dataclass(slots=True)
+class SessionStats:
+    i_frames_sent: int = 0
+    i_frames_received: int = 0
+    s_frames_sent: int = 0
+
+
+class FrameLink(Protocol):
+    """Outgoing side of a transport as seen by ``IEC104Session``."""
+
+    def send_i(self, asdu: Any, send_seq: int, recv_seq: int) -> None: ...
+
+    def send_s(self, recv_seq: int) -> None: ...
+
+    def send_u(self, function: UFunction) -> None: ...
+
+    def flush(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class IEC104Session:
+    """Sequence numbering, k/w window and U-frame handling on top of a ``FrameLink``.
+
+    Transports call ``handle_i_frame``, ``handle_s_frame``, ``handle_u_frame``
+    and ``connection_lost`` for incoming traffic; received ASDUs are queued for
+    ``recv``. ``send_asdu`` blocks while ``k`` I-frames are unacknowledged.
+    Received I-frames are acknowledged once ``w`` of them are pending or ``t2``
+    expired, unless an outgoing I-frame acknowledges them first. While
+    ``max_pending_rx`` ASDUs wait for ``recv`` no acknowledgements are sent,
+    so the peer stops after ``k`` frames until the consumer catches up.
+    ``test_link`` probes a quiet connection with TESTFR.
+    """
+
+    def __init__(self, role: str, params: SessionParameters | None = None) -> None:
+        self.role = role
+        self.params = params or SessionParameters()
+        self.stats = SessionStats()
+        self._rx: asyncio.Queue[Any] = asyncio.Queue()
+        self._link: Optional[FrameLink] = None
+        self._send_seq = 0
+        self._peer_ack = 0
+        self._window_open = asyncio.Event()
+        self._window_open.set()
+        self._recv_seq = 0
+        self._sent_ack = 0
+        self._t2_handle: Optional[asyncio.TimerHandle] = None
+        self._ack_withheld = False
+        self._started: Optional[asyncio.Future[None]] = None
+        self._tested: Optional[asyncio.Future[None]] = None
+        self._closed = False
+
+    @property
+    def unacknowledged(self) -> int:
+        """Sent I-frames not yet acknowledged by the peer."""
+
+        return (self._send_seq - self._peer_ack) % SEQUENCE_MODULO
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def attach(self, link: FrameLink) -> None:
+        self._link = link
+
+    async def start(self) -> None:
+        """Activate data transfer with STARTDT and wait for the confirmation."""
+
+        link = self._require_link()
+        self._started = asyncio.get_running_loop().create_future()
+        link.send_u(UFunction.STARTDT_ACT)
+        try:
+            await asyncio.wait_for(self._started, timeout=self.params.t0)
+        except asyncio.TimeoutError as exc:
+            await self.close()
+            raise HandshakeError(f"STARTDT not confirmed within {self.params.t0} s") from exc
+
+    async def test_link(self) -> bool:
+        """Send TESTFR and wait ``t1`` seconds for the confirmation.
+
+        A missing confirmation closes the session, as on t1 expiry in the
+        standard. Returns whether the peer answered.
+        """
+
+        if self._closed:
+            return False
+        link = self._require_link()
+        if self._tested is None or self._tested.done():
+            # Created before sending: an in-memory peer confirms synchronously.
+            self._tested = asyncio.get_running_loop().create_future()
+            link.send_u(UFunction.TESTFR_ACT)
+            link.flush()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._tested), timeout=self.params.t1)
+        except asyncio.TimeoutError:
+            logger.warning("test frame not confirmed", extra={"role": self.role})
+            await self.close()
+            return False
+        except SessionClosedError:
+            return False
+        return True
+
+    async def send_asdu(self, asdu: Any, *, flush: bool = False) -> None:
+        """Queue ``asdu`` as I-frame.
+
+        Links may cork frames until the end of the current loop iteration;
+        ``flush=True`` writes immediately for latency sensitive commands.
+        """
+
+        while self.unacknowledged >= self.params.k:
+            self._require_link()
+            self._window_open.clear()
+            await self._window_open.wait()
+        link = self._require_link()
+        send_seq = self._send_seq
+        # State is updated first: an in-memory peer may acknowledge synchronously.
+        self._send_seq = (send_seq + 1) % SEQUENCE_MODULO
+        self.stats.i_frames_sent += 1
+        self._receipts_acknowledged()
+        link.send_i(asdu, send_seq, self._recv_seq)
+        if flush:
+            link.flush()
+
+    async def recv(self) -> Any:
+        if self._closed and self._rx.empty():
+            raise SessionClosedError("Session is closed")
+        item = await self._rx.get()
+        if item is _CLOSED:
+            self._rx.put_nowait(_CLOSED)
+            raise SessionClosedError("Session is closed")
+        if self._ack_withheld and self._rx.qsize() < self.params.max_pending_rx:
+            self._ack_withheld = False
+            if not self._closed and self._sent_ack != self._recv_seq:
+                self._send_ack()
+        return item
+
+    async def close(self) -> None:
+        if self._link is not None:
+            self._link.close()
+        self._shutdown()
+        while not self._rx.empty():
+            self._rx.get_nowait()
+        self._rx.put_nowait(_CLOSED)
+
+    def handle_i_frame(self, asdu: Any, send_seq: int, recv_seq: int) -> None:
+        if not self._count_i_frame(send_seq, recv_seq):
+            return
+        self._rx.put_nowait(asdu)
+        limit = self.params.max_pending_rx
+        if limit and self._rx.qsize() >= limit:
+            self._ack_withheld = True
+            return
+        self._schedule_ack()
+
+    def skip_i_frame(self, send_seq: int, recv_seq: int) -> None:
+        """Count an I-frame whose ASDU is not delivered, e.g. of an unsupported type.
+
+        The frame is acknowledged like any other, so the peer's window keeps moving.
+        """
+
+        if self._count_i_frame(send_seq, recv_seq) and not self._ack_withheld:
+            self._schedule_ack()
+
+    def handle_s_frame(self, recv_seq: int) -> None:
+        self._acknowledge(recv_seq)
+
+    def handle_u_frame(self, function: UFunction) -> None:
+        link = self._link
+        if function is UFunction.STARTDT_CON:
+            if self._started is not None and not self._started.done():
+                self._started.set_result(None)
+        elif function is UFunction.TESTFR_CON:
+            if self._tested is not None and not self._tested.done():
+                self._tested.set_result(None)
+        elif link is None:
+            return
+        elif function is UFunction.STARTDT_ACT:
+            link.send_u(UFunction.STARTDT_CON)
+        elif function is UFunction.STOPDT_ACT:
+            link.send_u(UFunction.STOPDT_CON)
+        elif function is UFunction.TESTFR_ACT:
+            link.send_u(UFunction.TESTFR_CON)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if self._closed:
+            return
+        logger.debug("connection lost", extra={"role": self.role, "error": str(exc)})
+        self._shutdown()
+        self._rx.put_nowait(_CLOSED)
+
+    def _count_i_frame(self, send_seq: int, recv_seq: int) -> bool:
+        """Check and advance the receive sequence; ``False`` if the session was failed."""
+
+        if send_seq != self._recv_seq:
+            self._fail(SequenceError(f"Expected send sequence {self._recv_seq}, got {send_seq}"))
+            return False
+        if not self._acknowledge(recv_seq):
+            return False
+        self._recv_seq = (self._recv_seq + 1) % SEQUENCE_MODULO
+        self.stats.i_frames_received += 1
+        return True
+
+    def _schedule_ack(self) -> None:
+        if (self._recv_seq - self._sent_ack) % SEQUENCE_MODULO >= self.params.w:
+            self._send_ack()
+        elif self._t2_handle is None:
+            loop = asyncio.get_running_loop()
+            self._t2_handle = loop.call_later(self.params.t2, self._on_t2_expired)
+
+    def _acknowledge(self, recv_seq: int) -> bool:
+        """Apply the peer's N(R); returns ``False`` if the session was failed."""
+
+        if (recv_seq - self._peer_ack) % SEQUENCE_MODULO > self.unacknowledged:
+            self._fail(
+                SequenceError(
+                    f"Acknowledged sequence {recv_seq} outside {self._peer_ack}..{self._send_seq}"
+                )
+            )
+            return False
+        self._peer_ack = recv_seq
+        if not self._window_open.is_set() and self.unacknowledged < self.params.k:
+            self._window_open.set()
+        return True
+
+    def _send_ack(self) -> None:
+        self._receipts_acknowledged()
+        if self._link is not None:
+            self.stats.s_frames_sent += 1
+            self._link.send_s(self._recv_seq)
+
+    def _receipts_acknowledged(self) -> None:
+        self._sent_ack = self._recv_seq
+        if self._t2_handle is not None:
+            self._t2_handle.cancel()
+            self._t2_handle = None
+
+    def _on_t2_expired(self) -> None:
+        self._t2_handle = None
+        if not self._closed and not self._ack_withheld and self._sent_ack != self._recv_seq:
+            self._send_ack()
+
+    def _fail(self, error: Exception) -> None:
+        logger.warning("sequence error", extra={"role": self.role, "error": str(error)})
+        if self._link is not None:
+            self._link.close()
+        self.connection_lost(error)
+
+    def _shutdown(self) -> None:
+        self._closed = True
+        self._window_open.set()
+        if self._t2_handle is not None:
+            self._t2_handle.cancel()
+            self._t2_handle = None
+        if self._started is not None and not self._started.done():
+            self._started.set_exception(SessionClosedError("Session closed during STARTDT"))
+        if self._tested is not None and not self._tested.done():
+            self._tested.set_exception(SessionClosedError("Session closed during TESTFR"))
+            # Nobody may be waiting any more; do not log "exception never retrieved".
+            self._tested.exception()
+
+    def _require_link(self) -> FrameLink:
+        if self._closed or self._link is None:
+            raise SessionClosedError("Session is closed")
+        return self._link
+
+
+__all__ = ["FrameLink", "IEC104Session", "SessionParameters", "SessionStats"]
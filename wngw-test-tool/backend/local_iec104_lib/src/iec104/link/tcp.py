@@ -0,0 +1,302 @@
+"""TCP and in-memory client/server front ends."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import replace
+from typing import Any, Awaitable, Callable, Literal, Optional
+
+from ..apci.frame import APCIFrame, FrameFormat, UFunction
+from ..codec.decode import StreamingAPDUDecoder, decode_asdu
+from ..codec.encode import append_i_frame, build_s_frame, build_u_frame
+from ..errors import DecodeError, IEC104Error, SessionClosedError, UnsupportedTypeError
+from .memory import connect_pair
+from .session import IEC104Session, SessionParameters
+
+logger = logging.getLogger(__name__)
+
+Transport = Literal["tcp", "memory"]
+_CLOSED = object()
+ASDUHandler = Callable[[IEC104Session, Any], Awaitable[None]]
+
+
+class IEC104Protocol(asyncio.Protocol):
+    """``asyncio.Protocol`` feeding received bytes straight into the decoder.
+
+    Framing and APCI errors close the connection. An I-frame whose ASDU cannot
+    be decoded, e.g. of a type without a registered codec, is logged and
+    acknowledged but not delivered.
+
+    Outgoing frames are encoded into one corked buffer and written with a
+    single ``transport.write`` at the end of the current event loop iteration,
+    so a burst of ``send_asdu`` calls costs one syscall instead of one per frame.
+    """
+
+    def __init__(
+        self,
+        session: IEC104Session,
+        on_connected: Optional[Callable[[IEC104Session], None]] = None,
+    ) -> None:
+        self._session = session
+        self._on_connected = on_connected
+        self._decoder = StreamingAPDUDecoder()
+        self._transport: Optional[asyncio.Transport] = None
+        self._corked = bytearray()
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self.writes = 0
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        assert isinstance(transport, asyncio.Transport)
+        self._transport = transport
+        self._session.attach(self)
+        if self._on_connected is not None:
+            self._on_connected(self._session)
+
+    def data_received(self, data: bytes) -> None:
+        session = self._session
+        try:
+            for apci, asdu in self._decoder.feed(data):
+                frame = APCIFrame.decode(apci)
+                if frame.format is FrameFormat.I:
+                    assert asdu is not None
+                    try:
+                        decoded = decode_asdu(asdu)
+                    except (DecodeError, UnsupportedTypeError) as exc:
+                        # Framing is intact: skip the ASDU, keep the connection.
+                        logger.warning(
+                            "ASDU skipped", extra={"role": session.role, "error": str(exc)}
+                        )
+                        session.skip_i_frame(frame.send_seq, frame.recv_seq)
+                        continue
+                    session.handle_i_frame(decoded, frame.send_seq, frame.recv_seq)
+                elif frame.format is FrameFormat.S:
+                    session.handle_s_frame(frame.recv_seq)
+                else:
+                    assert frame.u_function is not None
+                    session.handle_u_frame(frame.u_function)
+        except IEC104Error as exc:
+            logger.warning("protocol error", extra={"role": session.role, "error": str(exc)})
+            self.close()
+            session.connection_lost(exc)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._transport = None
+        self._corked = bytearray()
+        self._cancel_flush()
+        self._decoder.clear()
+        self._session.connection_lost(exc)
+
+    def send_i(self, asdu: Any, send_seq: int, recv_seq: int) -> None:
+        if self._transport is not None:
+            append_i_frame(self._corked, asdu, send_seq, recv_seq)
+            self._schedule_flush()
+
+    def send_s(self, recv_seq: int) -> None:
+        if self._transport is not None:
+            self._corked += build_s_frame(recv_seq)
+            self._schedule_flush()
+
+    def send_u(self, function: UFunction) -> None:
+        if self._transport is not None:
+            self._corked += build_u_frame(function)
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all corked frames now."""
+
+        self._cancel_flush()
+        if self._transport is not None and self._corked:
+            # A fresh buffer is started because the transport may keep a
+            # reference to the written one until it has been sent.
+            data, self._corked = self._corked, bytearray()
+            self._transport.write(data)
+            self.writes += 1
+
+    def close(self) -> None:
+        if self._transport is not None:
+            self.flush()
+            self._transport.close()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_soon(self.flush)
+
+    def _cancel_flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+
+class IEC104Server:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        handler: ASDUHandler,
+        params: SessionParameters | None = None,
+        *,
+        transport: Transport = "tcp",
+        handler_queue_size: int = 256,
+        max_concurrent_handlers: int | None = None,
+        reuse_port: bool = False,
+    ) -> None:
+        if handler_queue_size < 1:
+            raise ValueError("handler_queue_size must be at least 1")
+        if max_concurrent_handlers is not None and max_concurrent_handlers < 1:
+            raise ValueError("max_concurrent_handlers must be at least 1")
+        self.host = host
+        self.port = port
+        self.handler = handler
+        params = params or SessionParameters()
+        if not params.max_pending_rx:
+            # Withhold acknowledgements once the handler queue and as many
+            # received ASDUs are waiting, so the peer stops after k frames.
+            params = replace(params, max_pending_rx=handler_queue_size)
+        self.params = params
+        self.transport = transport
+        self.handler_queue_size = handler_queue_size
+        self.reuse_port = reuse_port
+        self._handler_slots = (
+            asyncio.Semaphore(max_concurrent_handlers) if max_concurrent_handlers else None
+        )
+        self._started = False
+        self._listener: Optional[asyncio.Server] = None
+        self._sessions: list[IEC104Session] = []
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def start(self) -> None:
+        if self._started:
+            return
+        if self.transport == "tcp":
+            loop = asyncio.get_running_loop()
+            self._listener = await loop.create_server(
+                lambda: IEC104Protocol(IEC104Session("server", self.params), self._accept),
+                self.host,
+                self.port,
+                reuse_address=True,
+                reuse_port=self.reuse_port or None,
+            )
+            if self.port == 0:
+                self.port = self._listener.sockets[0].getsockname()[1]
+        else:
+            _SERVERS[(self.host, self.port)] = self
+        self._started = True
+
+    @property
+    def sessions(self) -> tuple[IEC104Session, ...]:
+        """Currently connected sessions."""
+
+        return tuple(self._sessions)
+
+    async def stop(self) -> None:
+        if not self._started:
+            return
+        if self._listener is not None:
+            self._listener.close()
+        else:
+            _SERVERS.pop((self.host, self.port), None)
+        for session in list(self._sessions):
+            await session.close()
+        self._sessions.clear()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._listener is not None:
+            await self._listener.wait_closed()
+            self._listener = None
+        self._started = False
+
+    def _accept(self, session: IEC104Session) -> None:
+        self._sessions.append(session)
+        task = asyncio.get_running_loop().create_task(self._serve(session))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _serve(self, session: IEC104Session) -> None:
+        """Receive loop of one session.
+
+        ASDUs are handed to a per-session worker through a bounded queue, so
+        a slow handler delays only its own session. Once the queue is full the
+        loop stops taking ASDUs from the session, whose ``max_pending_rx``
+        limit then withholds acknowledgements until the worker catches up.
+        The socket keeps being read, so S- and U-frames are still answered.
+        """
+
+        logger.info("client connected", extra={"role": "server"})
+        queue: asyncio.Queue[Any] = asyncio.Queue(self.handler_queue_size)
+        worker = asyncio.get_running_loop().create_task(self._dispatch(session, queue))
+        try:
+            while True:
+                await queue.put(await session.recv())
+        except SessionClosedError:
+            await queue.put(_CLOSED)
+            await worker
+        finally:
+            worker.cancel()
+            if session in self._sessions:
+                self._sessions.remove(session)
+            logger.info("session closed", extra={"role": "server"})
+
+    async def _dispatch(self, session: IEC104Session, queue: asyncio.Queue[Any]) -> None:
+        slots = self._handler_slots
+        while True:
+            asdu = await queue.get()
+            if asdu is _CLOSED:
+                return
+            try:
+                if slots is None:
+                    await self.handler(session, asdu)
+                else:
+                    async with slots:
+                        await self.handler(session, asdu)
+            except Exception:
+                logger.exception("handler failed", extra={"role": "server"})
+
+
+_SERVERS: dict[tuple[str, int], IEC104Server] = {}
+
+
+class IEC104Client:
+    def __init__(self, session: IEC104Session) -> None:
+        self._session = session
+
+    @classmethod
+    async def connect(
+        cls,
+        host: str,
+        port: int,
+        params: SessionParameters | None = None,
+        *,
+        transport: Transport = "tcp",
+    ) -> "IEC104Client":
+        session = IEC104Session("client", params)
+        if transport == "tcp":
+            loop = asyncio.get_running_loop()
+            await loop.create_connection(lambda: IEC104Protocol(session), host, port)
+        else:
+            server = _SERVERS.get((host, port))
+            if server is None:
+                raise ConnectionError("No IEC104Server listening")
+            server_session = IEC104Session("server", server.params)
+            connect_pair(session, server_session)
+            server._accept(server_session)
+        await session.start()
+        return cls(session)
+
+    async def send_asdu(self, asdu: Any, *, flush: bool = False) -> None:
+        await self._session.send_asdu(asdu, flush=flush)
+
+    async def recv(self) -> Any:
+        return await self._session.recv()
+
+    async def close(self) -> None:
+        await self._session.close()
+
+    @property
+    def session(self) -> IEC104Session:
+        return self._session
+
+
+__all__ = ["ASDUHandler", "IEC104Client", "IEC104Protocol", "IEC104Server", "Transport"]
@@ -0,0 +1 @@
+"""Protocol constants and time formats."""
@@ -0,0 +1,95 @@
+"""Protocol level constants."""
+
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import Optional
+
+START_BYTE = 0x68
+APCI_LENGTH = 6
+CONTROL_FIELD_LENGTH = 4
+MAX_APDU_LENGTH = 253
+MAX_FRAME_LENGTH = MAX_APDU_LENGTH + 2
+MAX_ASDU_LENGTH = MAX_APDU_LENGTH - CONTROL_FIELD_LENGTH
+MAX_INFORMATION_OBJECTS = 127
+SEQUENCE_MODULO = 1 << 15
+
+
+class TypeID(IntEnum):
+    M_SP_NA_1 = 1
+    M_ME_NC_1 = 13
+    M_SP_TB_1 = 30
+    C_SC_NA_1 = 45
+
+
+class CauseOfTransmission(IntEnum):
+    """Causes of transmission of IEC 60870-5-101/104.
+
+    Values without a name (not used, reserved and the private range 48-63)
+    still convert, to a pseudo-member named ``COT_<value>``, so traffic
+    using them decodes and round-trips unchanged.
+    """
+
+    PERIODIC = 1
+    BACKGROUND_SCAN = 2
+    SPONTANEOUS = 3
+    INITIALIZED = 4
+    REQUEST = 5
+    ACTIVATION = 6
+    ACTIVATION_CON = 7
+    DEACTIVATION = 8
+    DEACTIVATION_CON = 9
+    ACTIVATION_TERMINATION = 10
+    RETURN_REMOTE = 11
+    RETURN_LOCAL = 12
+    FILE_TRANSFER = 13
+    INTERROGATED = 20
+    INTERROGATED_GROUP_1 = 21
+    INTERROGATED_GROUP_2 = 22
+    INTERROGATED_GROUP_3 = 23
+    INTERROGATED_GROUP_4 = 24
+    INTERROGATED_GROUP_5 = 25
+    INTERROGATED_GROUP_6 = 26
+    INTERROGATED_GROUP_7 = 27
+    INTERROGATED_GROUP_8 = 28
+    INTERROGATED_GROUP_9 = 29
+    INTERROGATED_GROUP_10 = 30
+    INTERROGATED_GROUP_11 = 31
+    INTERROGATED_GROUP_12 = 32
+    INTERROGATED_GROUP_13 = 33
+    INTERROGATED_GROUP_14 = 34
+    INTERROGATED_GROUP_15 = 35
+    INTERROGATED_GROUP_16 = 36
+    COUNTER_INTERROGATED = 37
+    COUNTER_INTERROGATED_GROUP_1 = 38
+    COUNTER_INTERROGATED_GROUP_2 = 39
+    COUNTER_INTERROGATED_GROUP_3 = 40
+    COUNTER_INTERROGATED_GROUP_4 = 41
+    UNKNOWN_TYPE = 44
+    UNKNOWN_CAUSE = 45
+    UNKNOWN_COMMON_ADDRESS = 46
+    UNKNOWN_IOA = 47
+
+    @classmethod
+    def _missing_(cls, value: object) -> Optional[CauseOfTransmission]:
+        if not isinstance(value, int) or not 0 <= value <= 0x3F:
+            return None
+        member = int.__new__(cls, value)
+        member._name_ = f"COT_{value}"
+        member._value_ = value
+        # Cached like a member, so equal values stay identical.
+        return cls._value2member_map_.setdefault(value, member)  # type: ignore[return-value]
+
+
+__all__ = [
+    "START_BYTE",
+    "APCI_LENGTH",
+    "CONTROL_FIELD_LENGTH",
+    "MAX_APDU_LENGTH",
+    "MAX_FRAME_LENGTH",
+    "MAX_ASDU_LENGTH",
+    "MAX_INFORMATION_OBJECTS",
+    "SEQUENCE_MODULO",
+    "TypeID",
+    "CauseOfTransmission",
+]
@@ -0,0 +1,175 @@
+"""CP56Time2a binary time format."""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+
+from ..errors import DecodeError, LengthError
+
+# milliseconds, minute, hour, day, month, year.
+CP56 = struct.Struct("<HBBBBB")
+CP56_SIZE = CP56.size
+
+# Same octets read as milliseconds plus one word and one byte, which together
+# identify the calendar minute.
+_MINUTE_KEY = struct.Struct("<HIB")
+
+_MS_PER_MINUTE = 60_000
+_MS_PER_HOUR = 3_600_000
+_MS_PER_DAY = 86_400_000
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MIN_EPOCH_MS = (date(2000, 1, 1).toordinal() - _EPOCH_ORDINAL) * _MS_PER_DAY
+_MAX_EPOCH_MS = (date(2100, 1, 1).toordinal() - _EPOCH_ORDINAL) * _MS_PER_DAY
+
+# (minute index since epoch, (minute, hour, day, month, year) octets)
+_encode_cache: tuple[int, tuple[int, int, int, int, int]] = (-1, (0, 0, 0, 0, 0))
+# (minute key of the octets, epoch milliseconds at the start of that minute)
+_decode_cache: tuple[int, int] = (-1, 0)
+
+
+def _minute_octets(minute_index: int) -> tuple[int, int, int, int, int]:
+    global _encode_cache
+    cached_index, octets = _encode_cache
+    if cached_index == minute_index:
+        return octets
+    days, minute_of_day = divmod(minute_index, 1440)
+    day = date.fromordinal(_EPOCH_ORDINAL + days)
+    hour, minute = divmod(minute_of_day, 60)
+    octets = (minute, hour, day.day | day.isoweekday() << 5, day.month, day.year - 2000)
+    _encode_cache = (minute_index, octets)
+    return octets
+
+
+def encode_epoch_ms_into(
+    buffer: bytearray | memoryview, offset: int, epoch_ms: int, *, summer_time: bool = False
+) -> None:
+    """Write ``epoch_ms`` (UTC) as CP56Time2a into ``buffer`` at ``offset``.
+
+    The calendar octets are cached per minute, so a run of timestamps within
+    the same minute only recomputes the millisecond field.
+    """
+
+    if not _MIN_EPOCH_MS <= epoch_ms < _MAX_EPOCH_MS:
+        raise ValueError("CP56Time2a covers the years 2000-2099 only")
+    minute_index, milliseconds = divmod(epoch_ms, _MS_PER_MINUTE)
+    minute, hour, day, month, year = _minute_octets(minute_index)
+    CP56.pack_into(
+        buffer, offset, milliseconds, minute, hour | (0x80 if summer_time else 0), day, month, year
+    )
+
+
+def decode_epoch_ms(view: bytes | bytearray | memoryview, offset: int = 0) -> int:
+    """Read a CP56Time2a at ``offset`` as UTC epoch milliseconds.
+
+    The invalid flag is ignored. The summer time flag only tells that the
+    sender's clock was on summer time; the time is returned as sent, without
+    subtracting an hour. Fields outside their range, such as day 0 or month
+    13, raise ``DecodeError``. The start of the decoded minute is cached, so
+    a run of timestamps within the same minute costs one ``unpack_from`` each.
+    """
+
+    global _decode_cache
+    milliseconds, word, year = _MINUTE_KEY.unpack_from(view, offset)
+    if milliseconds >= _MS_PER_MINUTE:
+        raise DecodeError(f"CP56Time2a milliseconds out of range: {milliseconds}")
+    key = (word & 0x0F1F1F3F) | (year & 0x7F) << 32
+    cached_key, base = _decode_cache
+    if cached_key != key:
+        minute, hour = word & 0x3F, (word >> 8) & 0x1F
+        if minute >= 60 or hour >= 24:
+            raise DecodeError(f"CP56Time2a time out of range: {hour:02}:{minute:02}")
+        try:
+            day = date(2000 + (year & 0x7F), (word >> 24) & 0x0F, (word >> 16) & 0x1F)
+        except ValueError as exc:
+            raise DecodeError(f"CP56Time2a date out of range: {exc}") from exc
+        base = (
+            (day.toordinal() - _EPOCH_ORDINAL) * _MS_PER_DAY
+            + hour * _MS_PER_HOUR
+            + minute * _MS_PER_MINUTE
+        )
+        _decode_cache = (key, base)
+    return base + milliseconds
+
+
+@dataclass(slots=True)
+class CP56Time2a:
+    milliseconds: int
+    minute: int
+    invalid: bool
+    hour: int
+    summer_time: bool
+    day_of_month: int
+    day_of_week: int
+    month: int
+    year: int
+
+    def fields(self) -> tuple[int, int, int, int, int, int]:
+        """Return the octet groups ``(ms, minute, hour, day, month, year)``."""
+
+        return (
+            self.milliseconds,
+            self.minute | (0x80 if self.invalid else 0),
+            self.hour | (0x80 if self.summer_time else 0),
+            self.day_of_month | (self.day_of_week << 5),
+            self.month,
+            self.year,
+        )
+
+    @classmethod
+    def from_fields(
+        cls, milliseconds: int, minute: int, hour: int, day: int, month: int, year: int
+    ) -> "CP56Time2a":
+        return cls(
+            milliseconds=milliseconds,
+            minute=minute & 0x3F,
+            invalid=bool(minute & 0x80),
+            hour=hour & 0x1F,
+            summer_time=bool(hour & 0x80),
+            day_of_month=day & 0x1F,
+            day_of_week=day >> 5,
+            month=month & 0x0F,
+            year=year & 0x7F,
+        )
+
+    def to_epoch_ms(self) -> int:
+        if self.invalid:
+            raise ValueError("CP56Time2a is marked invalid")
+        return decode_epoch_ms(CP56.pack(*self.fields()))
+
+    @classmethod
+    def from_epoch_ms(cls, epoch_ms: int, *, summer_time: bool = False) -> "CP56Time2a":
+        buffer = bytearray(CP56_SIZE)
+        encode_epoch_ms_into(buffer, 0, epoch_ms, summer_time=summer_time)
+        return cls.from_fields(*CP56.unpack(buffer))
+
+    def to_datetime(self) -> datetime:
+        return _EPOCH + timedelta(milliseconds=self.to_epoch_ms())
+
+    @classmethod
+    def from_datetime(cls, dt: datetime, *, summer_time: bool = False) -> "CP56Time2a":
+        if dt.tzinfo is None:
+            raise ValueError("datetime must be timezone aware")
+        delta = dt - _EPOCH
+        epoch_ms = (delta.days * 86_400 + delta.seconds) * 1000 + delta.microseconds // 1000
+        return cls.from_epoch_ms(epoch_ms, summer_time=summer_time)
+
+    def encode(self) -> bytes:
+        if not 0 <= self.milliseconds < _MS_PER_MINUTE:
+            raise ValueError(f"milliseconds out of range: {self.milliseconds}")
+        if not (0 <= self.minute < 60 and 0 <= self.hour < 24 and 1 <= self.day_of_month <= 31):
+            raise ValueError("minute, hour or day of month out of range")
+        if not (0 <= self.day_of_week <= 7 and 1 <= self.month <= 12 and 0 <= self.year <= 99):
+            raise ValueError("day of week, month or year out of range")
+        return CP56.pack(*self.fields())
+
+    @classmethod
+    def decode(cls, view: bytes | bytearray | memoryview, offset: int = 0) -> "CP56Time2a":
+        if len(view) - offset < CP56_SIZE:
+            raise LengthError(f"CP56Time2a needs {CP56_SIZE} octets")
+        return cls.from_fields(*CP56.unpack_from(view, offset))
+
+
+__all__ = ["CP56", "CP56_SIZE", "CP56Time2a", "decode_epoch_ms", "encode_epoch_ms_into"]
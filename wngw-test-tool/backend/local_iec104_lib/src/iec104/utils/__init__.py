@@ -0,0 +1 @@
+"""Internal helpers."""
@@ -0,0 +1,101 @@
+"""Byte buffers used by the streaming codec."""
+
+from __future__ import annotations
+
+from ..errors import LengthError
+
+BytesLike = bytes | bytearray | memoryview
+
+
+def as_byte_view(data: BytesLike) -> memoryview:
+    """Return a flat unsigned byte view on ``data`` without copying."""
+
+    view = data if isinstance(data, memoryview) else memoryview(data)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    return view
+
+
+class BoundedBuffer:
+    """Fixed-capacity ring buffer for bytes.
+
+    The storage is allocated once. Writes wrap around the end of the storage and
+    raise ``LengthError`` instead of growing when the free space is exhausted.
+    """
+
+    __slots__ = ("_storage", "_view", "_capacity", "_head", "_size", "_scratch")
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._storage = bytearray(capacity)
+        self._view = memoryview(self._storage)
+        self._capacity = capacity
+        self._head = 0
+        self._size = 0
+        self._scratch: memoryview | None = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def free(self) -> int:
+        return self._capacity - self._size
+
+    def write(self, data: BytesLike) -> None:
+        view = as_byte_view(data)
+        length = len(view)
+        if length > self._capacity - self._size:
+            raise LengthError(
+                f"Buffer overflow: {length} bytes do not fit into {self.free} free bytes"
+            )
+        tail = (self._head + self._size) % self._capacity
+        first = min(length, self._capacity - tail)
+        self._view[tail : tail + first] = view[:first]
+        if first < length:
+            self._view[: length - first] = view[first:]
+        self._size += length
+
+    def peek(self, index: int) -> int:
+        if not 0 <= index < self._size:
+            raise IndexError("buffer index out of range")
+        return self._storage[(self._head + index) % self._capacity]
+
+    def view(self, length: int) -> memoryview:
+        """Return the first ``length`` buffered bytes as one contiguous view.
+
+        The view points into the ring storage unless the region wraps around the
+        end, in which case it is linearized into a scratch area. Either way it
+        stays valid until the next call of ``view`` or the region is overwritten.
+        """
+
+        if length > self._size:
+            raise LengthError(f"Only {self._size} bytes buffered, {length} requested")
+        head = self._head
+        end = head + length
+        if end <= self._capacity:
+            return self._view[head:end]
+        if self._scratch is None:
+            self._scratch = memoryview(bytearray(self._capacity))
+        first = self._capacity - head
+        scratch = self._scratch
+        scratch[:first] = self._view[head:]
+        scratch[first:length] = self._view[: length - first]
+        return scratch[:length]
+
+    def consume(self, length: int) -> None:
+        if length > self._size:
+            raise LengthError(f"Only {self._size} bytes buffered, {length} requested")
+        self._head = (self._head + length) % self._capacity
+        self._size -= length
+
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
+
+
+__all__ = ["BoundedBuffer", "BytesLike", "as_byte_view"]
@@ -4,25 +4,30 @@ from __future__ import annotations
 
 import asyncio
 
+import pytest
+
 from wngw_app.services.iec104 import factory
 from wngw_app.services.livebus import LiveBus
 from wngw_app.services.protocol_store import ProtocolStore
 
 
-def test_client_server_start_stop(tmp_path):
+@pytest.mark.parametrize("transport", ["tcp", "memory"])
+def test_client_server_start_stop(tmp_path, transport):
     async def scenario() -> None:
         live_bus = LiveBus()
         store = ProtocolStore(tmp_path)
-        client = factory.create_client(live_bus, store)
-        server = factory.create_server(live_bus)
+        client = factory.create_client(live_bus, store, transport=transport)
+        server = factory.create_server(live_bus, transport=transport)
 
         async def handler(session, asdu):  # pragma: no cover - no-op handler
             del session, asdu
 
         server.set_handler(handler)
-        await server.start("0.0.0.0", 2404)
+        # Port 0 lets the OS pick a free port instead of binding the well-known 2404.
+        await server.start("127.0.0.1", 0 if transport == "tcp" else 2404)
         try:
-            await client.connect("0.0.0.0", 2404)
+            await client.connect("127.0.0.1", server.port)
+            assert client.connected
         finally:
             await client.close()
             await server.stop()
@@ -0,0 +1,135 @@
+"""Pipelined bulk commands over one pooled session."""
+
+from __future__ import annotations
+
+import asyncio
+
+from fastapi.testclient import TestClient
+from iec104 import CauseOfTransmission
+
+from wngw_app.main import create_app
+from wngw_app.services.iec104 import factory
+from wngw_app.services.iec104.contract import BulkCommand
+from wngw_app.services.iec104.pool import ClientPool
+from wngw_app.services.livebus import LiveBus
+from wngw_app.services.protocol_store import ProtocolStore
+
+
+async def confirm_even_ioas(session, asdu):
+    if asdu.information_objects[0].ioa % 2 == 0:
+        asdu.header.cause = CauseOfTransmission.ACTIVATION_CON
+        asdu.header.negative_confirm = asdu.information_objects[0].ioa == 4
+        await session.send_asdu(asdu)
+
+
+def test_bulk_commands_match_confirmations_by_ioa(tmp_path):
+    async def scenario() -> None:
+        live_bus = LiveBus()
+        server = factory.create_server(live_bus, transport="memory")
+        server.set_handler(confirm_even_ioas)
+        await server.start("127.0.0.1", 2430)
+        store = ProtocolStore(tmp_path)
+        client = factory.create_client(live_bus, store, transport="memory")
+        await client.connect("127.0.0.1", 2430)
+        try:
+            commands = [BulkCommand(ca=1, ioa=ioa, value=True) for ioa in range(40)]
+            results = await client.send_bulk_commands(commands, timeout=0.2)
+        finally:
+            await client.close()
+            await server.stop()
+        assert [result.ioa for result in results] == list(range(40))
+        assert results[0].status == "confirmed"
+        assert results[0].latency_ms is not None
+        assert results[1].status == "timeout"
+        assert results[4].status == "negative"
+        entries = list(store.read("bulk-command"))
+        assert len(entries) == 40
+        assert entries[2].result == "bulk-command-confirmed"
+
+    asyncio.run(scenario())
+
+
+def test_bulk_commands_route(tmp_path):
+    app = create_app()
+    with TestClient(app) as http:
+        app.state.client_pool = ClientPool(
+            app.state.live_bus, ProtocolStore(tmp_path), transport="memory"
+        )
+        server = factory.create_server(app.state.live_bus, transport="memory")
+        server.set_handler(confirm_even_ioas)
+        http.portal.call(server.start, "127.0.0.1", 2431)
+        try:
+            response = http.post(
+                "/api/tests/bulk-commands",
+                json={
+                    "host": "127.0.0.1",
+                    "port": 2431,
+                    "timeout": 0.2,
+                    "commands": [{"ca": 1, "ioa": ioa, "value": False} for ioa in (2, 3)],
+                },
+            )
+        finally:
+            http.portal.call(app.state.client_pool.close)
+            http.portal.call(server.stop)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["confirmed"] == 1
+    assert [result["status"] for result in body["results"]] == ["confirmed", "timeout"]
+
+
+def test_bulk_commands_fail_at_once_when_the_session_closes(tmp_path):
+    async def scenario() -> None:
+        async def confirm_then_hang_up(session, asdu):
+            if asdu.information_objects[0].ioa == 3:
+                await session.close()
+                return
+            asdu.header.cause = CauseOfTransmission.ACTIVATION_CON
+            await session.send_asdu(asdu)
+
+        live_bus = LiveBus()
+        server = factory.create_server(live_bus, transport="memory")
+        server.set_handler(confirm_then_hang_up)
+        await server.start("127.0.0.1", 2432)
+        store = ProtocolStore(tmp_path)
+        client = factory.create_client(live_bus, store, transport="memory")
+        await client.connect("127.0.0.1", 2432)
+        try:
+            started = asyncio.get_running_loop().time()
+            commands = [BulkCommand(ca=1, ioa=ioa, value=True) for ioa in range(10)]
+            results = await client.send_bulk_commands(commands, timeout=5)
+            elapsed = asyncio.get_running_loop().time() - started
+        finally:
+            await client.close()
+            await server.stop()
+        assert elapsed < 1
+        assert [result.status for result in results] == ["confirmed"] * 3 + ["closed"] * 7
+        assert [entry.result for entry in store.read("bulk-command")][3:] == [
+            "bulk-command-closed"
+        ] * 7
+
+    asyncio.run(scenario())
+
+
+def test_bulk_commands_time_out_when_the_peer_stops_acknowledging(tmp_path):
+    async def scenario() -> None:
+        live_bus = LiveBus()
+        server = factory.create_server(live_bus, transport="memory")
+        server.set_handler(confirm_even_ioas)
+        await server.start("127.0.0.1", 2433)
+        client = factory.create_client(live_bus, ProtocolStore(tmp_path), transport="memory")
+        await client.connect("127.0.0.1", 2433)
+        (peer,) = server.sessions
+        # I-frames vanish unacknowledged, so the client's k window fills up.
+        peer.handle_i_frame = lambda asdu, send_seq, recv_seq: None
+        try:
+            started = asyncio.get_running_loop().time()
+            commands = [BulkCommand(ca=1, ioa=ioa, value=True) for ioa in range(40)]
+            results = await client.send_bulk_commands(commands, timeout=0.3)
+            elapsed = asyncio.get_running_loop().time() - started
+        finally:
+            await client.close()
+            await server.stop()
+        assert elapsed < 1
+        assert [result.status for result in results] == ["timeout"] * 40
+
+    asyncio.run(scenario())
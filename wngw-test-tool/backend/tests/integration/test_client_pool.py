@@ -0,0 +1,169 @@
+"""Client session pool reuse, limits and reconnects."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from wngw_app.services.iec104 import factory
+from wngw_app.services.iec104.pool import ClientPool
+from wngw_app.services.livebus import LiveBus
+from wngw_app.services.protocol_store import ProtocolStore
+from wngw_app.services.simulator import SimulatorConfig, StationSimulator
+
+
+async def _no_reply(session, asdu):
+    del session, asdu
+
+
+def test_pool_reuses_sessions_and_reconnects(tmp_path):
+    async def scenario() -> None:
+        live_bus = LiveBus()
+        server = factory.create_server(live_bus, transport="memory")
+        server.set_handler(_no_reply)
+        await server.start("127.0.0.1", 2410)
+        pool = ClientPool(live_bus, ProtocolStore(tmp_path), transport="memory")
+        try:
+            async with pool.acquire("127.0.0.1", 2410) as first:
+                await first.send_single_command(1, 1, True)
+            async with pool.acquire("127.0.0.1", 2410) as second:
+                assert second is first
+
+            with pytest.raises(RuntimeError):
+                async with pool.acquire("127.0.0.1", 2410) as broken:
+                    raise RuntimeError("command failed")
+            assert not broken.connected
+            async with pool.acquire("127.0.0.1", 2410) as third:
+                assert third is not broken
+                assert third.connected
+            assert pool.stats() == {"127.0.0.1:2410": 1}
+        finally:
+            await pool.close()
+            await server.stop()
+            await live_bus.close()
+
+    asyncio.run(scenario())
+
+
+def test_pool_caps_sessions_per_partner_and_evicts_idle(tmp_path):
+    async def scenario() -> None:
+        live_bus = LiveBus()
+        server = factory.create_server(live_bus, transport="memory")
+        server.set_handler(_no_reply)
+        await server.start("127.0.0.1", 2411)
+        pool = ClientPool(
+            live_bus, ProtocolStore(tmp_path), max_per_partner=2, idle_timeout=0, transport="memory"
+        )
+        active = 0
+        peak = 0
+
+        async def command(ioa: int) -> None:
+            nonlocal active, peak
+            async with pool.acquire("127.0.0.1", 2411) as client:
+                active += 1
+                peak = max(peak, active)
+                await client.send_single_command(1, ioa, True)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        try:
+            await asyncio.gather(*(command(ioa) for ioa in range(10)))
+            assert peak == 2
+            assert pool.stats() == {"127.0.0.1:2411": 2}
+            assert await pool.evict_idle() == 2
+            assert pool.stats() == {}
+        finally:
+            await pool.close()
+            await server.stop()
+            await live_bus.close()
+
+    asyncio.run(scenario())
+
+
+def test_late_replies_are_not_handed_to_the_next_user(tmp_path):
+    async def scenario() -> None:
+        live_bus = LiveBus()
+        config = SimulatorConfig(ioas=[100], command_delay=0.2)
+        simulator = StationSimulator(factory.create_server(live_bus, transport="memory"), config)
+        await simulator.start("127.0.0.1", 2412)
+        pool = ClientPool(live_bus, ProtocolStore(tmp_path), transport="memory")
+        try:
+            async with pool.acquire("127.0.0.1", 2412) as client:
+                slow = await client.send_confirmed_command(1, 100, True, timeout=0.05)
+            assert slow.status == "timeout"
+            # The ACT_CON for IOA 100 arrives while the session is idle.
+            await asyncio.sleep(0.3)
+            async with pool.acquire("127.0.0.1", 2412) as again:
+                assert again is client
+                assert await again.recv_once(timeout=0) is None
+                result = await again.send_confirmed_command(1, 101, False, timeout=1)
+            assert (result.ioa, result.status) == (101, "confirmed")
+        finally:
+            await pool.close()
+            await simulator.stop()
+            await live_bus.close()
+
+    asyncio.run(scenario())
+
+
+def test_health_check_evicts_sessions_without_test_frame_confirmation(tmp_path):
+    async def scenario() -> None:
+        live_bus = LiveBus()
+        server = factory.create_server(live_bus, transport="memory")
+        server.set_handler(_no_reply)
+        await server.start("127.0.0.1", 2413)
+        pool = ClientPool(live_bus, ProtocolStore(tmp_path), transport="memory")
+        try:
+            async with pool.acquire("127.0.0.1", 2413) as client:
+                client._client.session.params.t1 = 0.05
+            assert await pool.evict_idle() == 0
+            assert pool.stats() == {"127.0.0.1:2413": 1}
+
+            # Half-open peer: the connection looks fine but nothing answers.
+            (peer,) = server.sessions
+            peer.handle_u_frame = lambda function: None
+            assert client.connected
+            assert await pool.evict_idle() == 1
+            assert not client.connected
+            assert pool.stats() == {}
+        finally:
+            await pool.close()
+            await server.stop()
+            await live_bus.close()
+
+    asyncio.run(scenario())
+
+
+def test_acquire_during_health_check_does_not_exceed_the_partner_limit(tmp_path):
+    async def scenario() -> None:
+        live_bus = LiveBus()
+        server = factory.create_server(live_bus, transport="memory")
+        server.set_handler(_no_reply)
+        await server.start("127.0.0.1", 2414)
+        pool = ClientPool(live_bus, ProtocolStore(tmp_path), max_per_partner=1, transport="memory")
+        try:
+            async with pool.acquire("127.0.0.1", 2414) as client:
+                pass
+            probe = client.check_alive
+
+            async def slow_probe() -> bool:
+                await asyncio.sleep(0.1)
+                return await probe()
+
+            client.check_alive = slow_probe
+            eviction = asyncio.get_running_loop().create_task(pool.evict_idle())
+            await asyncio.sleep(0.01)
+            async with pool.acquire("127.0.0.1", 2414) as again:
+                # Waited for the probe instead of opening a second session.
+                assert again is client
+                assert len(server.sessions) == 1
+            assert await eviction == 0
+            assert pool.stats() == {"127.0.0.1:2414": 1}
+            assert len(server.sessions) == 1
+        finally:
+            await pool.close()
+            await server.stop()
+            await live_bus.close()
+
+    asyncio.run(scenario())
@@ -0,0 +1,111 @@
+"""Background receive loop of the client adapter."""
+
+from __future__ import annotations
+
+import asyncio
+
+from iec104 import (
+    ASDUHeader,
+    CauseOfTransmission,
+    MeasuredValueASDU,
+    MeasuredValueFloat,
+    TypeID,
+)
+
+from wngw_app.services.iec104 import factory
+from wngw_app.services.iec104.adapter_lib import IEC104LibClientAdapterImpl
+from wngw_app.services.livebus import LiveBus
+from wngw_app.services.protocol_store import ProtocolStore
+
+
+def measurement(ioa: int) -> MeasuredValueASDU:
+    header = ASDUHeader(
+        type_id=TypeID.M_ME_NC_1,
+        sequence=False,
+        vsq_number=1,
+        cause=CauseOfTransmission.SPONTANEOUS,
+        negative_confirm=False,
+        test=False,
+        originator_address=0,
+        common_address=1,
+        oa=None,
+    )
+    return MeasuredValueASDU(
+        header=header, information_objects=(MeasuredValueFloat(ioa=ioa, value=ioa / 2),)
+    )
+
+
+async def _stream_measurements(session, asdu):
+    del asdu
+    for ioa in range(50):
+        await session.send_asdu(measurement(ioa))
+
+
+def test_spontaneous_traffic_drives_on_rx_and_drops_oldest(tmp_path):
+    async def scenario() -> None:
+        live_bus = LiveBus()
+        subscription = live_bus.subscribe()
+        server = factory.create_server(live_bus, transport="memory")
+        server.set_handler(_stream_measurements)
+        await server.start("127.0.0.1", 2420)
+        client = IEC104LibClientAdapterImpl(
+            live_bus, ProtocolStore(tmp_path), transport="memory", rx_queue_size=10
+        )
+        seen = []
+
+        async def on_rx(event):
+            if event.dir == "rx":
+                seen.append(event.asdu.ioa)
+
+        client.on_rx(on_rx)
+        try:
+            await client.connect("127.0.0.1", 2420)
+            await client.send_single_command(1, 1, True)
+            for _ in range(100):
+                if len(seen) == 50:
+                    break
+                await asyncio.sleep(0.01)
+            first = await client.recv_once(timeout=1)
+        finally:
+            await client.close()
+            await server.stop()
+        assert seen == list(range(50))
+        assert client.rx_dropped == 40
+        assert first.information_objects[0].ioa == 40
+        rx_events = [event for event in subscription.read_nowait() if event.dir == "rx"]
+        assert rx_events[-1].asdu.payload == {"value": 24.5, "quality": 0}
+
+    asyncio.run(scenario())
+
+
+def test_block_policy_pauses_the_peer(tmp_path):
+    async def scenario() -> None:
+        live_bus = LiveBus()
+        server = factory.create_server(live_bus, transport="memory")
+        server.set_handler(_stream_measurements)
+        await server.start("127.0.0.1", 2421)
+        client = IEC104LibClientAdapterImpl(
+            live_bus,
+            ProtocolStore(tmp_path),
+            transport="memory",
+            rx_queue_size=5,
+            rx_policy="block",
+        )
+        try:
+            await client.connect("127.0.0.1", 2421)
+            await client.send_single_command(1, 1, True)
+            await asyncio.sleep(0.05)
+            # Withheld acknowledgements stop the server once its k window is used up.
+            received = client._client.session.stats.i_frames_received
+            assert received < 50
+            ioas = []
+            for _ in range(50):
+                asdu = await client.recv_once(timeout=1)
+                ioas.append(asdu.information_objects[0].ioa)
+        finally:
+            await client.close()
+            await server.stop()
+        assert ioas == list(range(50))
+        assert client.rx_dropped == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,227 @@
+"""Round trips through the TCP and in-memory IEC-104 transports."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from iec104 import (
+    ASDUHeader,
+    CauseOfTransmission,
+    IEC104Client,
+    IEC104Server,
+    SessionParameters,
+    SingleCommand,
+    SingleCommandASDU,
+    TypeID,
+    build_i_frame,
+    encode_asdu,
+)
+
+
+def command(ioa: int, cause: CauseOfTransmission) -> SingleCommandASDU:
+    header = ASDUHeader(
+        type_id=TypeID.C_SC_NA_1,
+        sequence=False,
+        vsq_number=1,
+        cause=cause,
+        negative_confirm=False,
+        test=False,
+        originator_address=0,
+        common_address=1,
+        oa=None,
+    )
+    return SingleCommandASDU(
+        header=header,
+        information_objects=(SingleCommand(ioa=ioa, state=True, qualifier=0),),
+    )
+
+
+@pytest.mark.parametrize("transport", ["tcp", "memory"])
+def test_command_confirmation_round_trip(transport):
+    async def scenario() -> None:
+        async def handler(session, asdu):
+            ioa = asdu.information_objects[0].ioa
+            await session.send_asdu(command(ioa, CauseOfTransmission.ACTIVATION_CON))
+
+        port = 0 if transport == "tcp" else 2404
+        server = IEC104Server("127.0.0.1", port, handler, transport=transport)
+        await server.start()
+        client = await IEC104Client.connect("127.0.0.1", server.port, transport=transport)
+        try:
+            for ioa in range(1, 51):
+                await client.send_asdu(command(ioa, CauseOfTransmission.ACTIVATION))
+            replies = [await asyncio.wait_for(client.recv(), timeout=1) for _ in range(50)]
+        finally:
+            await client.close()
+            await server.stop()
+        assert [reply.information_objects[0].ioa for reply in replies] == list(range(1, 51))
+        assert replies[0].header.cause is CauseOfTransmission.ACTIVATION_CON
+
+    asyncio.run(scenario())
+
+
+def test_connect_without_listener_fails():
+    async def scenario() -> None:
+        with pytest.raises(ConnectionError):
+            await IEC104Client.connect("127.0.0.1", 1, transport="tcp")
+        with pytest.raises(ConnectionError):
+            await IEC104Client.connect("127.0.0.1", 1, transport="memory")
+
+    asyncio.run(scenario())
+
+
+def test_frames_sent_in_one_tick_are_written_together():
+    async def scenario() -> None:
+        received = []
+
+        async def handler(session, asdu):
+            del session
+            received.append(asdu.information_objects[0].ioa)
+
+        params = SessionParameters(k=200, w=100)
+        server = IEC104Server("127.0.0.1", 0, handler, params)
+        await server.start()
+        client = await IEC104Client.connect("127.0.0.1", server.port, params)
+        protocol = client.session._link
+        try:
+            writes = protocol.writes
+            for ioa in range(100):
+                await client.send_asdu(command(ioa, CauseOfTransmission.ACTIVATION))
+            assert protocol.writes == writes
+            await asyncio.sleep(0)
+            assert protocol.writes == writes + 1
+
+            await client.send_asdu(command(100, CauseOfTransmission.ACTIVATION), flush=True)
+            assert protocol.writes == writes + 2
+            for _ in range(100):
+                if len(received) == 101:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await client.close()
+            await server.stop()
+        assert received == list(range(101))
+
+    asyncio.run(scenario())
+
+
+def test_slow_handler_blocks_only_its_session():
+    async def scenario() -> None:
+        release = asyncio.Event()
+        handled = []
+        running = 0
+        peak = 0
+
+        async def handler(session, asdu):
+            nonlocal running, peak
+            ioa = asdu.information_objects[0].ioa
+            running += 1
+            peak = max(peak, running)
+            try:
+                if ioa == 0:
+                    await release.wait()
+                else:
+                    await asyncio.sleep(0.01)
+            finally:
+                running -= 1
+            handled.append(ioa)
+
+        server = IEC104Server(
+            "127.0.0.1", 2405, handler, transport="memory", max_concurrent_handlers=3
+        )
+        await server.start()
+        clients = [
+            await IEC104Client.connect("127.0.0.1", 2405, transport="memory") for _ in range(5)
+        ]
+        try:
+            for ioa, client in enumerate(clients):
+                await client.send_asdu(command(ioa, CauseOfTransmission.ACTIVATION))
+            for _ in range(100):
+                if len(handled) == 4:
+                    break
+                await asyncio.sleep(0.01)
+            assert sorted(handled) == [1, 2, 3, 4]
+            release.set()
+            await asyncio.sleep(0.01)
+        finally:
+            for client in clients:
+                await client.close()
+            await server.stop()
+        assert handled[-1] == 0
+        assert peak <= 3
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("transport", ["tcp", "memory"])
+def test_slow_handler_stops_the_peer_instead_of_queueing_without_bound(transport):
+    async def scenario() -> None:
+        release = asyncio.Event()
+        handled = []
+
+        async def handler(session, asdu):
+            del session
+            await release.wait()
+            handled.append(asdu.information_objects[0].ioa)
+
+        async def send_all() -> None:
+            for ioa in range(100):
+                await client.send_asdu(command(ioa, CauseOfTransmission.ACTIVATION))
+
+        port = 0 if transport == "tcp" else 2405
+        server = IEC104Server("127.0.0.1", port, handler, transport=transport, handler_queue_size=4)
+        await server.start()
+        params = SessionParameters(k=8, w=2)
+        client = await IEC104Client.connect("127.0.0.1", server.port, params, transport=transport)
+        sender = asyncio.get_running_loop().create_task(send_all())
+        try:
+            await asyncio.sleep(0.3)
+            # Acknowledgements are withheld: the client's window stays full.
+            assert not sender.done()
+            assert client.session.unacknowledged == params.k
+            assert server.sessions[0]._rx.qsize() <= 4 + params.k
+            release.set()
+            await asyncio.wait_for(sender, timeout=5)
+            while len(handled) < 100:
+                await asyncio.sleep(0.01)
+        finally:
+            sender.cancel()
+            await client.close()
+            await server.stop()
+        assert handled == list(range(100))
+
+    asyncio.run(scenario())
+
+
+def test_unsupported_asdu_type_is_skipped_without_closing_the_connection():
+    async def scenario() -> None:
+        received = []
+
+        async def handler(session, asdu):
+            del session
+            received.append(asdu.information_objects[0].ioa)
+
+        server = IEC104Server("127.0.0.1", 0, handler, SessionParameters(w=1))
+        await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        try:
+            # M_EI_NA_1 (end of initialisation) has no codec.
+            end_of_init = bytes([70, 1, 4, 0, 1, 0, 0, 0, 0, 0])
+            activation = encode_asdu(command(7, CauseOfTransmission.ACTIVATION))
+            writer.write(build_i_frame(end_of_init, 0, 0) + build_i_frame(activation, 1, 0))
+            # Both I-frames are acknowledged with S-frames.
+            acks = [await asyncio.wait_for(reader.readexactly(6), timeout=1) for _ in range(2)]
+            assert [ack[2] for ack in acks] == [0x01, 0x01]
+            assert [int.from_bytes(ack[4:6], "little") >> 1 for ack in acks] == [1, 2]
+            for _ in range(100):
+                if received:
+                    break
+                await asyncio.sleep(0.01)
+            assert received == [7]
+            assert len(server.sessions) == 1
+        finally:
+            writer.close()
+            await server.stop()
+
+    asyncio.run(scenario())
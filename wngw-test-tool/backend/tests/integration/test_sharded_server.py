@@ -0,0 +1,69 @@
+"""Sharded multi-process server behind the server adapter contract."""
+
+from __future__ import annotations
+
+import asyncio
+
+from iec104 import CauseOfTransmission
+
+from wngw_app.services.iec104 import factory
+from wngw_app.services.iec104.sharded import _RECORD, IEC104ShardedServerAdapter
+from wngw_app.services.livebus import LiveBus
+from wngw_app.services.protocol_store import ProtocolStore
+
+
+async def confirm(session, asdu):
+    asdu.header.cause = CauseOfTransmission.ACTIVATION_CON
+    await session.send_asdu(asdu)
+
+
+def test_sharded_server_publishes_worker_events(tmp_path):
+    async def scenario() -> None:
+        live_bus = LiveBus()
+        events = []
+
+        async def collect() -> None:
+            async for event in live_bus.subscribe():
+                if event.role == "server":
+                    events.append(event)
+
+        collector = asyncio.create_task(collect())
+        server = factory.create_server(live_bus, workers=2)
+        server.set_handler(confirm)
+        await server.start("127.0.0.1", 0)
+        clients = [factory.create_client(live_bus, ProtocolStore(tmp_path)) for _ in range(4)]
+        try:
+            for station, client in enumerate(clients, start=1):
+                await client.connect("127.0.0.1", server.port)
+                await client.send_single_command(station, 100 + station, True)
+            for client in clients:
+                reply = await client.recv_once(timeout=5)
+                assert reply.header.cause is CauseOfTransmission.ACTIVATION_CON
+        finally:
+            for client in clients:
+                await client.close()
+            await server.stop()
+            collector.cancel()
+            await live_bus.close()
+        assert sorted(event.asdu.ioa for event in events) == [101, 102, 103, 104]
+        assert all(event.kind == "iec104.frame" for event in events)
+
+    asyncio.run(scenario())
+
+
+def test_undecodable_records_do_not_drop_the_rest_of_the_batch():
+    async def scenario() -> list:
+        live_bus = LiveBus()
+        subscription = live_bus.subscribe()
+        server = IEC104ShardedServerAdapter(live_bus, workers=1)
+        # M_ME_NC_1 announcing one object without its octets, then a valid single point.
+        truncated = bytes([13, 1, 3, 0, 1, 0])
+        valid = bytes([1, 1, 3, 0, 1, 0, 7, 0, 0, 1])
+        batch = b"".join(_RECORD.pack(0.0, len(record)) + record for record in (truncated, valid))
+        server._publish_batch(memoryview(batch))
+        events = subscription.read_nowait()
+        await live_bus.close()
+        return events
+
+    events = asyncio.run(scenario())
+    assert [event.asdu.ioa for event in events] == [7]
@@ -0,0 +1,75 @@
+"""WebSocket live endpoint streaming batches from the LiveBus."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+from wngw_app.domain.events import APCIMetadata, ASDUDescriptor, IEC104FrameEvent
+from wngw_app.main import create_app
+
+
+def event(ioa: int, role: str) -> IEC104FrameEvent:
+    return IEC104FrameEvent(
+        kind="iec104.frame",
+        role=role,
+        dir="tx",
+        ts=datetime.now(timezone.utc),
+        apci=APCIMetadata(type="I"),
+        asdu=ASDUDescriptor(typeId=45, cause=6, ca=1, ioa=ioa, payload={"value": True}),
+    )
+
+
+def test_ws_live_applies_filter_and_batches():
+    with TestClient(create_app()) as client:
+        bus = client.app.state.live_bus
+        with client.websocket_connect("/ws/live") as websocket:
+            websocket.send_text(json.dumps({"filter": {"role": "client"}}))
+            websocket.send_text(json.dumps({"filter": {"role": "nobody"}}))
+            assert websocket.receive_json()["type"] == "error"
+            # Malformed filters are rejected without closing the stream.
+            websocket.send_text(json.dumps({"filter": {"ca": [[None, 5]]}}))
+            assert websocket.receive_json()["type"] == "error"
+            websocket.send_text(json.dumps({"filter": {"role": [["client"]]}}))
+            assert websocket.receive_json()["type"] == "error"
+            for ioa in range(5):
+                role = "server" if ioa == 2 else "client"
+                client.portal.call(bus.publish_nowait, event(ioa, role))
+            message = websocket.receive_json()
+        assert message["type"] == "batch"
+        assert message["dropped"] == 0
+        assert [item["asdu"]["ioa"] for item in message["events"]] == [0, 1, 3, 4]
+        assert message["events"][0]["kind"] == "iec104.frame"
+
+
+def test_ws_live_binary_format():
+    with TestClient(create_app()) as client:
+        bus = client.app.state.live_bus
+        with client.websocket_connect("/ws/live?format=binary") as websocket:
+            sent = event(9, "server")
+            client.portal.call(bus.publish_nowait, sent)
+            data = websocket.receive_bytes()
+        assert int.from_bytes(data[:4], "little") == 0
+        assert int.from_bytes(data[4:12], "little") == 1
+        size = int.from_bytes(data[12:14], "little")
+        assert IEC104FrameEvent.from_binary(data[14 : 14 + size]) == sent
+
+
+def test_ws_live_backfills_history_before_live_tail():
+    with TestClient(create_app()) as client:
+        bus = client.app.state.live_bus
+        for ioa in range(5):
+            client.portal.call(bus.publish_nowait, event(ioa, "client"))
+        with client.websocket_connect("/ws/live?since_seq=2") as websocket:
+            backfill = websocket.receive_json()
+            client.portal.call(bus.publish_nowait, event(5, "client"))
+            live = websocket.receive_json()
+        with client.websocket_connect("/ws/live?last_seconds=60") as websocket:
+            recent = websocket.receive_json()
+    assert [item["asdu"]["ioa"] for item in backfill["events"]] == [2, 3, 4]
+    assert backfill["next_seq"] == 5
+    assert [item["asdu"]["ioa"] for item in live["events"]] == [5]
+    assert live["next_seq"] == 6
+    assert [item["asdu"]["ioa"] for item in recent["events"]] == list(range(6))
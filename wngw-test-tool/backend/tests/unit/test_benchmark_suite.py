@@ -0,0 +1,34 @@
+"""Baseline comparison of the benchmark suite."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from benchmarks.suite import Metric, compare, load_baseline, to_document
+
+
+def test_compare_respects_metric_direction():
+    baseline = {
+        "rate": Metric(1000.0, "ops/s", "higher"),
+        "latency": Metric(100.0, "us", "lower"),
+        "gone": Metric(1.0, "ops/s", "higher"),
+    }
+    current = {
+        "rate": Metric(800.0, "ops/s", "higher"),
+        "latency": Metric(90.0, "us", "lower"),
+        "new": Metric(1.0, "ops/s", "higher"),
+    }
+    comparisons = {item.name: item for item in compare(baseline, current)}
+    assert set(comparisons) == {"latency", "rate"}
+    assert comparisons["rate"].regression == pytest.approx(0.2)
+    assert comparisons["latency"].regression == pytest.approx(-0.1)
+
+
+def test_baseline_round_trip_rejects_other_workload_size(tmp_path):
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps(to_document({"rate": Metric(5.0, "ops/s", "higher")}, True)))
+    assert load_baseline(path, quick=True) == {"rate": Metric(5.0, "ops/s", "higher")}
+    with pytest.raises(ValueError):
+        load_baseline(path, quick=False)
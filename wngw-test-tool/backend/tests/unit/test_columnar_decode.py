@@ -0,0 +1,65 @@
+"""Tests for the columnar M_ME_NC_1 decode path."""
+
+from __future__ import annotations
+
+import pytest
+from iec104 import (
+    ASDUHeader,
+    CauseOfTransmission,
+    MeasuredValueASDU,
+    MeasuredValueFloat,
+    TypeID,
+    decode_measured_columns,
+    encode_asdu,
+    encode_sequence,
+)
+from iec104.errors import UnsupportedTypeError
+
+np = pytest.importorskip("numpy")
+
+
+def header(count: int, *, sequence: bool, type_id: TypeID = TypeID.M_ME_NC_1) -> ASDUHeader:
+    return ASDUHeader(
+        type_id=type_id,
+        sequence=sequence,
+        vsq_number=count,
+        cause=CauseOfTransmission.INTERROGATED,
+        negative_confirm=False,
+        test=False,
+        originator_address=0,
+        common_address=1,
+        oa=None,
+    )
+
+
+def test_mixed_sequence_and_addressed_asdus():
+    values = np.linspace(0.0, 47.0, 48, dtype=np.float32)
+    qualities = np.zeros(48, dtype=np.uint8)
+    qualities[3] = 0x80
+    sequence = encode_sequence(header(48, sequence=True), 70_000, values, qualities)
+    addressed = encode_asdu(
+        MeasuredValueASDU(
+            header=header(2, sequence=False),
+            information_objects=(
+                MeasuredValueFloat(ioa=0xFFFFFF, value=-1.5, quality=1),
+                MeasuredValueFloat(ioa=5, value=2.5),
+            ),
+        )
+    )
+
+    result = decode_measured_columns([memoryview(sequence), addressed])
+    assert result.dtype.names == ("ioa", "value", "quality")
+    assert len(result) == 50
+    assert result["ioa"][0] == 70_000
+    assert result["ioa"][47] == 70_047
+    np.testing.assert_array_equal(result["value"][:48], values)
+    assert result["quality"][3] == 0x80
+    assert result["ioa"][48:].tolist() == [0xFFFFFF, 5]
+    assert result["value"][48:].tolist() == [-1.5, 2.5]
+    assert result["quality"][48:].tolist() == [1, 0]
+
+
+def test_rejects_other_types():
+    data = encode_sequence(header(1, sequence=True, type_id=TypeID.M_SP_NA_1), 1, [True])
+    with pytest.raises(UnsupportedTypeError):
+        decode_measured_columns([data])
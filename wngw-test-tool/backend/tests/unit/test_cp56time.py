@@ -0,0 +1,87 @@
+"""Tests for CP56Time2a encoding and batch timestamp decoding."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from iec104 import (
+    ASDUHeader,
+    CauseOfTransmission,
+    CP56Time2a,
+    SinglePointTimeASDU,
+    SinglePointWithCP56Time,
+    TypeID,
+    decode_timestamps,
+    encode_asdu,
+)
+from iec104.errors import DecodeError
+from iec104.spec.time import decode_epoch_ms
+
+
+def test_datetime_round_trip_and_wire_format():
+    dt = datetime(2024, 2, 29, 23, 59, 58, 123000, tzinfo=timezone.utc)
+    stamp = CP56Time2a.from_datetime(dt)
+    assert (stamp.year, stamp.month, stamp.day_of_month, stamp.day_of_week) == (24, 2, 29, 4)
+    assert stamp.milliseconds == 58_123
+    data = stamp.encode()
+    assert data == bytes([0x0B, 0xE3, 59, 23, 29 | 4 << 5, 2, 24])
+    assert CP56Time2a.decode(memoryview(b"\x00" + data), 1).to_datetime() == dt
+
+    with pytest.raises(ValueError):
+        CP56Time2a.from_datetime(datetime(2024, 1, 1))
+    with pytest.raises(ValueError):
+        CP56Time2a.from_datetime(datetime(1999, 12, 31, tzinfo=timezone.utc))
+
+
+def test_decode_timestamps_across_minute_boundaries():
+    start = datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+    stamps = [start + timedelta(milliseconds=250 * i) for i in range(12)]
+    header = ASDUHeader(
+        type_id=TypeID.M_SP_TB_1,
+        sequence=False,
+        vsq_number=len(stamps),
+        cause=CauseOfTransmission.SPONTANEOUS,
+        negative_confirm=False,
+        test=False,
+        originator_address=0,
+        common_address=1,
+        oa=None,
+    )
+    asdu = SinglePointTimeASDU(
+        header=header,
+        information_objects=[
+            SinglePointWithCP56Time(ioa=i, value=True, timestamp=CP56Time2a.from_datetime(dt))
+            for i, dt in enumerate(stamps)
+        ],
+    )
+    decoded = decode_timestamps(encode_asdu(asdu))
+    assert list(decoded) == [int(dt.timestamp() * 1000) for dt in stamps]
+
+
+@pytest.mark.parametrize(
+    "octets",
+    [
+        bytes([0, 0, 12, 0, 0 | 1 << 5, 1, 24]),  # day 0
+        bytes([0, 0, 12, 0, 1, 13, 24]),  # month 13
+        bytes([0, 0, 12, 0, 30, 2, 24]),  # 30 February
+        bytes([0, 0, 12, 24, 1, 1, 24]),  # hour 24
+        bytes([0, 0, 60, 0, 1, 1, 24]),  # minute 60
+        bytes([0x60, 0xEA, 0, 0, 1, 1, 24]),  # 60 000 ms
+    ],
+)
+def test_out_of_range_fields_raise_decode_error(octets):
+    with pytest.raises(DecodeError):
+        decode_epoch_ms(octets)
+    with pytest.raises(DecodeError):
+        CP56Time2a.decode(octets).to_datetime()
+
+
+def test_summer_time_flag_does_not_shift_the_time():
+    dt = datetime(2024, 7, 1, 12, tzinfo=timezone.utc)
+    summer = CP56Time2a.from_datetime(dt, summer_time=True)
+    assert summer.summer_time and summer.hour == 12
+    assert decode_epoch_ms(summer.encode()) == decode_epoch_ms(
+        CP56Time2a.from_datetime(dt).encode()
+    )
+    assert summer.to_datetime() == dt
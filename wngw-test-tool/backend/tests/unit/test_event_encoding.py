@@ -0,0 +1,41 @@
+"""Tests for cached live event encodings."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+from wngw_app.domain.events import APCIMetadata, ASDUDescriptor, IEC104FrameEvent
+
+
+def make_event(**overrides) -> IEC104FrameEvent:
+    values = dict(
+        kind="iec104.frame",
+        role="client",
+        dir="tx",
+        ts=datetime(2026, 3, 29, 1, 2, 3, 456789, tzinfo=timezone.utc),
+        apci=APCIMetadata(type="I", vs=3, vr=7),
+        asdu=ASDUDescriptor(
+            typeId=45, cause=6, ca=1, ioa=4711, payload={"value": True, "qualifier": 0}
+        ),
+        raw="68 0e",
+    )
+    values.update(overrides)
+    return IEC104FrameEvent(**values)
+
+
+def test_json_is_encoded_once_and_matches_to_dict():
+    event = make_event()
+    text = event.to_json()
+    assert event.to_json() is text
+    assert json.loads(text) == event.to_dict()
+    assert "_json" not in event.to_dict()
+
+
+def test_binary_round_trip():
+    event = make_event()
+    assert IEC104FrameEvent.from_binary(event.to_binary()) == event
+    assert len(event.to_binary()) < len(event.to_json())
+
+    bare = make_event(raw=None, asdu=ASDUDescriptor(typeId=1, cause=3, ca=2, ioa=None, payload={}))
+    assert IEC104FrameEvent.from_binary(bare.to_binary()) == bare
@@ -0,0 +1,152 @@
+"""Tests for the struct based ASDU codec registry."""
+
+from __future__ import annotations
+
+from array import array
+
+import pytest
+from iec104 import (
+    ASDUHeader,
+    CauseOfTransmission,
+    CP56Time2a,
+    MeasuredValueASDU,
+    MeasuredValueFloat,
+    SingleCommand,
+    SingleCommandASDU,
+    SinglePointTimeASDU,
+    SinglePointWithCP56Time,
+    TypeID,
+    build_i_frame,
+    build_i_frames,
+    decode_apdu,
+    decode_asdu,
+    encode_asdu,
+    encode_sequence,
+)
+from iec104.apci.frame import FrameFormat
+from iec104.errors import UnsupportedTypeError
+
+
+def make_header(type_id: TypeID, count: int, *, sequence: bool = False) -> ASDUHeader:
+    return ASDUHeader(
+        type_id=type_id,
+        sequence=sequence,
+        vsq_number=count,
+        cause=CauseOfTransmission.SPONTANEOUS,
+        negative_confirm=False,
+        test=False,
+        originator_address=0,
+        common_address=7,
+        oa=None,
+    )
+
+
+def test_single_command_wire_format_and_round_trip():
+    asdu = SingleCommandASDU(
+        header=make_header(TypeID.C_SC_NA_1, 1),
+        information_objects=(SingleCommand(ioa=0x010203, state=True, qualifier=1),),
+    )
+    data = encode_asdu(asdu)
+    assert data == bytes([45, 1, 3, 0, 7, 0, 0x03, 0x02, 0x01, 0x05])
+
+    decoded = decode_asdu(memoryview(data))
+    assert isinstance(decoded, SingleCommandASDU)
+    assert decoded.header.type_id is TypeID.C_SC_NA_1
+    assert decoded.header.common_address == 7
+    command = decoded.information_objects[0]
+    assert (command.ioa, command.state, command.qualifier) == (0x010203, True, 1)
+
+
+def test_sequence_and_time_tagged_round_trip():
+    measured = MeasuredValueASDU(
+        header=make_header(TypeID.M_ME_NC_1, 3, sequence=True),
+        information_objects=[MeasuredValueFloat(ioa=100 + i, value=i * 0.5) for i in range(3)],
+    )
+    data = encode_asdu(measured)
+    assert len(data) == 6 + 3 + 3 * 5
+    values = decode_asdu(data).information_objects
+    assert [(obj.ioa, obj.value) for obj in values] == [(100, 0.0), (101, 0.5), (102, 1.0)]
+
+    stamp = CP56Time2a(
+        milliseconds=59_999,
+        minute=59,
+        invalid=False,
+        hour=23,
+        summer_time=True,
+        day_of_month=31,
+        day_of_week=7,
+        month=12,
+        year=99,
+    )
+    timed = SinglePointTimeASDU(
+        header=make_header(TypeID.M_SP_TB_1, 1),
+        information_objects=(SinglePointWithCP56Time(ioa=5, value=True, timestamp=stamp),),
+    )
+    decoded = decode_asdu(encode_asdu(timed)).information_objects[0]
+    assert decoded.value is True
+    assert decoded.timestamp == stamp
+
+
+def test_decode_apdu_and_unknown_type():
+    apdu = bytes.fromhex("680e0200040001010300010001000001")
+    frame, asdu, consumed = decode_apdu(apdu)
+    assert frame.format is FrameFormat.I
+    assert (frame.send_seq, frame.recv_seq) == (1, 2)
+    assert consumed == len(apdu)
+    assert asdu.information_objects[0].ioa == 1
+    assert asdu.information_objects[0].value is True
+
+    with pytest.raises(UnsupportedTypeError):
+        decode_asdu(bytes([99, 1, 3, 0, 1, 0, 1, 0, 0, 0]))
+
+
+def test_encode_sequence_from_columns_matches_object_encoder():
+    values = array("f", (i * 0.25 for i in range(48)))
+    qualities = array("B", (i & 0x80 for i in range(48)))
+    header = make_header(TypeID.M_ME_NC_1, 48, sequence=True)
+    data = encode_sequence(header, 1000, values, qualities)
+    objects = [
+        MeasuredValueFloat(ioa=1000 + i, value=value, quality=quality)
+        for i, (value, quality) in enumerate(zip(values, qualities))
+    ]
+    assert data == encode_asdu(MeasuredValueASDU(header=header, information_objects=objects))
+    decoded = decode_asdu(data).information_objects
+    assert decoded[-1].ioa == 1047
+    assert decoded[-1].value == values[-1]
+
+
+def test_build_i_frames_wraps_sequence_numbers():
+    asdu = bytes([1, 1, 3, 0, 1, 0, 1, 0, 0, 1])
+    assert build_i_frame(asdu, 5, 9) == bytes([0x68, 14, 10, 0, 18, 0]) + asdu
+
+    buffer, next_seq = build_i_frames([asdu] * 3, 32766, 3)
+    assert next_seq == 1
+    frames = []
+    view = memoryview(buffer)
+    while view:
+        frame, _asdu, consumed = decode_apdu(view)
+        frames.append((frame.send_seq, frame.recv_seq))
+        view = view[consumed:]
+    assert frames == [(32766, 3), (32767, 3), (0, 3)]
+    with pytest.raises(ValueError):
+        build_i_frame(asdu, 32768, 0)
+
+
+@pytest.mark.parametrize(
+    ("cot", "name"),
+    [
+        (21, "INTERROGATED_GROUP_1"),
+        (37, "COUNTER_INTERROGATED"),
+        (41, "COUNTER_INTERROGATED_GROUP_4"),
+        (14, "COT_14"),
+        (48, "COT_48"),
+    ],
+)
+def test_every_cause_of_transmission_decodes_and_round_trips(cot, name):
+    # P/N and test bits set on top of the cause.
+    data = bytes([1, 1, 0xC0 | cot, 0, 1, 0, 1, 0, 0, 1])
+    header = decode_asdu(data).header
+    assert header.cause == cot and header.cause.name == name
+    assert header.cause is CauseOfTransmission(cot)
+    assert header.negative_confirm and header.test
+    assert encode_asdu(decode_asdu(data)) == data
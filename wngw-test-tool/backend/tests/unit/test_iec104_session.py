@@ -0,0 +1,85 @@
+"""Tests for the IEC-104 session window and acknowledgement handling."""
+
+from __future__ import annotations
+
+import asyncio
+
+from iec104 import IEC104Session, SessionParameters
+
+
+class RecordingLink:
+    def __init__(self) -> None:
+        self.i_frames: list[tuple[object, int, int]] = []
+        self.s_frames: list[int] = []
+
+    def send_i(self, asdu, send_seq, recv_seq):
+        self.i_frames.append((asdu, send_seq, recv_seq))
+
+    def send_s(self, recv_seq):
+        self.s_frames.append(recv_seq)
+
+    def send_u(self, function):
+        del function
+
+    def close(self):
+        pass
+
+
+def test_send_blocks_while_k_frames_are_unacknowledged():
+    async def scenario() -> None:
+        session = IEC104Session("client", SessionParameters(k=3, w=2))
+        link = RecordingLink()
+        session.attach(link)
+        for index in range(3):
+            await session.send_asdu(index)
+        blocked = asyncio.create_task(session.send_asdu(3))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        session.handle_s_frame(2)
+        await asyncio.wait_for(blocked, timeout=1)
+        assert [frame[1] for frame in link.i_frames] == [0, 1, 2, 3]
+        assert session.unacknowledged == 2
+
+    asyncio.run(scenario())
+
+
+def test_acknowledgements_are_coalesced_by_w_and_t2():
+    async def scenario() -> None:
+        session = IEC104Session("client", SessionParameters(k=12, w=8, t2=0.05))
+        link = RecordingLink()
+        session.attach(link)
+        for seq in range(20):
+            session.handle_i_frame(seq, seq, 0)
+        assert link.s_frames == [8, 16]
+        await asyncio.sleep(0.1)
+        assert link.s_frames == [8, 16, 20]
+
+        session.handle_i_frame(20, 20, 0)
+        await session.send_asdu("reply")
+        assert link.i_frames[-1][2] == 21
+        await asyncio.sleep(0.1)
+        assert link.s_frames == [8, 16, 20]
+        assert session.stats.s_frames_sent == 3
+
+    asyncio.run(scenario())
+
+
+def test_acknowledgements_are_withheld_while_receive_queue_is_full():
+    async def scenario() -> None:
+        params = SessionParameters(k=12, w=2, t2=0.01, max_pending_rx=4)
+        session = IEC104Session("client", params)
+        link = RecordingLink()
+        session.attach(link)
+        for seq in range(6):
+            session.handle_i_frame(seq, seq, 0)
+        assert link.s_frames == [2]
+        await asyncio.sleep(0.05)
+        assert link.s_frames == [2]
+
+        assert await session.recv() == 0
+        assert link.s_frames == [2]
+        assert await session.recv() == 1
+        assert await session.recv() == 2
+        assert link.s_frames == [2, 6]
+
+    asyncio.run(scenario())
@@ -0,0 +1,64 @@
+"""Tests for the bounded live event history."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+from wngw_app.domain.events import APCIMetadata, ASDUDescriptor, IEC104FrameEvent
+from wngw_app.services.live_history import LiveHistory
+from wngw_app.services.livebus import LiveBus
+
+
+def event(ioa: int) -> IEC104FrameEvent:
+    return IEC104FrameEvent(
+        kind="iec104.frame",
+        role="server",
+        dir="rx",
+        ts=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        apci=APCIMetadata(type="I"),
+        asdu=ASDUDescriptor(typeId=45, cause=3, ca=1, ioa=ioa, payload={"value": ioa}),
+    )
+
+
+def test_history_is_bounded_by_count_and_bytes():
+    history = LiveHistory(max_events=3)
+    for seq in range(5):
+        history.append(seq, event(seq))
+    assert len(history) == 3
+    assert history.first_seq == 2
+
+    size = len(event(0).to_binary())
+    history = LiveHistory(max_bytes=size * 2)
+    for seq in range(5):
+        history.append(seq, event(seq))
+    assert len(history) == 2
+    assert history.size_bytes <= size * 2
+
+
+def test_history_seeks_by_seq_and_time():
+    history = LiveHistory()
+    for seq in range(10):
+        history.append(seq, event(seq), published_at=1000.0 + seq)
+    first, events = history.since_seq(7)
+    assert first == 7
+    assert [item.asdu.ioa for item in events] == [7, 8, 9]
+    first, events = history.since_time(1004.5)
+    assert first == 5
+    assert events[0] == event(5)
+    assert history.since_seq(10) == (10, [])
+
+
+def test_subscription_backfill_then_live_without_gaps():
+    async def scenario() -> None:
+        bus = LiveBus(capacity=4, history=LiveHistory(max_events=6))
+        for ioa in range(10):
+            bus.publish_nowait(event(ioa))
+        subscription = bus.subscribe(since_seq=2)
+        assert subscription.dropped == 2
+        assert subscription.position == 4
+        bus.publish_nowait(event(10))
+        received = [item.asdu.ioa for item in subscription.read_nowait()]
+        assert received == list(range(4, 11))
+
+    asyncio.run(scenario())
@@ -0,0 +1,80 @@
+"""Tests for live event filters and micro-batching."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from wngw_app.domain.events import APCIMetadata, ASDUDescriptor, IEC104FrameEvent
+from wngw_app.services.live_stream import LiveFilter, LiveStream
+from wngw_app.services.livebus import LiveBus
+
+
+def event(ioa: int, *, role: str = "server", type_id: int = 45) -> IEC104FrameEvent:
+    return IEC104FrameEvent(
+        kind="iec104.frame",
+        role=role,
+        dir="rx",
+        ts=datetime.now(timezone.utc),
+        apci=APCIMetadata(type="I"),
+        asdu=ASDUDescriptor(typeId=type_id, cause=3, ca=7, ioa=ioa, payload={}),
+    )
+
+
+def test_filter_matches_roles_types_and_ranges():
+    live_filter = LiveFilter.from_dict(
+        {"role": "server", "typeId": [13, 45], "ca": [[1, 10]], "ioa": [5, [100, 200]]}
+    )
+    assert live_filter.matches(event(5))
+    assert live_filter.matches(event(150, type_id=13))
+    assert not live_filter.matches(event(6))
+    assert not live_filter.matches(event(150, role="client"))
+    assert not live_filter.matches(event(150, type_id=1))
+    assert LiveFilter().matches(event(1))
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"role": "gateway"},
+        {"ioa": [[5, 1]]},
+        {"typeId": "x"},
+        {"station": 1},
+        {"ca": [[None, 5]]},
+        {"ioa": [["a", 5]]},
+        {"role": [["client"]]},
+        {"dir": [1]},
+    ],
+)
+def test_filter_rejects_invalid_input(data):
+    with pytest.raises(ValueError):
+        LiveFilter.from_dict(data)
+
+
+def test_stream_batches_filters_and_reports_drops():
+    async def scenario() -> None:
+        bus = LiveBus(capacity=16)
+        stream = LiveStream(
+            bus.subscribe(),
+            interval=0.01,
+            max_batch=8,
+            live_filter=LiveFilter.from_dict({"ioa": [[0, 99]]}),
+        )
+        for ioa in (1, 500, 2):
+            bus.publish_nowait(event(ioa))
+        batch = await anext(stream)
+        assert [item.asdu.ioa for item in batch.events] == [1, 2]
+        assert batch.dropped == 0
+
+        for ioa in range(20):
+            bus.publish_nowait(event(ioa))
+        first = await anext(stream)
+        second = await anext(stream)
+        assert first.dropped == 4
+        assert len(first.events) == 8
+        assert [item.asdu.ioa for item in second.events] == list(range(12, 20))
+        assert second.dropped == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,68 @@
+"""Tests for the ring buffer LiveBus."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+from wngw_app.domain.events import APCIMetadata, ASDUDescriptor, IEC104FrameEvent
+from wngw_app.services.livebus import LiveBus
+
+
+def event(ioa: int) -> IEC104FrameEvent:
+    return IEC104FrameEvent(
+        kind="iec104.frame",
+        role="server",
+        dir="rx",
+        ts=datetime.now(timezone.utc),
+        apci=APCIMetadata(type="I"),
+        asdu=ASDUDescriptor(typeId=45, cause=6, ca=1, ioa=ioa, payload={}),
+    )
+
+
+def test_subscribers_read_independently():
+    async def scenario() -> None:
+        bus = LiveBus(capacity=8)
+        fast = bus.subscribe()
+        slow = bus.subscribe()
+        for ioa in range(3):
+            await bus.publish(event(ioa))
+        assert [(await anext(fast)).asdu.ioa for _ in range(3)] == [0, 1, 2]
+        assert slow.lag == 3
+        assert [item.asdu.ioa for item in slow.read_nowait()] == [0, 1, 2]
+        assert fast.dropped == slow.dropped == 0
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscriber_skips_ahead_and_counts_drops():
+    async def scenario() -> None:
+        bus = LiveBus(capacity=4)
+        subscription = bus.subscribe()
+        for ioa in range(10):
+            bus.publish_nowait(event(ioa))
+        assert [item.asdu.ioa for item in subscription.read_nowait()] == [6, 7, 8, 9]
+        assert subscription.dropped == 6
+        assert subscription.gaps == 1
+
+    asyncio.run(scenario())
+
+
+def test_waiting_subscriber_wakes_on_publish_and_stops_on_close():
+    async def scenario() -> None:
+        bus = LiveBus()
+        received = []
+
+        async def consume() -> None:
+            async for item in bus.subscribe():
+                received.append(item.asdu.ioa)
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        bus.publish_nowait(event(1))
+        await asyncio.sleep(0)
+        await bus.close()
+        await asyncio.wait_for(consumer, timeout=1)
+        assert received == [1]
+
+    asyncio.run(scenario())
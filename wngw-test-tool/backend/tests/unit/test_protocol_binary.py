@@ -0,0 +1,79 @@
+"""Binary protocol logs and JSON lines conversion."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+
+from wngw_app.domain.models import ProtocolEntry
+from wngw_app.services.protocol_convert import export_jsonl, import_jsonl
+from wngw_app.services.protocol_store import ProtocolStore
+
+START = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+
+def entries(first: int, count: int) -> list[ProtocolEntry]:
+    return [
+        ProtocolEntry(
+            timestamp=START + timedelta(seconds=index),
+            result="ok" if index % 4 else "timeout",
+            payload={"ioa": 1000 + index, "value": index * 0.5, "quality": "good"},
+        )
+        for index in range(first, first + count)
+    ]
+
+
+def test_binary_round_trip_filters_and_reopen(tmp_path):
+    store = ProtocolStore(tmp_path, record_format="binary", index_interval=16)
+    store.append_many("soak", entries(0, 100))
+    assert (tmp_path / "soak" / "symbols.jsonl").exists()
+    assert list(store.read("soak")) == entries(0, 100)
+    timeouts = store.read("soak", result="timeout", limit=3)
+    assert [entry.payload["ioa"] for entry in timeouts] == [1000, 1004, 1008]
+    assert list(store.read("soak", result="unknown")) == []
+    store.close()
+
+    # A store configured for JSON lines keeps appending binary records here.
+    reopened = ProtocolStore(tmp_path)
+    reopened.append_many("soak", entries(100, 10))
+    selected = reopened.read(
+        "soak", since=START + timedelta(seconds=95), until=START + timedelta(seconds=104)
+    )
+    assert list(selected) == entries(95, 10)
+    (listed,) = reopened.list_protocols()
+    assert listed.entries == 110
+    assert listed.results == {"ok": 82, "timeout": 28}
+    reopened.close()
+
+
+def test_jsonl_export_import_round_trip_is_smaller_in_binary(tmp_path):
+    plain = ProtocolStore(tmp_path / "plain")
+    plain.append_many("soak", entries(0, 500))
+    exported = tmp_path / "soak.jsonl"
+    assert export_jsonl(plain, "soak", exported) == 500
+
+    binary = ProtocolStore(tmp_path / "binary", record_format="binary", segment_bytes=1 << 20)
+    assert import_jsonl(exported, binary, "soak", batch=64) == 500
+    assert list(binary.read("soak")) == entries(0, 500)
+    binary_size = sum(path.stat().st_size for path in (tmp_path / "binary" / "soak").iterdir())
+    assert binary_size < exported.stat().st_size / 2
+
+    again = tmp_path / "again.jsonl"
+    assert export_jsonl(binary, "soak", again, since=START + timedelta(seconds=490)) == 10
+    lines = [json.loads(line) for line in again.read_text().splitlines()]
+    assert lines == [entry.to_dict() for entry in entries(490, 10)]
+    binary.close()
+
+
+def test_existing_jsonl_protocols_keep_their_format(tmp_path):
+    ProtocolStore(tmp_path).append_many("legacy", entries(0, 3))
+    store = ProtocolStore(tmp_path, record_format="binary")
+    store.append_many("legacy", entries(3, 2))
+    store.append_many("fresh", entries(0, 2))
+    store.close()
+    assert not (tmp_path / "legacy").exists()
+    lines = (tmp_path / "legacy.jsonl").read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [entry.to_dict() for entry in entries(0, 5)]
+    assert list(store.read("legacy")) == entries(0, 5)
+    assert (tmp_path / "fresh" / "symbols.jsonl").exists()
+    assert [item.path for item in store.list_protocols()] == ["fresh", "legacy.jsonl"]
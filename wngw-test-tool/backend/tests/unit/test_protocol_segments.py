@@ -0,0 +1,83 @@
+"""Segmented, compressed protocol logs."""
+
+from __future__ import annotations
+
+import gzip
+import threading
+from datetime import datetime, timedelta, timezone
+
+from wngw_app.domain.models import ProtocolEntry
+from wngw_app.services.protocol_store import ProtocolStore
+
+START = datetime(2024, 5, 1, tzinfo=timezone.utc)
+
+
+def entries(first: int, count: int) -> list[ProtocolEntry]:
+    return [
+        ProtocolEntry(timestamp=START + timedelta(seconds=index), result="ok", payload={"n": index})
+        for index in range(first, first + count)
+    ]
+
+
+def test_segments_rotate_compress_and_serve_time_ranges(tmp_path):
+    store = ProtocolStore(tmp_path, segment_bytes=4096, index_interval=10)
+    for first in range(0, 1000, 50):
+        store.append_many("soak", entries(first, 50))
+    log = store._log("soak")
+    assert log.segments > 3
+    log.wait_compressed()
+    compressed = sorted(tmp_path.glob("soak/*.jsonl.gz"))
+    assert compressed
+    assert all(path.with_suffix("").with_suffix(".idx").exists() for path in compressed)
+    # One gzip member per block: standard tools still read the whole segment.
+    assert gzip.decompress(compressed[0].read_bytes()).count(b"\n") > 10
+
+    log.blocks_read = 0
+    selected = store.read(
+        "soak", since=START + timedelta(seconds=500), until=START + timedelta(seconds=519)
+    )
+    assert [entry.payload["n"] for entry in selected] == list(range(500, 520))
+    assert log.blocks_read <= 3
+    assert [entry.payload["n"] for entry in store.read("soak")] == list(range(1000))
+    store.close()
+
+
+def test_reopen_compresses_leftover_segment_and_drops_torn_record(tmp_path):
+    store = ProtocolStore(tmp_path, segment_seconds=3600, index_interval=8, buffered=True)
+    store.append_many("soak", entries(0, 20))
+    store.close()
+    raw = next(tmp_path.glob("soak/*.jsonl"))
+    with raw.open("ab") as file:
+        file.write(b'{"timestamp": "2024-05-01T00:')
+
+    reopened = ProtocolStore(tmp_path, segment_seconds=3600, index_interval=8)
+    assert [entry.payload["n"] for entry in reopened.read("soak")] == list(range(20))
+    assert not list(tmp_path.glob("soak/*.jsonl"))
+    reopened.append_many("soak", entries(20, 5))
+    assert [entry.payload["n"] for entry in reopened.read("soak")][-6:] == list(range(19, 25))
+    reopened.close()
+
+
+def test_rotation_compresses_in_the_background(tmp_path):
+    store = ProtocolStore(tmp_path, segment_bytes=4096, index_interval=10)
+    store.append_many("soak", entries(0, 10))
+    log = store._log("soak")
+    release = threading.Event()
+    compress = log._compress
+
+    def blocked(segment):
+        release.wait(5)
+        compress(segment)
+
+    log._compress = blocked
+    # Rotates several times; neither append nor reads wait for compression.
+    for first in range(10, 500, 50):
+        store.append_many("soak", entries(first, 50))
+    assert [entry.payload["n"] for entry in store.read("soak")] == list(range(510))
+    assert store.list_protocols()[0].entries == 510
+    assert not list(tmp_path.glob("soak/*.jsonl.gz"))
+    release.set()
+    log.wait_compressed()
+    assert len(list(tmp_path.glob("soak/*.jsonl.gz"))) == len(log._segments)
+    assert [entry.payload["n"] for entry in store.read("soak")] == list(range(510))
+    store.close()
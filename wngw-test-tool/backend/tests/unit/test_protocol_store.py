@@ -0,0 +1,171 @@
+"""Buffered group-commit mode of the protocol store."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from wngw_app.domain.models import ProtocolEntry
+from wngw_app.services.protocol_store import ProtocolStore
+
+
+def entry(ioa: int) -> ProtocolEntry:
+    return ProtocolEntry(
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc), result="ok", payload={"ioa": ioa}
+    )
+
+
+@pytest.mark.parametrize("durability", ["none", "flush", "fsync"])
+def test_buffered_appends_are_visible_to_reads(tmp_path, durability):
+    store = ProtocolStore(tmp_path, buffered=True, durability=durability, flush_interval=60)
+    try:
+        store.append("single", entry(1))
+        store.append_many("single", [entry(2), entry(3)])
+        assert [item.payload["ioa"] for item in store.read("single")] == [1, 2, 3]
+        assert [item.path for item in store.list_protocols()] == ["single.jsonl"]
+    finally:
+        store.close()
+
+
+def test_close_drains_queue_and_falls_back_to_direct_writes(tmp_path):
+    store = ProtocolStore(tmp_path, buffered=True, flush_interval=60, flush_entries=1000)
+    store.append_many("bulk", [entry(ioa) for ioa in range(100)])
+    store.close()
+    assert len((tmp_path / "bulk.jsonl").read_text().splitlines()) == 100
+    assert not store.buffered
+    store.append("bulk", entry(100))
+    assert len((tmp_path / "bulk.jsonl").read_text().splitlines()) == 101
+
+
+def test_groups_are_written_when_the_size_threshold_is_reached(tmp_path):
+    store = ProtocolStore(tmp_path, buffered=True, flush_interval=60, flush_entries=10)
+    try:
+        store.append_many("bulk", [entry(ioa) for ioa in range(10)])
+        path = tmp_path / "bulk.jsonl"
+        for _ in range(200):
+            if path.exists() and len(path.read_text().splitlines()) == 10:
+                break
+            time.sleep(0.005)
+        assert len(path.read_text().splitlines()) == 10
+    finally:
+        store.close()
+
+
+def test_unserialisable_entry_is_reported_without_stopping_the_writer(tmp_path):
+    store = ProtocolStore(tmp_path, buffered=True, flush_interval=60)
+    try:
+        bad = ProtocolEntry(timestamp=entry(0).timestamp, result="ok", payload={"x": object()})
+        store.append_many("bulk", [entry(1), bad, entry(2)])
+        with pytest.raises(TypeError):
+            store.flush(timeout=5)
+        assert store._writer is not None and store._writer.is_alive()
+        store.append("bulk", entry(3))
+        assert store.flush(timeout=5)
+        assert [item.payload["ioa"] for item in store.read("bulk")] == [1, 2, 3]
+    finally:
+        store.close()
+
+
+def test_reads_do_not_hang_when_the_writer_has_stopped(tmp_path):
+    store = ProtocolStore(tmp_path, buffered=True, flush_interval=60)
+
+    def broken(pending, *, force):
+        raise RuntimeError("disk on fire")
+
+    store._write_group = broken
+    store.append("bulk", entry(1))
+    with pytest.raises(RuntimeError, match="disk on fire"):
+        store.flush(timeout=5)
+    assert not store._writer.is_alive()
+    assert store.flush(timeout=5) is True
+    assert list(store.read("bulk")) == []
+    # Appends fall back to direct writes.
+    store.append("bulk", entry(2))
+    assert [item.payload["ioa"] for item in store.read("bulk")] == [2]
+    store.close()
+
+
+def test_read_filters_by_time_result_and_page(tmp_path):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    store = ProtocolStore(tmp_path)
+    store.append_many(
+        "bulk",
+        [
+            ProtocolEntry(
+                timestamp=start + timedelta(seconds=index),
+                result="ok" if index % 3 else "timeout",
+                payload={"n": index},
+            )
+            for index in range(1000)
+        ],
+    )
+
+    def numbers(**kwargs):
+        return [entry.payload["n"] for entry in store.read("bulk", **kwargs)]
+
+    assert numbers(since=start + timedelta(seconds=995)) == [995, 996, 997, 998, 999]
+    assert numbers(since=start + timedelta(seconds=10), until=start + timedelta(seconds=12)) == [
+        10,
+        11,
+        12,
+    ]
+    assert numbers(result="timeout", offset=2, limit=3) == [6, 9, 12]
+    assert numbers(since=start + timedelta(seconds=2000)) == []
+    assert numbers(limit=0) == []
+    assert len(numbers()) == 1000
+
+
+def test_result_filter_ignores_nested_result_keys(tmp_path):
+    store = ProtocolStore(tmp_path)
+    store.append_many(
+        "steps",
+        [
+            ProtocolEntry(
+                timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                result="failed",
+                payload={"n": 0, "step": {"result": "ok"}},
+            ),
+            ProtocolEntry(
+                timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                result="ok",
+                payload={"n": 1, "step": {"result": "failed"}},
+            ),
+        ],
+    )
+    assert [entry.payload["n"] for entry in store.read("steps", result="ok")] == [1]
+    assert [entry.payload["n"] for entry in store.read("steps", result="failed")] == [0]
+
+
+def test_catalogue_is_updated_on_append_and_rescanned_on_external_change(tmp_path):
+    store = ProtocolStore(tmp_path)
+    store.append_many("bulk", [entry(1), entry(2)])
+    scans = []
+    scan = store._catalogue._scan
+    store._catalogue._scan = lambda name: scans.append(name) or scan(name)
+
+    (listed,) = store.list_protocols()
+    assert (listed.path, listed.entries, listed.results) == ("bulk.jsonl", 2, {"ok": 2})
+    store.append("bulk", ProtocolEntry(timestamp=datetime(2025, 1, 1), result="nak", payload={}))
+    store.append("single", entry(3))
+    bulk, single = store.list_protocols()
+    assert (bulk.entries, bulk.results, single.entries) == (3, {"ok": 2, "nak": 1}, 1)
+    assert bulk.first_timestamp == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert bulk.size_bytes == (tmp_path / "bulk.jsonl").stat().st_size
+    assert scans == ["bulk"]
+
+    (tmp_path / "external.jsonl").write_bytes((tmp_path / "single.jsonl").read_bytes())
+    assert [item.path for item in store.list_protocols()] == [
+        "bulk.jsonl",
+        "external.jsonl",
+        "single.jsonl",
+    ]
+    assert scans == ["bulk", "external"]
+
+    # Another process appending to a known protocol changes its size.
+    with (tmp_path / "bulk.jsonl").open("ab") as file:
+        file.write((tmp_path / "single.jsonl").read_bytes())
+    bulk = store.list_protocols()[0]
+    assert (bulk.entries, bulk.results) == (4, {"ok": 3, "nak": 1})
+    assert scans == ["bulk", "external", "bulk"]
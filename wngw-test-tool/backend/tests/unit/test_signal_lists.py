@@ -5,8 +5,7 @@ from __future__ import annotations
 import io
 
 from openpyxl import Workbook
-
-from wngw_app.services.signal_lists import SupportsUploadFile, SignalListError, read_signal_list
+from wngw_app.services.signal_lists import SignalListError, SupportsUploadFile, read_signal_list
 
 
 class DummyUploadFile:
@@ -0,0 +1,64 @@
+"""Tests for the streaming APDU decoder."""
+
+from __future__ import annotations
+
+import pytest
+from iec104 import StreamingAPDUDecoder
+from iec104.errors import FrameError
+from iec104.spec.constants import MAX_FRAME_LENGTH
+
+I_FRAME = bytes.fromhex("680e00000000010103000100010000" "01")
+S_FRAME = bytes.fromhex("680401000200")
+
+
+def test_feed_returns_views_for_complete_frames():
+    data = I_FRAME + S_FRAME
+    decoder = StreamingAPDUDecoder()
+    frames = decoder.feed(data)
+    assert len(frames) == 2
+    apci, asdu = frames[0]
+    assert isinstance(apci, memoryview)
+    assert bytes(apci) == I_FRAME[:6]
+    assert bytes(asdu) == I_FRAME[6:]
+    assert asdu.obj is data
+    assert frames[1] == (memoryview(S_FRAME), None)
+    assert decoder.pending == 0
+
+
+def test_feed_reassembles_frames_split_across_chunks():
+    stream = (I_FRAME + S_FRAME) * 50
+    decoder = StreamingAPDUDecoder()
+    collected = []
+    for start in range(0, len(stream), 7):
+        collected.extend(
+            (bytes(apci), None if asdu is None else bytes(asdu))
+            for apci, asdu in decoder.feed(memoryview(stream)[start : start + 7])
+        )
+    assert len(collected) == 100
+    assert collected[0] == (I_FRAME[:6], I_FRAME[6:])
+    assert collected[-1] == (S_FRAME, None)
+    assert decoder.pending == 0
+
+
+def test_feed_rejects_garbage_and_overflow():
+    decoder = StreamingAPDUDecoder()
+    with pytest.raises(FrameError):
+        decoder.feed(b"\x00\x04\x01\x00\x00\x00")
+    with pytest.raises(FrameError):
+        StreamingAPDUDecoder().feed(b"\x68\xff")
+
+    with pytest.raises(ValueError):
+        StreamingAPDUDecoder(capacity=MAX_FRAME_LENGTH * 2 - 1)
+
+
+def test_minimum_capacity_carries_a_full_frame_and_a_partial_one():
+    frame = b"\x68\xfd" + bytes(range(253))
+    decoder = StreamingAPDUDecoder(capacity=MAX_FRAME_LENGTH * 2)
+    assert decoder.feed(frame[:100]) == []
+    # Completes the carried frame and leaves all but the last byte of the next one.
+    frames = decoder.feed(frame[100:] + frame[:-1])
+    assert [bytes(apci) + bytes(asdu) for apci, asdu in frames] == [frame]
+    assert decoder.pending == MAX_FRAME_LENGTH - 1
+    frames = decoder.feed(frame[-1:])
+    assert [bytes(apci) + bytes(asdu) for apci, asdu in frames] == [frame]
+    assert decoder.pending == 0
@@ -5,19 +5,12 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from fastapi import APIRouter, Depends
+
 from ..config import AppSettings, get_settings
 from ..domain.models import PartnerSettings
 
-# Placeholder router implementations; actual FastAPI endpoints require FastAPI package.
-class Router:
-    def get(self, *_args, **_kwargs):  # pragma: no cover - placeholder for FastAPI
-        return lambda func: func
-
-    def put(self, *_args, **_kwargs):  # pragma: no cover - placeholder
-        return lambda func: func
-
-
-router = Router()
+router = APIRouter()
 
 
 def _partner_file(settings: AppSettings) -> Path:
@@ -25,8 +18,7 @@ def _partner_file(settings: AppSettings) -> Path:
 
 
 @router.get("/partners")
-def get_partners(settings: AppSettings | None = None) -> PartnerSettings:
-    settings = settings or get_settings()
+def get_partners(settings: AppSettings = Depends(get_settings)) -> PartnerSettings:
     path = _partner_file(settings)
     if not path.exists():
         return PartnerSettings(
@@ -42,8 +34,9 @@ def get_partners(settings: AppSettings | None = None) -> PartnerSettings:
 
 
 @router.put("/partners")
-def put_partners(payload: PartnerSettings, settings: AppSettings | None = None) -> PartnerSettings:
-    settings = settings or get_settings()
+def put_partners(
+    payload: PartnerSettings, settings: AppSettings = Depends(get_settings)
+) -> PartnerSettings:
     path = _partner_file(settings)
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(payload.to_dict(), indent=2), encoding="utf-8")
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import PurePath
+from typing import Any, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel, Field
 
 from ..config import AppSettings, get_settings
 from ..domain.models import ProtocolListEntry
-from ..services.iec104 import factory
+from ..services.iec104.adapter_lib import IEC104LibServerAdapterImpl
+from ..services.iec104.contract import BulkCommand
+from ..services.iec104.pool import ClientPool
 from ..services.protocol_store import ProtocolStore
+from ..services.signal_lists import SignalListError, read_signal_list_ioas
+from ..services.simulator import SimulatorConfig, StationSimulator, TrafficProfile
 
 router = APIRouter()
 
@@ -21,39 +29,163 @@ class SingleCommandPayload(BaseModel):
     ca: int = Field(ge=0, le=65535)
     ioa: int = Field(ge=0, le=16777215)
     value: bool
+    timeout: float = Field(default=5.0, gt=0, le=60)
 
 
-async def _protocol_store(settings: AppSettings = Depends(get_settings)) -> ProtocolStore:
-    return ProtocolStore(settings.logs_dir)
+class BulkCommandItem(BaseModel):
+    ca: int = Field(ge=0, le=65535)
+    ioa: int = Field(ge=0, le=16777215)
+    value: bool
+
+
+class BulkCommandPayload(BaseModel):
+    host: str
+    port: int = Field(ge=1, le=65535)
+    commands: list[BulkCommandItem] = Field(min_length=1, max_length=10000)
+    timeout: float = Field(default=5.0, gt=0, le=60)
+
+
+class TrafficProfilePayload(BaseModel):
+    type: Literal["M_SP_NA_1", "M_SP_TB_1", "M_ME_NC_1"]
+    rate: float = Field(default=1.0, ge=0, le=100000)
+    objects_per_asdu: int = Field(default=1, ge=1, le=127)
+    burst_size: int = Field(default=0, ge=0, le=100000)
+    burst_interval: float = Field(default=0.0, ge=0)
+
+
+class SimulatorPayload(BaseModel):
+    bind_ip: str = "0.0.0.0"
+    port: int = Field(default=2404, ge=1, le=65535)
+    # ``path`` returned by the signal list upload.
+    signal_list: str
+    common_address: int = Field(default=1, ge=0, le=65535)
+    profiles: list[TrafficProfilePayload] = Field(default_factory=list)
+    command_delay: float = Field(default=0.0, le=60)
+
+
+def _protocol_store(request: Request) -> ProtocolStore:
+    return request.app.state.protocol_store
+
+
+def _client_pool(request: Request) -> ClientPool:
+    return request.app.state.client_pool
 
 
 @router.post("/single-command")
 async def post_single_command(
     payload: SingleCommandPayload,
-    request: Request,
-    store: ProtocolStore = Depends(_protocol_store),
+    pool: ClientPool = Depends(_client_pool),
 ) -> dict[str, Any]:
-    live_bus = request.app.state.live_bus
-    client = factory.create_client(live_bus, store)
-    await client.connect(payload.host, payload.port)
     try:
-        await client.send_single_command(payload.ca, payload.ioa, payload.value)
-        reply = await client.recv_once(timeout=0.1)
+        async with pool.acquire(payload.host, payload.port) as client:
+            result = await client.send_confirmed_command(
+                payload.ca, payload.ioa, payload.value, timeout=payload.timeout
+            )
     except TimeoutError as exc:
         raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=str(exc)) from exc
     except ValueError as exc:
-        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
-    finally:
-        await client.close()
-    response = {"status": "ok"}
-    if reply is not None:
-        response["reply"] = "received"
-    return response
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+        ) from exc
+    return {"status": "ok", "reply": result.status, "latency_ms": result.latency_ms}
+
+
+@router.post("/bulk-commands")
+async def post_bulk_commands(
+    payload: BulkCommandPayload,
+    pool: ClientPool = Depends(_client_pool),
+) -> dict[str, Any]:
+    commands = [BulkCommand(item.ca, item.ioa, item.value) for item in payload.commands]
+    try:
+        async with pool.acquire(payload.host, payload.port) as client:
+            results = await client.send_bulk_commands(commands, timeout=payload.timeout)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+        ) from exc
+    return {
+        "status": "ok",
+        "confirmed": sum(result.status == "confirmed" for result in results),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def _simulator_status(simulator: Optional[StationSimulator]) -> dict[str, Any]:
+    if simulator is None:
+        return {"running": False}
+    return {"running": simulator.running, "stats": asdict(simulator.stats)}
+
+
+@router.post("/simulator/start")
+async def start_simulator(
+    payload: SimulatorPayload,
+    request: Request,
+    settings: AppSettings = Depends(get_settings),
+) -> dict[str, Any]:
+    state = request.app.state
+    if getattr(state, "simulator", None) is not None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Simulator is running")
+    path = settings.uploads_dir / PurePath(payload.signal_list).name
+    try:
+        ioas = read_signal_list_ioas(path)
+        config = SimulatorConfig(
+            ioas=ioas,
+            profiles=[TrafficProfile(**profile.model_dump()) for profile in payload.profiles],
+            common_address=payload.common_address,
+            command_delay=payload.command_delay,
+        )
+    except (SignalListError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+        ) from exc
+    simulator = StationSimulator(IEC104LibServerAdapterImpl(state.live_bus), config)
+    await simulator.start(payload.bind_ip, payload.port)
+    state.simulator = simulator
+    return {"status": "ok", **_simulator_status(simulator)}
+
+
+@router.post("/simulator/stop")
+async def stop_simulator(request: Request) -> dict[str, Any]:
+    simulator: Optional[StationSimulator] = getattr(request.app.state, "simulator", None)
+    if simulator is not None:
+        await simulator.stop()
+        request.app.state.simulator = None
+    return {"status": "ok", **_simulator_status(simulator)}
+
+
+@router.get("/simulator")
+async def get_simulator(request: Request) -> dict[str, Any]:
+    return _simulator_status(getattr(request.app.state, "simulator", None))
 
 
 @router.get("/protocols", response_model=list[ProtocolListEntry])
-async def list_protocols(store: ProtocolStore = Depends(_protocol_store)) -> list[ProtocolListEntry]:
-    return store.list_protocols()
+async def list_protocols(
+    store: ProtocolStore = Depends(_protocol_store),
+) -> list[ProtocolListEntry]:
+    # Listing waits for the buffered writer; keep that off the event loop.
+    return await asyncio.to_thread(store.list_protocols)
+
+
+@router.get("/protocols/{name}")
+async def read_protocol(
+    name: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    result: Optional[str] = None,
+    limit: int = Query(default=1000, ge=0, le=100_000),
+    offset: int = Query(default=0, ge=0),
+    store: ProtocolStore = Depends(_protocol_store),
+) -> list[dict[str, Any]]:
+    if PurePath(name).name != name or name.startswith("."):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Unknown protocol")
+
+    def read() -> list[dict[str, Any]]:
+        entries = store.read(
+            name, since=since, until=until, result=result, limit=limit, offset=offset
+        )
+        return [entry.to_dict() for entry in entries]
+
+    return await asyncio.to_thread(read)
 
 
 __all__ = ["router"]
@@ -2,26 +2,122 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+import struct
 
-from ..domain.events import IEC104FrameEvent
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
 
+from ..config import get_settings
+from ..domain.events import IEC104FrameEvent
+from ..services.live_stream import LiveBatch, LiveFilter, LiveStream
+from ..services.livebus import Subscription
 
-class Router:
-    def websocket(self, *_args, **_kwargs):  # pragma: no cover - placeholder
-        return lambda func: func
+logger = logging.getLogger(__name__)
 
+router = APIRouter()
 
-router = Router()
+# Binary batch: dropped count and next sequence number, then per event a length
+# prefix and the ``to_binary`` octets.
+_BATCH_HEADER = struct.Struct("<IQ")
+_EVENT_LENGTH = struct.Struct("<H")
 
 
 def serialize_event(event: IEC104FrameEvent) -> str:
-    return json.dumps(event.to_dict())
+    return event.to_json()
+
+
+def serialize_event_binary(event: IEC104FrameEvent) -> bytes:
+    return event.to_binary()
+
+
+def serialize_batch(batch: LiveBatch) -> str:
+    """JSON batch message built from the cached per-event JSON text."""
+
+    events = ",".join(serialize_event(event) for event in batch.events)
+    return (
+        f'{{"type":"batch","dropped":{batch.dropped},"next_seq":{batch.next_seq},'
+        f'"events":[{events}]}}'
+    )
+
+
+def serialize_batch_binary(batch: LiveBatch) -> bytes:
+    parts = [_BATCH_HEADER.pack(batch.dropped, batch.next_seq)]
+    for event in batch.events:
+        data = serialize_event_binary(event)
+        parts.append(_EVENT_LENGTH.pack(len(data)))
+        parts.append(data)
+    return b"".join(parts)
+
+
+async def _receive_filters(websocket: WebSocket, stream: LiveStream) -> None:
+    """Apply ``{"filter": {...}}`` messages sent by the client."""
+
+    while True:
+        message = await websocket.receive_text()
+        try:
+            data = json.loads(message)
+            stream.filter = LiveFilter.from_dict(data.get("filter", {}))
+        except (AttributeError, TypeError, ValueError) as exc:
+            await websocket.send_text(json.dumps({"type": "error", "detail": str(exc)}))
+
+
+async def _send_batches(websocket: WebSocket, stream: LiveStream, binary: bool) -> None:
+    async for batch in stream:
+        if binary:
+            await websocket.send_bytes(serialize_batch_binary(batch))
+        else:
+            await websocket.send_text(serialize_batch(batch))
+
+
+def _subscribe(websocket: WebSocket) -> Subscription:
+    """Subscribe with the optional ``since_seq`` or ``last_seconds`` backfill."""
+
+    params = websocket.query_params
+    since_seq = params.get("since_seq")
+    last_seconds = params.get("last_seconds")
+    return websocket.app.state.live_bus.subscribe(
+        since_seq=int(since_seq) if since_seq is not None else None,
+        last_seconds=float(last_seconds) if last_seconds is not None else None,
+    )
 
 
 @router.websocket("/ws/live")
-def websocket_live(websocket) -> None:  # pragma: no cover - placeholder
-    raise NotImplementedError("WebSocket requires FastAPI runtime")
+async def websocket_live(websocket: WebSocket) -> None:
+    settings = get_settings()
+    try:
+        subscription = _subscribe(websocket)
+    except (RuntimeError, ValueError) as exc:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(exc))
+        return
+    await websocket.accept()
+    stream = LiveStream(
+        subscription,
+        interval=settings.live_batch_interval,
+        max_batch=settings.live_batch_max,
+    )
+    binary = websocket.query_params.get("format") == "binary"
+    tasks = {
+        asyncio.create_task(_receive_filters(websocket, stream)),
+        asyncio.create_task(_send_batches(websocket, stream, binary)),
+    }
+    try:
+        done, _pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            exc = task.exception()
+            if exc is not None and not isinstance(exc, WebSocketDisconnect):
+                logger.warning("live stream failed", extra={"error": str(exc)})
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
 
-__all__ = ["router", "serialize_event"]
+__all__ = [
+    "router",
+    "serialize_batch",
+    "serialize_batch_binary",
+    "serialize_event",
+    "serialize_event_binary",
+]
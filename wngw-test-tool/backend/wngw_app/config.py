@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 
+from .services.protocol_store import Durability, RecordFormat
+
 
 @dataclass
 class AppSettings:
@@ -17,6 +19,19 @@ class AppSettings:
     uploads_dir: Path = Path("data/uploads")
     parsed_dir: Path = Path("data/parsed")
     logs_dir: Path = Path("data/logs/backend")
+    live_batch_interval: float = 0.05
+    live_batch_max: int = 500
+    live_history_events: int = 100_000
+    live_history_bytes: int = 32 * 1024 * 1024
+    protocol_durability: Durability = "flush"
+    protocol_flush_interval: float = 0.05
+    protocol_flush_entries: int = 512
+    protocol_segment_bytes: int = 64 * 1024 * 1024
+    protocol_segment_seconds: float = 24 * 3600
+    protocol_index_interval: int = 256
+    # Format of new protocols; existing ones keep theirs. "binary" is opt-in,
+    # protocol_convert migrates existing JSON line protocols.
+    protocol_format: RecordFormat = "jsonl"
 
     def ensure_directories(self) -> None:
         for directory in (self.data_dir, self.uploads_dir, self.parsed_dir, self.logs_dir):
@@ -2,23 +2,40 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-from datetime import datetime
+import json
+import struct
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Any, Literal, Optional
 
 Role = Literal["client", "server"]
 Direction = Literal["tx", "rx"]
 APCIType = Literal["I", "S", "U"]
 
+FRAME_EVENT_KIND = "iec104.frame"
 
-@dataclass
+# Binary event layout: version, role, dir, APCI type, ts (epoch microseconds),
+# vs, vr, type id, cause, ca, ioa (-1 if absent) and the lengths of the UTF-8
+# kind, JSON payload and raw fields that follow (raw 0xFFFF if absent).
+_BINARY = struct.Struct("<BBBBqiiBBHiBHH")
+_BINARY_VERSION = 1
+_NO_RAW = 0xFFFF
+_ROLES: tuple[Role, ...] = ("client", "server")
+_DIRECTIONS: tuple[Direction, ...] = ("tx", "rx")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(slots=True)
 class APCIMetadata:
     type: APCIType
     vs: int = -1
     vr: int = -1
 
+    def to_dict(self) -> dict[str, Any]:
+        return {"type": self.type, "vs": self.vs, "vr": self.vr}
+
 
-@dataclass
+@dataclass(slots=True)
 class ASDUDescriptor:
     typeId: int
     cause: int
@@ -26,8 +43,17 @@ class ASDUDescriptor:
     ioa: Optional[int]
     payload: dict[str, Any]
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "typeId": self.typeId,
+            "cause": self.cause,
+            "ca": self.ca,
+            "ioa": self.ioa,
+            "payload": dict(self.payload),
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class IEC104FrameEvent:
     kind: str
     role: Role
@@ -36,8 +62,93 @@ class IEC104FrameEvent:
     apci: APCIMetadata
     asdu: ASDUDescriptor
     raw: Optional[str] = None
+    # Encodings are cached on first use and shared by every subscriber; events
+    # are treated as immutable once published.
+    _json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _binary: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
-        data = asdict(self)
-        data["ts"] = self.ts.isoformat()
-        return data
+        return {
+            "kind": self.kind,
+            "role": self.role,
+            "dir": self.dir,
+            "ts": self.ts.isoformat(),
+            "apci": self.apci.to_dict(),
+            "asdu": self.asdu.to_dict(),
+            "raw": self.raw,
+        }
+
+    def to_json(self) -> str:
+        """JSON text of ``to_dict``, encoded once per event."""
+
+        if self._json is None:
+            self._json = json.dumps(self.to_dict())
+        return self._json
+
+    def to_binary(self) -> bytes:
+        """Compact binary encoding, decoded by ``from_binary``."""
+
+        if self._binary is None:
+            kind = self.kind.encode()
+            payload = json.dumps(self.asdu.payload, separators=(",", ":")).encode()
+            raw = self.raw.encode() if self.raw is not None else b""
+            delta = self.ts - _EPOCH
+            header = _BINARY.pack(
+                _BINARY_VERSION,
+                _ROLES.index(self.role),
+                _DIRECTIONS.index(self.dir),
+                ord(self.apci.type),
+                (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds,
+                self.apci.vs,
+                self.apci.vr,
+                self.asdu.typeId,
+                self.asdu.cause,
+                self.asdu.ca,
+                -1 if self.asdu.ioa is None else self.asdu.ioa,
+                len(kind),
+                len(payload),
+                _NO_RAW if self.raw is None else len(raw),
+            )
+            self._binary = b"".join((header, kind, payload, raw))
+        return self._binary
+
+    @classmethod
+    def from_binary(cls, data: bytes | bytearray | memoryview) -> "IEC104FrameEvent":
+        (
+            version,
+            role,
+            direction,
+            apci_type,
+            micros,
+            vs,
+            vr,
+            type_id,
+            cause,
+            ca,
+            ioa,
+            kind_size,
+            payload_size,
+            raw_size,
+        ) = _BINARY.unpack_from(data)
+        if version != _BINARY_VERSION:
+            raise ValueError(f"Unsupported binary event version {version}")
+        view = memoryview(data)
+        position = _BINARY.size
+        kind = str(view[position : position + kind_size], "utf-8")
+        position += kind_size
+        payload = json.loads(bytes(view[position : position + payload_size]))
+        position += payload_size
+        raw = None if raw_size == _NO_RAW else str(view[position : position + raw_size], "utf-8")
+        return cls(
+            kind=kind,
+            role=_ROLES[role],
+            dir=_DIRECTIONS[direction],
+            ts=datetime.fromtimestamp(micros // 1_000_000, timezone.utc).replace(
+                microsecond=micros % 1_000_000
+            ),
+            apci=APCIMetadata(type=chr(apci_type), vs=vs, vr=vr),  # type: ignore[arg-type]
+            asdu=ASDUDescriptor(
+                typeId=type_id, cause=cause, ca=ca, ioa=None if ioa < 0 else ioa, payload=payload
+            ),
+            raw=raw,
+        )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
@@ -67,8 +67,15 @@ class ProtocolListEntry:
     path: str
     created_at: datetime
     description: Optional[str] = None
+    entries: int = 0
+    first_timestamp: Optional[datetime] = None
+    last_timestamp: Optional[datetime] = None
+    size_bytes: int = 0
+    results: dict[str, int] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         data = asdict(self)
-        data["created_at"] = self.created_at.isoformat()
+        for key in ("created_at", "first_timestamp", "last_timestamp"):
+            if data[key] is not None:
+                data[key] = data[key].isoformat()
         return data
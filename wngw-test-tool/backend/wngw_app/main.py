@@ -12,7 +12,10 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from .api import routes_admin, routes_signal_lists, routes_tests, ws_live
 from .config import get_settings
+from .services.iec104.pool import ClientPool
+from .services.live_history import LiveHistory
 from .services.livebus import LiveBus
+from .services.protocol_store import ProtocolStore
 
 logger = logging.getLogger(__name__)
 
@@ -21,9 +24,34 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Manage application startup and shutdown."""
 
-    live_bus = LiveBus()
+    settings = get_settings()
+    live_bus = LiveBus(
+        history=LiveHistory(
+            max_events=settings.live_history_events, max_bytes=settings.live_history_bytes
+        )
+    )
     app.state.live_bus = live_bus
+    protocol_store = ProtocolStore(
+        settings.logs_dir,
+        buffered=True,
+        durability=settings.protocol_durability,
+        flush_interval=settings.protocol_flush_interval,
+        flush_entries=settings.protocol_flush_entries,
+        segment_bytes=settings.protocol_segment_bytes,
+        segment_seconds=settings.protocol_segment_seconds,
+        index_interval=settings.protocol_index_interval,
+        record_format=settings.protocol_format,
+    )
+    app.state.protocol_store = protocol_store
+    client_pool = ClientPool(live_bus, protocol_store)
+    client_pool.start()
+    app.state.client_pool = client_pool
+    app.state.simulator = None
     tasks: set[asyncio.Task[None]] = set()
+    # Build the protocol catalogue in the background so startup is not delayed.
+    catalogue = asyncio.create_task(asyncio.to_thread(protocol_store.list_protocols))
+    tasks.add(catalogue)
+    catalogue.add_done_callback(tasks.discard)
 
     try:
         yield
@@ -31,6 +59,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         logger.info("shutting down", extra={"component": "lifespan"})
         for task in tasks:
             task.cancel()
+        if app.state.simulator is not None:
+            await app.state.simulator.stop()
+        await client_pool.close()
+        # Drain queued protocol entries after the last client is gone.
+        await asyncio.to_thread(protocol_store.close)
         await live_bus.close()
 
 
@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections import defaultdict, deque
 from datetime import datetime, timezone
-from typing import Awaitable, Callable, Optional
+from typing import Any, Awaitable, Callable, Deque, Literal, Optional, Sequence
 
 from iec104 import (
+    ASDU,
     ASDUHeader,
     CauseOfTransmission,
+    CP56Time2a,
     IEC104Client,
     IEC104Server,
     IEC104Session,
@@ -18,22 +22,60 @@ from iec104 import (
     SingleCommandASDU,
     TypeID,
 )
+from iec104.errors import DecodeError, SessionClosedError
+from iec104.link.tcp import Transport
 
-from ...domain.events import APCIMetadata, ASDUDescriptor, IEC104FrameEvent
+from ...domain.events import FRAME_EVENT_KIND, APCIMetadata, ASDUDescriptor, IEC104FrameEvent
 from ...domain.models import ProtocolEntry
 from ..livebus import LiveBus
 from ..protocol_store import ProtocolStore
-from .contract import IEC104ClientAdapter, IEC104ServerAdapter
+from .contract import BulkCommand, CommandResult, IEC104ClientAdapter, IEC104ServerAdapter
 
 logger = logging.getLogger(__name__)
 
+RxPolicy = Literal["drop", "block"]
+# Positive/negative confirmation and its perf_counter arrival time.
+_Confirmation = tuple[bool, float]
+
+
+def _payload_value(value: Any) -> Any:
+    if isinstance(value, CP56Time2a):
+        if value.invalid:
+            return None
+        try:
+            return value.to_datetime().isoformat()
+        except DecodeError:
+            # Malformed time tags are shown like invalid ones.
+            return None
+    return value
+
+
+def _single_command(ca: int, ioa: int, value: bool) -> SingleCommandASDU:
+    header = ASDUHeader(
+        type_id=TypeID.C_SC_NA_1,
+        sequence=False,
+        vsq_number=1,
+        cause=CauseOfTransmission.ACTIVATION,
+        negative_confirm=False,
+        test=False,
+        originator_address=0,
+        common_address=ca,
+        oa=None,
+    )
+    return SingleCommandASDU(
+        header=header,
+        information_objects=(SingleCommand(ioa=ioa, state=value, qualifier=0),),
+    )
+
 
 def _asdu_to_descriptor(asdu: object) -> ASDUDescriptor:
     if isinstance(asdu, SingleCommandASDU):
         ioa = asdu.information_objects[0].ioa if asdu.information_objects else None
         payload = {
             "value": asdu.information_objects[0].state if asdu.information_objects else None,
-            "qualifier": asdu.information_objects[0].qualifier if asdu.information_objects else None,
+            "qualifier": asdu.information_objects[0].qualifier
+            if asdu.information_objects
+            else None,
         }
         return ASDUDescriptor(
             typeId=int(asdu.header.type_id),
@@ -42,45 +84,87 @@ def _asdu_to_descriptor(asdu: object) -> ASDUDescriptor:
             ioa=ioa,
             payload=payload,
         )
+    if isinstance(asdu, ASDU) and asdu.information_objects:
+        # Monitor direction: describe the first object, its fields become the payload.
+        first = asdu.information_objects[0]
+        payload = {
+            name: _payload_value(getattr(first, name)) for name in first.__slots__ if name != "ioa"
+        }
+        if len(asdu.information_objects) > 1:
+            payload["objects"] = len(asdu.information_objects)
+        return ASDUDescriptor(
+            typeId=int(asdu.header.type_id),
+            cause=int(asdu.header.cause),
+            ca=asdu.header.common_address,
+            ioa=first.ioa,
+            payload=payload,
+        )
     raise NotImplementedError("Unsupported ASDU type")
 
 
 class IEC104LibClientAdapterImpl(IEC104ClientAdapter):
-    """IEC-104 client wrapper."""
+    """IEC-104 client wrapper.
 
-    def __init__(self, live_bus: LiveBus, protocol_store: ProtocolStore) -> None:
+    After ``connect`` a background task drains the session continuously,
+    publishes every received ASDU and calls the ``on_rx`` callback. Received
+    ASDUs are also kept for ``recv_once`` in a queue of ``rx_queue_size``
+    entries. When it is full, ``rx_policy="drop"`` discards the oldest entry
+    (counted in ``rx_dropped``). ``"block"`` stops reading, and the session
+    then withholds acknowledgements so the peer pauses after ``k`` frames.
+    """
+
+    def __init__(
+        self,
+        live_bus: LiveBus,
+        protocol_store: ProtocolStore,
+        *,
+        transport: Transport = "tcp",
+        rx_queue_size: int = 1024,
+        rx_policy: RxPolicy = "drop",
+    ) -> None:
+        if rx_queue_size < 1:
+            raise ValueError("rx_queue_size must be at least 1")
+        if rx_policy not in ("drop", "block"):
+            raise ValueError(f"Unknown rx_policy {rx_policy!r}")
         self._live_bus = live_bus
         self._protocol_store = protocol_store
+        self._transport: Transport = transport
         self._client: Optional[IEC104Client] = None
         self._rx_callback: Optional[Callable[[IEC104FrameEvent], Awaitable[None]]] = None
+        self._rx_queue_size = rx_queue_size
+        self._rx_policy: RxPolicy = rx_policy
+        self._rx_queue: asyncio.Queue[object] = asyncio.Queue(rx_queue_size)
+        self._rx_task: Optional[asyncio.Task[None]] = None
+        # Outstanding bulk activations per (ca, ioa) in send order.
+        self._pending: defaultdict[tuple[int, int], Deque[asyncio.Future[_Confirmation]]] = (
+            defaultdict(deque)
+        )
+        self.rx_dropped = 0
 
     async def connect(self, host: str, port: int) -> None:
         logger.info("connecting", extra={"role": "client", "host": host, "port": port})
-        self._client = await IEC104Client.connect(host, port, SessionParameters())
+        params = SessionParameters(max_pending_rx=self._rx_queue_size)
+        self._client = await IEC104Client.connect(host, port, params, transport=self._transport)
+        self._rx_queue = asyncio.Queue(self._rx_queue_size)
+        self._rx_task = asyncio.get_running_loop().create_task(self._receive(self._client))
+
+    @property
+    def connected(self) -> bool:
+        return self._client is not None and not self._client.session.closed
 
     async def close(self) -> None:
         if self._client is not None:
             await self._client.close()
             self._client = None
+        if self._rx_task is not None:
+            self._rx_task.cancel()
+            await asyncio.gather(self._rx_task, return_exceptions=True)
+            self._rx_task = None
 
     async def send_single_command(self, ca: int, ioa: int, value: bool) -> None:
         if self._client is None:
             raise RuntimeError("Client not connected")
-        header = ASDUHeader(
-            type_id=TypeID.C_SC_NA_1,
-            sequence=False,
-            vsq_number=1,
-            cause=CauseOfTransmission.ACTIVATION,
-            negative_confirm=False,
-            test=False,
-            originator_address=0,
-            common_address=ca,
-            oa=None,
-        )
-        command = SingleCommandASDU(
-            header=header,
-            information_objects=(SingleCommand(ioa=ioa, state=value, qualifier=0),),
-        )
+        command = _single_command(ca, ioa, value)
         await self._client.send_asdu(command)
         await self._emit_event("tx", command)
         entry = ProtocolEntry(
@@ -90,22 +174,209 @@ class IEC104LibClientAdapterImpl(IEC104ClientAdapter):
         )
         self._protocol_store.append("single-command", entry)
 
+    async def send_bulk_commands(
+        self, commands: Sequence[BulkCommand], timeout: float = 5.0
+    ) -> list[CommandResult]:
+        """Send ``commands`` pipelined over the session and await their confirmations.
+
+        Activations are written back to back; the session only blocks when the
+        k window is full. Each ACT_CON is matched to the oldest outstanding
+        activation with the same CA and IOA. ``timeout`` covers sending and
+        confirming: commands not sent or not confirmed by then report
+        ``"timeout"``. If the session closes first, the commands still
+        outstanding report ``"closed"`` at once. Matched confirmations are not
+        queued for ``recv_once``.
+        """
+
+        results = await self._execute(commands, timeout)
+        now = datetime.now(timezone.utc)
+        self._protocol_store.append_many(
+            "bulk-command",
+            (
+                ProtocolEntry(
+                    timestamp=now,
+                    result=f"bulk-command-{result.status}",
+                    payload={
+                        "ca": result.ca,
+                        "ioa": result.ioa,
+                        "value": result.value,
+                        "latency_ms": result.latency_ms,
+                    },
+                )
+                for result in results
+            ),
+        )
+        return results
+
+    async def send_confirmed_command(
+        self, ca: int, ioa: int, value: bool, timeout: float = 5.0
+    ) -> CommandResult:
+        """Send one single command and wait for its own ACT_CON.
+
+        The confirmation is matched by CA, IOA and cause like bulk commands,
+        so unrelated or late ASDUs on a reused session are never taken for it.
+        """
+
+        (result,) = await self._execute([BulkCommand(ca, ioa, value)], timeout)
+        entry = ProtocolEntry(
+            timestamp=datetime.now(timezone.utc),
+            result=f"single-command-{result.status}",
+            payload={"ca": ca, "ioa": ioa, "value": value, "latency_ms": result.latency_ms},
+        )
+        self._protocol_store.append("single-command", entry)
+        return result
+
+    async def _execute(
+        self, commands: Sequence[BulkCommand], timeout: float
+    ) -> list[CommandResult]:
+        if self._client is None:
+            raise RuntimeError("Client not connected")
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[_Confirmation]] = []
+        sent_at: list[float] = []
+        closed = False
+        try:
+            # One deadline for sending and confirming: sends block while the
+            # k window is full, and a peer that stops acknowledging must not
+            # hold the batch forever.
+            async with asyncio.timeout(timeout):
+                for command in commands:
+                    future: asyncio.Future[_Confirmation] = loop.create_future()
+                    self._pending[(command.ca, command.ioa)].append(future)
+                    futures.append(future)
+                    asdu = _single_command(command.ca, command.ioa, command.value)
+                    sent_at.append(time.perf_counter())
+                    try:
+                        await self._client.send_asdu(asdu)
+                    except SessionClosedError as exc:
+                        future.set_exception(exc)
+                        closed = True
+                        break
+                    await self._emit_event("tx", asdu)
+                if self._rx_task is None or self._rx_task.done():
+                    # The receive loop has already failed what was pending then.
+                    self._fail_pending(SessionClosedError("Session is closed"))
+                if futures:
+                    await asyncio.wait(futures)
+        except TimeoutError:
+            pass
+        finally:
+            for command, future in zip(commands, futures):
+                if not future.done():
+                    future.cancel()
+                    waiting = self._pending.get((command.ca, command.ioa))
+                    if waiting is not None and future in waiting:
+                        waiting.remove(future)
+                        if not waiting:
+                            del self._pending[(command.ca, command.ioa)]
+
+        results: list[CommandResult] = []
+        for index, command in enumerate(commands):
+            if index >= len(futures):
+                # Never sent: the session closed or the deadline passed first.
+                status: Literal["closed", "timeout"] = "closed" if closed else "timeout"
+                results.append(CommandResult(command.ca, command.ioa, command.value, status))
+                continue
+            future = futures[index]
+            if future.cancelled():
+                results.append(CommandResult(command.ca, command.ioa, command.value, "timeout"))
+                continue
+            if future.exception() is not None:
+                results.append(CommandResult(command.ca, command.ioa, command.value, "closed"))
+                continue
+            positive, confirmed_at = future.result()
+            results.append(
+                CommandResult(
+                    command.ca,
+                    command.ioa,
+                    command.value,
+                    "confirmed" if positive else "negative",
+                    round((confirmed_at - sent_at[index]) * 1000, 3),
+                )
+            )
+        return results
+
+    async def check_alive(self) -> bool:
+        """Probe the link with a test frame; a missing answer closes it."""
+
+        if self._client is None or self._client.session.closed:
+            return False
+        alive: bool = await self._client.session.test_link()
+        return alive
+
+    def discard_rx(self) -> int:
+        """Drop ASDUs queued for ``recv_once``, e.g. late replies to earlier commands."""
+
+        discarded = 0
+        while not self._rx_queue.empty():
+            self._rx_queue.get_nowait()
+            discarded += 1
+        return discarded
+
     async def recv_once(self, timeout: float | None = None) -> object | None:
         if self._client is None:
             raise RuntimeError("Client not connected")
         try:
-            asdu = await asyncio.wait_for(self._client.recv(), timeout=timeout)
+            return await asyncio.wait_for(self._rx_queue.get(), timeout=timeout)
         except asyncio.TimeoutError:
             return None
-        await self._emit_event("rx", asdu)
-        return asdu
 
     def on_rx(self, callback: Callable[[IEC104FrameEvent], Awaitable[None]]) -> None:
         self._rx_callback = callback
 
+    async def _receive(self, client: IEC104Client) -> None:
+        queue = self._rx_queue
+        try:
+            while True:
+                asdu = await client.recv()
+                try:
+                    await self._emit_event("rx", asdu)
+                except Exception:
+                    logger.exception("rx event failed", extra={"role": "client"})
+                if self._pending and self._confirm(asdu):
+                    continue
+                if self._rx_policy == "block":
+                    await queue.put(asdu)
+                    continue
+                if queue.full():
+                    queue.get_nowait()
+                    self.rx_dropped += 1
+                queue.put_nowait(asdu)
+        except SessionClosedError:
+            logger.debug("receive loop finished", extra={"role": "client"})
+        finally:
+            # No confirmation can arrive any more; do not let callers wait out their timeout.
+            self._fail_pending(SessionClosedError("Session closed before confirmation"))
+
+    def _fail_pending(self, exc: SessionClosedError) -> None:
+        pending, self._pending = self._pending, defaultdict(deque)
+        for waiting in pending.values():
+            for future in waiting:
+                if not future.done():
+                    future.set_exception(exc)
+
+    def _confirm(self, asdu: object) -> bool:
+        """Resolve the bulk activation confirmed by ``asdu``, if any."""
+
+        if not isinstance(asdu, SingleCommandASDU) or not asdu.information_objects:
+            return False
+        header = asdu.header
+        if header.cause is not CauseOfTransmission.ACTIVATION_CON:
+            return False
+        key = (header.common_address, asdu.information_objects[0].ioa)
+        waiting = self._pending.get(key)
+        if not waiting:
+            return False
+        future = waiting.popleft()
+        if not waiting:
+            del self._pending[key]
+        future.set_result((not header.negative_confirm, time.perf_counter()))
+        return True
+
     async def _emit_event(self, direction: str, asdu: object) -> None:
         descriptor = _asdu_to_descriptor(asdu)
         event = IEC104FrameEvent(
+            kind=FRAME_EVENT_KIND,
             role="client",
             dir=direction,
             ts=datetime.now(timezone.utc),
@@ -121,15 +392,22 @@ class IEC104LibClientAdapterImpl(IEC104ClientAdapter):
 class IEC104LibServerAdapterImpl(IEC104ServerAdapter):
     """IEC-104 server wrapper."""
 
-    def __init__(self, live_bus: LiveBus) -> None:
+    def __init__(self, live_bus: LiveBus, *, transport: Transport = "tcp") -> None:
         self._live_bus = live_bus
+        self._transport: Transport = transport
         self._server: Optional[IEC104Server] = None
         self._handler: Optional[Callable[[IEC104Session, object], Awaitable[None]]] = None
 
     async def start(self, bind_ip: str, port: int) -> None:
         if self._handler is None:
             raise RuntimeError("Handler not set")
-        self._server = IEC104Server(bind_ip, port, self._wrapped_handler, SessionParameters())
+        self._server = IEC104Server(
+            bind_ip,
+            port,
+            self._wrapped_handler,
+            SessionParameters(),
+            transport=self._transport,
+        )
         await self._server.start()
         logger.info("server started", extra={"role": "server", "bind_ip": bind_ip, "port": port})
 
@@ -139,6 +417,19 @@ class IEC104LibServerAdapterImpl(IEC104ServerAdapter):
             self._server = None
             logger.info("server stopped", extra={"role": "server"})
 
+    @property
+    def sessions(self) -> tuple[IEC104Session, ...]:
+        if self._server is None:
+            return ()
+        sessions: tuple[IEC104Session, ...] = self._server.sessions
+        return sessions
+
+    @property
+    def port(self) -> Optional[int]:
+        """Bound port while started; useful when started on port 0."""
+
+        return self._server.port if self._server is not None else None
+
     def set_handler(
         self,
         handler: Callable[[IEC104Session, object], Awaitable[None]],
@@ -148,6 +439,7 @@ class IEC104LibServerAdapterImpl(IEC104ServerAdapter):
     async def _wrapped_handler(self, session: IEC104Session, asdu: object) -> None:
         await self._live_bus.publish(
             IEC104FrameEvent(
+                kind=FRAME_EVENT_KIND,
                 role="server",
                 dir="rx",
                 ts=datetime.now(timezone.utc),
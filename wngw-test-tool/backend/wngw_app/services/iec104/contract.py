@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Awaitable, Callable, Protocol
+from typing import Awaitable, Callable, Literal, Optional, Protocol, Sequence
 
 from ...domain.events import IEC104FrameEvent
 
@@ -17,13 +17,45 @@ class SingleCommandRequest:
     value: bool
 
 
+@dataclass(slots=True)
+class BulkCommand:
+    ca: int
+    ioa: int
+    value: bool
+
+
+@dataclass(slots=True)
+class CommandResult:
+    ca: int
+    ioa: int
+    value: bool
+    # "closed": the session closed before the confirmation arrived.
+    status: Literal["confirmed", "negative", "timeout", "closed"]
+    latency_ms: Optional[float] = None
+
+
 class IEC104ClientAdapter(Protocol):
     async def connect(self, host: str, port: int) -> None: ...
 
+    @property
+    def connected(self) -> bool: ...
+
     async def close(self) -> None: ...
 
     async def send_single_command(self, ca: int, ioa: int, value: bool) -> None: ...
 
+    async def send_bulk_commands(
+        self, commands: Sequence[BulkCommand], timeout: float = 5.0
+    ) -> list[CommandResult]: ...
+
+    async def send_confirmed_command(
+        self, ca: int, ioa: int, value: bool, timeout: float = 5.0
+    ) -> CommandResult: ...
+
+    async def check_alive(self) -> bool: ...
+
+    def discard_rx(self) -> int: ...
+
     async def recv_once(self, timeout: float | None = None) -> object | None: ...
 
     def on_rx(self, callback: Callable[[IEC104FrameEvent], Awaitable[None]]) -> None: ...
@@ -45,6 +77,8 @@ class LiveEventPublisher(Protocol):
 
 
 __all__ = [
+    "BulkCommand",
+    "CommandResult",
     "SingleCommandRequest",
     "IEC104ClientAdapter",
     "IEC104ServerAdapter",
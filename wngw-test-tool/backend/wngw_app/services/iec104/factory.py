@@ -2,18 +2,37 @@
 
 from __future__ import annotations
 
+from iec104.link.tcp import Transport
+
 from ..livebus import LiveBus
 from ..protocol_store import ProtocolStore
 from .adapter_lib import IEC104LibClientAdapterImpl, IEC104LibServerAdapterImpl
 from .contract import IEC104ClientAdapter, IEC104ServerAdapter
-
-
-def create_client(live_bus: LiveBus, protocol_store: ProtocolStore) -> IEC104ClientAdapter:
-    return IEC104LibClientAdapterImpl(live_bus, protocol_store)
-
-
-def create_server(live_bus: LiveBus) -> IEC104ServerAdapter:
-    return IEC104LibServerAdapterImpl(live_bus)
+from .sharded import IEC104ShardedServerAdapter
+
+
+def create_client(
+    live_bus: LiveBus,
+    protocol_store: ProtocolStore,
+    *,
+    transport: Transport = "tcp",
+) -> IEC104ClientAdapter:
+    return IEC104LibClientAdapterImpl(live_bus, protocol_store, transport=transport)
+
+
+def create_server(
+    live_bus: LiveBus,
+    *,
+    transport: Transport = "tcp",
+    workers: int = 1,
+) -> IEC104ServerAdapter:
+    """Create a server adapter; ``workers > 1`` selects the sharded TCP server."""
+
+    if workers > 1:
+        if transport != "tcp":
+            raise ValueError("Sharded server requires the tcp transport")
+        return IEC104ShardedServerAdapter(live_bus, workers=workers)
+    return IEC104LibServerAdapterImpl(live_bus, transport=transport)
 
 
 __all__ = ["create_client", "create_server"]
@@ -0,0 +1,196 @@
+"""Pool of persistent IEC-104 client sessions keyed by partner address."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Deque, Optional
+
+from iec104.link.tcp import Transport
+
+from ..livebus import LiveBus
+from ..protocol_store import ProtocolStore
+from . import factory
+from .contract import IEC104ClientAdapter
+
+logger = logging.getLogger(__name__)
+
+Partner = tuple[str, int]
+
+
+@dataclass(slots=True)
+class _PooledClient:
+    client: IEC104ClientAdapter
+    last_used: float
+
+
+@dataclass(slots=True)
+class _PartnerSlots:
+    limit: asyncio.Semaphore
+    idle: Deque[_PooledClient] = field(default_factory=deque)
+    users: int = 0
+
+
+class ClientPool:
+    """Keeps connected client adapters open between commands.
+
+    At most ``max_per_partner`` sessions exist per ``(host, port)``; further
+    ``acquire`` calls wait for a session to be released. Released sessions are
+    reused most recently used first. ASDUs still queued from the previous
+    user, such as late replies, are discarded on release and checkout. A
+    session is dropped when the block using it raises, when its connection is
+    gone, when the health check's test frame is not confirmed within t1, or
+    after ``idle_timeout`` seconds without use. The next ``acquire`` then
+    reconnects.
+    """
+
+    def __init__(
+        self,
+        live_bus: LiveBus,
+        protocol_store: ProtocolStore,
+        *,
+        max_per_partner: int = 4,
+        idle_timeout: float = 60.0,
+        check_interval: float = 5.0,
+        transport: Transport = "tcp",
+    ) -> None:
+        if max_per_partner < 1:
+            raise ValueError("max_per_partner must be at least 1")
+        self._live_bus = live_bus
+        self._protocol_store = protocol_store
+        self._max_per_partner = max_per_partner
+        self._idle_timeout = idle_timeout
+        self._check_interval = check_interval
+        self._transport: Transport = transport
+        self._partners: dict[Partner, _PartnerSlots] = {}
+        self._reaper: Optional[asyncio.Task[None]] = None
+        self._closed = False
+
+    def start(self) -> None:
+        """Start the background health check and idle eviction."""
+
+        if self._reaper is None:
+            self._reaper = asyncio.get_running_loop().create_task(self._reap_periodically())
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+            await asyncio.gather(self._reaper, return_exceptions=True)
+            self._reaper = None
+        for slots in self._partners.values():
+            while slots.idle:
+                await self._discard(slots.idle.pop().client)
+        self._partners.clear()
+
+    @asynccontextmanager
+    async def acquire(self, host: str, port: int) -> AsyncIterator[IEC104ClientAdapter]:
+        if self._closed:
+            raise RuntimeError("ClientPool is closed")
+        slots = self._partners.get((host, port))
+        if slots is None:
+            slots = self._partners[(host, port)] = _PartnerSlots(
+                asyncio.Semaphore(self._max_per_partner)
+            )
+        slots.users += 1
+        try:
+            async with slots.limit:
+                client = await self._checkout(slots, host, port)
+                try:
+                    yield client
+                except BaseException:
+                    await self._discard(client)
+                    raise
+                if self._closed or not client.connected:
+                    await self._discard(client)
+                else:
+                    client.discard_rx()
+                    slots.idle.append(_PooledClient(client, time.monotonic()))
+        finally:
+            slots.users -= 1
+
+    def stats(self) -> dict[str, int]:
+        """Idle session count per partner, keyed ``host:port``."""
+
+        return {f"{host}:{port}": len(slots.idle) for (host, port), slots in self._partners.items()}
+
+    async def evict_idle(self) -> int:
+        """Close idle sessions that expired, lost their connection or fail a link test."""
+
+        deadline = time.monotonic() - self._idle_timeout
+        evicted = 0
+        for partner, slots in list(self._partners.items()):
+            # Sessions under test are taken out of ``idle`` so ``acquire`` cannot
+            # hand them out, and each holds a permit meanwhile so ``acquire``
+            # cannot open a replacement beyond ``max_per_partner`` either.
+            candidates: list[_PooledClient] = []
+            untested: list[_PooledClient] = []
+            while slots.idle:
+                pooled = slots.idle.popleft()
+                if pooled.last_used < deadline or not pooled.client.connected:
+                    await self._discard(pooled.client)
+                    evicted += 1
+                elif slots.limit.locked():
+                    untested.append(pooled)
+                else:
+                    # Does not suspend: a permit is free.
+                    await slots.limit.acquire()
+                    candidates.append(pooled)
+            slots.idle.extend(untested)
+            try:
+                alive = await asyncio.gather(
+                    *(pooled.client.check_alive() for pooled in candidates),
+                    return_exceptions=True,
+                )
+                for pooled, ok in zip(candidates, alive):
+                    if ok is True and not self._closed:
+                        slots.idle.append(pooled)
+                    else:
+                        logger.info(
+                            "evicting unresponsive pooled session",
+                            extra={"host": partner[0], "port": partner[1]},
+                        )
+                        await self._discard(pooled.client)
+                        evicted += 1
+            finally:
+                for _ in candidates:
+                    slots.limit.release()
+            if not slots.idle and not slots.users:
+                del self._partners[partner]
+        return evicted
+
+    async def _checkout(self, slots: _PartnerSlots, host: str, port: int) -> IEC104ClientAdapter:
+        while slots.idle:
+            pooled = slots.idle.pop()
+            if pooled.client.connected:
+                pooled.client.discard_rx()
+                return pooled.client
+            await self._discard(pooled.client)
+        client = factory.create_client(
+            self._live_bus, self._protocol_store, transport=self._transport
+        )
+        logger.debug("opening pooled session", extra={"host": host, "port": port})
+        await client.connect(host, port)
+        return client
+
+    async def _reap_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._check_interval)
+            try:
+                await self.evict_idle()
+            except Exception:
+                logger.exception("pool health check failed")
+
+    @staticmethod
+    async def _discard(client: IEC104ClientAdapter) -> None:
+        try:
+            await client.close()
+        except Exception:
+            logger.debug("closing pooled session failed", exc_info=True)
+
+
+__all__ = ["ClientPool"]
@@ -0,0 +1,237 @@
+"""Multi-process IEC-104 server sharing one port via SO_REUSEPORT."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import pickle
+import socket
+import struct
+from datetime import datetime, timezone
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from multiprocessing.synchronize import Event as StopEvent
+from typing import Any, Awaitable, Callable, Optional
+
+from iec104 import IEC104Server, IEC104Session, SessionParameters, decode_asdu, encode_asdu
+from iec104.errors import IEC104Error
+from iec104.link.tcp import ASDUHandler
+
+from ...domain.events import FRAME_EVENT_KIND, APCIMetadata, IEC104FrameEvent
+from ..livebus import LiveBus
+from .adapter_lib import _asdu_to_descriptor
+from .contract import IEC104ServerAdapter
+
+logger = logging.getLogger(__name__)
+
+# One record per received ASDU: receive time (epoch seconds), ASDU length, ASDU octets.
+_RECORD = struct.Struct("<dB")
+_READY = b""
+
+
+class _ShardChannel:
+    """Worker side of the IPC pipe; records are batched once per loop iteration."""
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+        self._batch = bytearray()
+        self._flush_handle: Optional[asyncio.Handle] = None
+
+    def record(self, asdu: Any) -> None:
+        data = encode_asdu(asdu)
+        self._batch += _RECORD.pack(datetime.now(timezone.utc).timestamp(), len(data))
+        self._batch += data
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_soon(self.flush)
+
+    def flush(self) -> None:
+        self._flush_handle = None
+        if self._batch:
+            batch, self._batch = self._batch, bytearray()
+            self._connection.send_bytes(batch)
+
+
+def _run_shard(
+    index: int,
+    bind_ip: str,
+    port: int,
+    handler: ASDUHandler,
+    connection: Connection,
+    stop: StopEvent,
+) -> None:
+    """Process entry point: serve ``port`` until ``stop`` is set."""
+
+    async def serve() -> None:
+        channel = _ShardChannel(connection)
+
+        async def wrapped(session: IEC104Session, asdu: object) -> None:
+            channel.record(asdu)
+            await handler(session, asdu)
+
+        server = IEC104Server(bind_ip, port, wrapped, SessionParameters(), reuse_port=True)
+        await server.start()
+        connection.send_bytes(_READY)
+        logger.info("shard started", extra={"role": "server", "shard": index, "port": port})
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, stop.wait)
+        finally:
+            await server.stop()
+            channel.flush()
+
+    try:
+        asyncio.run(serve())
+    finally:
+        connection.close()
+
+
+class IEC104ShardedServerAdapter(IEC104ServerAdapter):
+    """IEC-104 server spread over ``workers`` processes bound to the same port.
+
+    Each worker runs its own ``IEC104Server`` with SO_REUSEPORT, so the kernel
+    distributes incoming station connections across processes. Received ASDUs
+    are sent back to this process in batches of compact binary records and
+    published on the ``LiveBus`` here. The handler runs in the worker
+    processes and must therefore be a picklable module level coroutine
+    function.
+    """
+
+    def __init__(self, live_bus: LiveBus, *, workers: int) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if not hasattr(socket, "SO_REUSEPORT"):
+            raise RuntimeError("Sharded server requires SO_REUSEPORT")
+        self._live_bus = live_bus
+        self._workers = workers
+        self._context = multiprocessing.get_context("spawn")
+        self._handler: Optional[Callable[[IEC104Session, object], Awaitable[None]]] = None
+        self._processes: list[BaseProcess] = []
+        self._connections: list[Connection] = []
+        self._stop: Optional[StopEvent] = None
+        self._reservation: Optional[socket.socket] = None
+        self.port: Optional[int] = None
+
+    async def start(self, bind_ip: str, port: int) -> None:
+        if self._handler is None:
+            raise RuntimeError("Handler not set")
+        if self._processes:
+            return
+        try:
+            pickle.dumps(self._handler)
+        except Exception as exc:
+            raise TypeError("Sharded server handler must be picklable") from exc
+        # Binding here first resolves port 0 to one port shared by all workers.
+        reservation = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        reservation.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        reservation.bind((bind_ip, port))
+        self._reservation = reservation
+        self.port = reservation.getsockname()[1]
+        self._stop = self._context.Event()
+        loop = asyncio.get_running_loop()
+        ready: list[asyncio.Future[None]] = []
+        for index in range(self._workers):
+            receiver, sender = self._context.Pipe(duplex=False)
+            process = self._context.Process(
+                target=_run_shard,
+                args=(index, bind_ip, self.port, self._handler, sender, self._stop),
+                name=f"iec104-shard-{index}",
+                daemon=True,
+            )
+            process.start()
+            sender.close()
+            future = loop.create_future()
+            loop.add_reader(receiver.fileno(), self._on_readable, receiver, future)
+            self._processes.append(process)
+            self._connections.append(receiver)
+            ready.append(future)
+        try:
+            await asyncio.wait_for(asyncio.gather(*ready), timeout=30)
+        except BaseException:
+            await self.stop()
+            raise
+        logger.info(
+            "sharded server started",
+            extra={
+                "role": "server",
+                "bind_ip": bind_ip,
+                "port": self.port,
+                "workers": self._workers,
+            },
+        )
+
+    async def stop(self) -> None:
+        if not self._processes:
+            return
+        assert self._stop is not None
+        self._stop.set()
+        loop = asyncio.get_running_loop()
+        for process in self._processes:
+            await loop.run_in_executor(None, process.join, 10)
+            if process.is_alive():
+                process.terminate()
+        for connection in self._connections:
+            # Drain the final batches written while the workers shut down.
+            while not connection.closed and connection.poll():
+                self._on_readable(connection, None)
+            if not connection.closed:
+                loop.remove_reader(connection.fileno())
+                connection.close()
+        self._processes.clear()
+        self._connections.clear()
+        if self._reservation is not None:
+            self._reservation.close()
+            self._reservation = None
+        logger.info("sharded server stopped", extra={"role": "server"})
+
+    def set_handler(
+        self,
+        handler: Callable[[IEC104Session, object], Awaitable[None]],
+    ) -> None:
+        self._handler = handler
+
+    def _on_readable(self, connection: Connection, ready: Optional[asyncio.Future[None]]) -> None:
+        try:
+            batch = connection.recv_bytes()
+        except (EOFError, OSError):
+            asyncio.get_running_loop().remove_reader(connection.fileno())
+            connection.close()
+            if ready is not None and not ready.done():
+                ready.set_exception(RuntimeError("Shard exited during startup"))
+            return
+        if batch == _READY:
+            if ready is not None and not ready.done():
+                ready.set_result(None)
+            return
+        self._publish_batch(memoryview(batch))
+
+    def _publish_batch(self, view: memoryview) -> None:
+        position = 0
+        while position < len(view):
+            timestamp, size = _RECORD.unpack_from(view, position)
+            position += _RECORD.size
+            record = view[position : position + size]
+            position += size
+            try:
+                descriptor = _asdu_to_descriptor(decode_asdu(record))
+            except NotImplementedError:
+                logger.debug("skipping unsupported ASDU", extra={"role": "server"})
+                continue
+            except IEC104Error as exc:
+                # One bad record must not drop the rest of the batch.
+                logger.warning(
+                    "skipping undecodable ASDU", extra={"role": "server", "error": str(exc)}
+                )
+                continue
+            event = IEC104FrameEvent(
+                kind=FRAME_EVENT_KIND,
+                role="server",
+                dir="rx",
+                ts=datetime.fromtimestamp(timestamp, timezone.utc),
+                apci=APCIMetadata(type="I", vs=-1, vr=-1),
+                asdu=descriptor,
+                raw=None,
+            )
+            self._live_bus.publish_nowait(event)
+
+
+__all__ = ["IEC104ShardedServerAdapter"]
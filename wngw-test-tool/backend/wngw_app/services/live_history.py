@@ -0,0 +1,101 @@
+"""Bounded history of published live events for late-joining viewers."""
+
+from __future__ import annotations
+
+import time
+from array import array
+from bisect import bisect_left
+
+from ..domain.events import IEC104FrameEvent
+
+
+class LiveHistory:
+    """Compact event history limited by event count and encoded bytes.
+
+    Events are kept in their binary encoding together with their bus sequence
+    number and publish time, in parallel arrays that are searched with
+    ``bisect``. The oldest events are evicted first.
+    """
+
+    def __init__(self, *, max_events: int = 100_000, max_bytes: int = 32 * 1024 * 1024) -> None:
+        if max_events < 1 or max_bytes < 1:
+            raise ValueError("max_events and max_bytes must be positive")
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self._seqs = array("q")
+        self._times = array("d")
+        self._blobs: list[bytes] = []
+        # Index of the oldest retained entry; evicted slots are compacted lazily.
+        self._start = 0
+        self.size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._blobs) - self._start
+
+    @property
+    def first_seq(self) -> int | None:
+        return self._seqs[self._start] if len(self) else None
+
+    def append(self, seq: int, event: IEC104FrameEvent, published_at: float | None = None) -> None:
+        blob = event.to_binary()
+        if published_at is None:
+            published_at = time.time()
+        if len(self):
+            # Keep the time index sorted even if the wall clock steps back.
+            published_at = max(published_at, self._times[-1])
+        self._seqs.append(seq)
+        self._times.append(published_at)
+        self._blobs.append(blob)
+        self.size_bytes += len(blob)
+        self._evict()
+
+    def since_seq(self, seq: int) -> tuple[int, list[IEC104FrameEvent]]:
+        """Events with sequence number ``>= seq``.
+
+        Returns the sequence number of the first returned event (or of the next
+        event if none is retained) and the decoded events.
+        """
+
+        index = bisect_left(self._seqs, seq, self._start)
+        return self._slice(index)
+
+    def since_time(self, epoch_seconds: float) -> tuple[int, list[IEC104FrameEvent]]:
+        """Events published at or after ``epoch_seconds``; see ``since_seq``."""
+
+        index = bisect_left(self._times, epoch_seconds, self._start)
+        return self._slice(index)
+
+    def clear(self) -> None:
+        self._seqs = array("q")
+        self._times = array("d")
+        self._blobs = []
+        self._start = 0
+        self.size_bytes = 0
+
+    def _slice(self, index: int) -> tuple[int, list[IEC104FrameEvent]]:
+        decode = IEC104FrameEvent.from_binary
+        events = [decode(blob) for blob in self._blobs[index:]]
+        if index < len(self._seqs):
+            first = self._seqs[index]
+        else:
+            first = self._seqs[-1] + 1 if self._seqs else 0
+        return first, events
+
+    def _evict(self) -> None:
+        blobs = self._blobs
+        start = self._start
+        while len(blobs) - start > self.max_events or (
+            self.size_bytes > self.max_bytes and len(blobs) - start > 1
+        ):
+            self.size_bytes -= len(blobs[start])
+            blobs[start] = b""
+            start += 1
+        self._start = start
+        if start > 1024 and start * 2 > len(blobs):
+            del self._seqs[:start]
+            del self._times[:start]
+            del blobs[:start]
+            self._start = 0
+
+
+__all__ = ["LiveHistory"]
@@ -0,0 +1,161 @@
+"""Server-side filtering and micro-batching of live events."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from ..domain.events import IEC104FrameEvent
+from .livebus import Subscription
+
+Range = tuple[int, int]
+
+
+def _as_list(value: Any) -> list[Any]:
+    if value is None:
+        return []
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _parse_choices(data: dict[str, Any], key: str, allowed: set[str]) -> frozenset[str]:
+    items = _as_list(data.get(key))
+    for item in items:
+        if not isinstance(item, str):
+            raise ValueError(f"Invalid {key} value: {item!r}")
+    values = frozenset(items)
+    unknown = values - allowed
+    if unknown:
+        raise ValueError(f"Unknown {key} values: {sorted(map(str, unknown))}")
+    return values
+
+
+def _parse_ranges(data: dict[str, Any], key: str) -> tuple[Range, ...]:
+    ranges: list[Range] = []
+    for item in _as_list(data.get(key)):
+        if isinstance(item, bool):
+            raise ValueError(f"Invalid {key} value: {item!r}")
+        if isinstance(item, int):
+            ranges.append((item, item))
+        elif isinstance(item, (list, tuple)) and len(item) == 2:
+            try:
+                low, high = int(item[0]), int(item[1])
+            except (TypeError, ValueError) as exc:
+                raise ValueError(f"Invalid {key} range: {item!r}") from exc
+            if low > high:
+                raise ValueError(f"Invalid {key} range: {low}-{high}")
+            ranges.append((low, high))
+        else:
+            raise ValueError(f"Invalid {key} value: {item!r}")
+    return tuple(ranges)
+
+
+def _in_ranges(value: Optional[int], ranges: tuple[Range, ...]) -> bool:
+    if value is None:
+        return False
+    return any(low <= value <= high for low, high in ranges)
+
+
+@dataclass(slots=True, frozen=True)
+class LiveFilter:
+    """Subscription filter; empty criteria match everything."""
+
+    roles: frozenset[str] = frozenset()
+    dirs: frozenset[str] = frozenset()
+    type_ids: frozenset[int] = frozenset()
+    ca: tuple[Range, ...] = ()
+    ioa: tuple[Range, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LiveFilter":
+        """Parse ``{"role", "dir", "typeId", "ca", "ioa"}``.
+
+        Each key takes a single value or a list; ``ca`` and ``ioa`` entries are
+        numbers or inclusive ``[low, high]`` ranges.
+        """
+
+        if not isinstance(data, dict):
+            raise ValueError("Filter must be an object")
+        unknown = set(data) - {"role", "dir", "typeId", "ca", "ioa"}
+        if unknown:
+            raise ValueError(f"Unknown filter keys: {sorted(unknown)}")
+        try:
+            type_ids = frozenset(int(value) for value in _as_list(data.get("typeId")))
+        except (TypeError, ValueError) as exc:
+            raise ValueError("typeId must be numeric") from exc
+        return cls(
+            roles=_parse_choices(data, "role", {"client", "server"}),
+            dirs=_parse_choices(data, "dir", {"tx", "rx"}),
+            type_ids=type_ids,
+            ca=_parse_ranges(data, "ca"),
+            ioa=_parse_ranges(data, "ioa"),
+        )
+
+    def matches(self, event: IEC104FrameEvent) -> bool:
+        if self.roles and event.role not in self.roles:
+            return False
+        if self.dirs and event.dir not in self.dirs:
+            return False
+        asdu = event.asdu
+        if self.type_ids and asdu.typeId not in self.type_ids:
+            return False
+        if self.ca and not _in_ranges(asdu.ca, self.ca):
+            return False
+        if self.ioa and not _in_ranges(asdu.ioa, self.ioa):
+            return False
+        return True
+
+
+@dataclass(slots=True)
+class LiveBatch:
+    events: list[IEC104FrameEvent] = field(default_factory=list)
+    # Events the subscriber missed since the previous batch because it fell behind.
+    dropped: int = 0
+    # Bus sequence number to resume from with ``LiveBus.subscribe(since_seq=...)``.
+    next_seq: int = 0
+
+
+class LiveStream:
+    """Async iterator of filtered ``LiveBatch`` objects from a subscription.
+
+    After the first event of a batch arrives the stream waits ``interval``
+    seconds to collect more, unless ``max_batch`` events are already pending.
+    Batches where the filter rejected every event and nothing was dropped are
+    not emitted.
+    """
+
+    def __init__(
+        self,
+        subscription: Subscription,
+        *,
+        interval: float = 0.05,
+        max_batch: int = 500,
+        live_filter: LiveFilter | None = None,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self._subscription = subscription
+        self.interval = interval
+        self.max_batch = max_batch
+        self.filter = live_filter or LiveFilter()
+        self._reported_drops = 0
+
+    def __aiter__(self) -> "LiveStream":
+        return self
+
+    async def __anext__(self) -> LiveBatch:
+        subscription = self._subscription
+        while True:
+            first = await anext(subscription)
+            if subscription.lag < self.max_batch - 1:
+                await asyncio.sleep(self.interval)
+            events = [first, *subscription.read_nowait(self.max_batch - 1)]
+            dropped = subscription.dropped - self._reported_drops
+            self._reported_drops = subscription.dropped
+            matches = self.filter.matches
+            selected = [event for event in events if matches(event)]
+            if selected or dropped:
+                return LiveBatch(selected, dropped, subscription.position)
+
+
+__all__ = ["LiveBatch", "LiveFilter", "LiveStream"]
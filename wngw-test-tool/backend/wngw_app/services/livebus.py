@@ -3,50 +3,169 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from collections import deque
-from typing import AsyncIterator, Deque
+from typing import Iterable, Optional
 
 from ..domain.events import IEC104FrameEvent
+from .live_history import LiveHistory
 
-_MAX_QUEUE = 100
+_DEFAULT_CAPACITY = 1024
+
+
+class Subscription:
+    """Read cursor of one subscriber into the bus ring.
+
+    Iterating yields events in publish order. A subscriber that falls more
+    than ``capacity`` events behind skips to the oldest retained event;
+    ``dropped`` counts the events it missed and ``gaps`` how often that
+    happened. Iteration ends when the bus is closed.
+
+    A subscription created with a history backfill yields the backfilled
+    events first and then continues seamlessly with the live ring.
+    """
+
+    __slots__ = ("_backlog", "_bus", "cursor", "dropped", "gaps")
+
+    def __init__(
+        self, bus: "LiveBus", cursor: int, backlog: Iterable[IEC104FrameEvent] = ()
+    ) -> None:
+        self._bus = bus
+        self._backlog = deque(backlog)
+        self.cursor = cursor
+        self.dropped = 0
+        self.gaps = 0
+
+    @property
+    def lag(self) -> int:
+        """Events published but not yet read by this subscriber."""
+
+        return len(self._backlog) + self._bus.next_seq - self.cursor
+
+    @property
+    def position(self) -> int:
+        """Bus sequence number of the next event this subscriber reads."""
+
+        return self.cursor - len(self._backlog)
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> IEC104FrameEvent:
+        if self._backlog:
+            return self._backlog.popleft()
+        bus = self._bus
+        while self.cursor == bus.next_seq:
+            if bus.closed:
+                raise StopAsyncIteration
+            await bus._wait()
+        if bus.closed:
+            raise StopAsyncIteration
+        return self._take()
+
+    def read_nowait(self, limit: int | None = None) -> list[IEC104FrameEvent]:
+        """Return up to ``limit`` already published events without waiting."""
+
+        backlog = self._backlog
+        events: list[IEC104FrameEvent] = []
+        while backlog and (limit is None or len(events) < limit):
+            events.append(backlog.popleft())
+        self._skip_overwritten()
+        available = self._bus.next_seq - self.cursor
+        if limit is not None:
+            available = min(available, limit - len(events))
+        events.extend(self._take() for _ in range(available))
+        return events
+
+    def _skip_overwritten(self) -> None:
+        bus = self._bus
+        oldest = bus.next_seq - bus.capacity
+        if self.cursor < oldest:
+            self.dropped += oldest - self.cursor
+            self.gaps += 1
+            self.cursor = oldest
+
+    def _take(self) -> IEC104FrameEvent:
+        self._skip_overwritten()
+        bus = self._bus
+        event = bus._ring[self.cursor % bus.capacity]
+        self.cursor += 1
+        assert event is not None
+        return event
 
 
 class LiveBus:
-    """A lightweight broadcast bus backed by asyncio queues."""
-
-    def __init__(self) -> None:
-        self._subscribers: set[asyncio.Queue[IEC104FrameEvent]] = set()
-        self._lock = asyncio.Lock()
-        self._closed = False
-
-    async def subscribe(self) -> AsyncIterator[IEC104FrameEvent]:
-        queue: asyncio.Queue[IEC104FrameEvent] = asyncio.Queue(maxsize=_MAX_QUEUE)
-        async with self._lock:
-            if self._closed:
-                raise RuntimeError("LiveBus is closed")
-            self._subscribers.add(queue)
-
-        try:
-            while True:
-                yield await queue.get()
-        finally:
-            async with self._lock:
-                self._subscribers.discard(queue)
+    """Broadcast bus backed by one shared ring buffer.
+
+    ``publish`` stores each event once and wakes waiting subscribers; it takes
+    no lock and its cost does not depend on the number of subscribers. Each
+    ``Subscription`` reads the ring through its own cursor. With a
+    ``LiveHistory`` attached, new subscribers can ask for a backfill.
+    """
+
+    def __init__(
+        self, capacity: int = _DEFAULT_CAPACITY, *, history: LiveHistory | None = None
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._ring: list[Optional[IEC104FrameEvent]] = [None] * capacity
+        self.next_seq = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self.history = history
+        self.closed = False
+
+    def subscribe(
+        self, *, since_seq: int | None = None, last_seconds: float | None = None
+    ) -> Subscription:
+        """Subscribe to events published from now on.
+
+        ``since_seq`` or ``last_seconds`` first replay matching events from the
+        history. Events older than the history are counted as ``dropped``.
+        """
+
+        if self.closed:
+            raise RuntimeError("LiveBus is closed")
+        if since_seq is None and last_seconds is None:
+            return Subscription(self, self.next_seq)
+        if self.history is None:
+            raise RuntimeError("LiveBus has no history")
+        if since_seq is not None:
+            first, backlog = self.history.since_seq(since_seq)
+        else:
+            first, backlog = self.history.since_time(time.time() - (last_seconds or 0.0))
+        subscription = Subscription(self, self.next_seq, backlog)
+        if since_seq is not None and since_seq < first:
+            subscription.dropped = min(first, self.next_seq) - since_seq
+        return subscription
 
     async def publish(self, event: IEC104FrameEvent) -> None:
-        async with self._lock:
-            subscribers = list(self._subscribers)
-        for queue in subscribers:
-            if queue.full():
-                drained: Deque[IEC104FrameEvent] = deque(maxlen=1)
-                while not queue.empty():
-                    drained.append(queue.get_nowait())
-            queue.put_nowait(event)
+        self.publish_nowait(event)
+
+    def publish_nowait(self, event: IEC104FrameEvent) -> None:
+        if self.closed:
+            return
+        seq = self.next_seq
+        self._ring[seq % self.capacity] = event
+        self.next_seq = seq + 1
+        if self.history is not None:
+            self.history.append(seq, event)
+        self._notify()
 
     async def close(self) -> None:
-        async with self._lock:
-            self._closed = True
-            self._subscribers.clear()
+        self.closed = True
+        self._notify()
+
+    async def _wait(self) -> None:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        await self._wakeup.wait()
+
+    def _notify(self) -> None:
+        wakeup = self._wakeup
+        if wakeup is not None:
+            self._wakeup = None
+            wakeup.set()
 
 
-__all__ = ["LiveBus"]
+__all__ = ["LiveBus", "Subscription"]
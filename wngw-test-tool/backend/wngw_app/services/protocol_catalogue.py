@@ -0,0 +1,148 @@
+"""In-memory catalogue of stored protocols."""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Optional
+
+from ..domain.models import ProtocolListEntry
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Newest modification time (ns) and total size of a protocol's files.
+Signature = tuple[int, int]
+
+
+@dataclass(slots=True)
+class ProtocolSummary:
+    path: str
+    modified: float
+    entries: int = 0
+    first_ns: Optional[int] = None
+    last_ns: Optional[int] = None
+    size_bytes: int = 0
+    results: Counter[str] = field(default_factory=Counter)
+    # Files as last seen by the catalogue; ``None`` after our own writes.
+    signature: Optional[Signature] = None
+
+    def add(self, timestamps: Iterable[int], results: Iterable[str], size_bytes: int) -> None:
+        for ts in timestamps:
+            self.entries += 1
+            if self.first_ns is None or ts < self.first_ns:
+                self.first_ns = ts
+            if self.last_ns is None or ts > self.last_ns:
+                self.last_ns = ts
+        self.results.update(results)
+        self.size_bytes += size_bytes
+
+    def to_list_entry(self) -> ProtocolListEntry:
+        return ProtocolListEntry(
+            path=self.path,
+            created_at=datetime.fromtimestamp(self.modified),
+            entries=self.entries,
+            first_timestamp=_from_ns(self.first_ns),
+            last_timestamp=_from_ns(self.last_ns),
+            size_bytes=self.size_bytes,
+            results=dict(self.results),
+        )
+
+
+def _from_ns(value: Optional[int]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return _EPOCH + timedelta(microseconds=value // 1_000)
+
+
+class ProtocolCatalogue:
+    """Per-protocol entry counts, time span, size and result counts.
+
+    ``record`` keeps the summaries current on every write, so listing only
+    stats the files: ``discover`` returns the signature of every protocol
+    and protocols whose files changed otherwise, e.g. by an import or another
+    process, are rescanned with ``scan``. Discovery and rescans run outside
+    ``lock``; the results are swapped in under it. A protocol written by us
+    since the last listing takes its new signature without a rescan, so an
+    external write to the same protocol in that window goes unnoticed until
+    its files change again.
+    """
+
+    def __init__(
+        self,
+        discover: Callable[[], dict[str, Signature]],
+        scan: Callable[[str], Optional[ProtocolSummary]],
+    ) -> None:
+        self._discover = discover
+        self._scan = scan
+        self._summaries: Optional[dict[str, ProtocolSummary]] = None
+        # Bumped by ``record``; a scan that raced with a write is not used.
+        self._versions: Counter[str] = Counter()
+        # Held while a write and its ``record`` happen, so a swap never counts
+        # an entry twice or misses it.
+        self.lock = threading.RLock()
+
+    def list(self) -> list[ProtocolListEntry]:
+        current = self._discover()
+        with self.lock:
+            summaries = self._summaries if self._summaries is not None else {}
+            for name, summary in summaries.items():
+                if summary.signature is None and name in current:
+                    summary.signature = current[name]
+            stale = [
+                name
+                for name, signature in current.items()
+                if name not in summaries or summaries[name].signature != signature
+            ]
+            versions = {name: self._versions[name] for name in stale}
+        scanned = {name: self._scan(name) for name in stale}
+        with self.lock:
+            summaries = dict(self._summaries) if self._summaries is not None else {}
+            for name in list(summaries):
+                # Protocols first written after ``discover`` have no signature yet.
+                if name not in current and summaries[name].signature is not None:
+                    del summaries[name]
+            for name, rescanned in scanned.items():
+                signature: Optional[Signature] = current[name]
+                if self._versions[name] != versions[name]:
+                    # Written during the scan: rescan while writes are held off,
+                    # and take the signature with our write at the next listing.
+                    rescanned, signature = self._scan(name), None
+                if rescanned is None:
+                    summaries.pop(name, None)
+                    continue
+                rescanned.signature = signature
+                summaries[name] = rescanned
+            self._summaries = summaries
+            return [summaries[name].to_list_entry() for name in sorted(summaries)]
+
+    def record(
+        self,
+        name: str,
+        path: str,
+        timestamps: Iterable[int],
+        results: Iterable[str],
+        size_bytes: int,
+    ) -> None:
+        """Account for entries just written; call with ``lock`` held."""
+
+        self._versions[name] += 1
+        summaries = self._summaries
+        if summaries is None:
+            # Not built yet: the first listing scans the files.
+            return
+        summary = summaries.get(name)
+        if summary is None:
+            summary = summaries[name] = ProtocolSummary(path, 0.0)
+        summary.path = path
+        summary.modified = datetime.now().timestamp()
+        summary.signature = None
+        summary.add(timestamps, results, size_bytes)
+
+    def invalidate(self) -> None:
+        with self.lock:
+            self._summaries = None
+
+
+__all__ = ["ProtocolCatalogue", "ProtocolSummary", "Signature"]
@@ -0,0 +1,228 @@
+"""On-disk record formats of the protocol store."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import struct
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Protocol, Union
+
+from ..domain.models import ProtocolEntry
+from .protocol_segments import split_lines, timestamp_ns
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# ``ProtocolEntry.to_dict`` puts the timestamp first, so this finds the top-level field.
+_TIMESTAMP_FIELD = re.compile(rb'"timestamp": "([^"]+)"')
+_RESULT_FIELD = re.compile(rb'"result": "([^"]*)"')
+
+
+class RecordCodec(Protocol):
+    """Encoding of protocol entries as self-delimiting byte records."""
+
+    suffix: str
+
+    def split(self, data: bytes) -> list[bytes]: ...
+
+    def encode(self, entry: ProtocolEntry) -> bytes: ...
+
+    def decode(self, record: bytes) -> ProtocolEntry: ...
+
+    def timestamp(self, record: bytes) -> int:
+        """Epoch nanoseconds of ``record``; raises ``ValueError`` if unreadable."""
+        ...
+
+    def result(self, record: bytes) -> str: ...
+
+    def result_filter(self, result: str) -> Callable[[bytes], bool]:
+        """Cheap byte-level check that ``record`` may have ``result``.
+
+        False positives are allowed; callers confirm on the decoded entry.
+        """
+        ...
+
+
+class JsonlCodec:
+    """One ``ProtocolEntry.to_dict`` JSON object per line."""
+
+    suffix = ".jsonl"
+
+    def split(self, data: bytes) -> list[bytes]:
+        return split_lines(data)
+
+    def encode(self, entry: ProtocolEntry) -> bytes:
+        return (json.dumps(entry.to_dict()) + "\n").encode()
+
+    def decode(self, record: bytes) -> ProtocolEntry:
+        return ProtocolEntry.from_dict(json.loads(record))
+
+    def timestamp(self, record: bytes) -> int:
+        """Timestamp of a JSON line, read without parsing the whole record."""
+
+        match = _TIMESTAMP_FIELD.search(record)
+        try:
+            if match is not None:
+                return timestamp_ns(datetime.fromisoformat(match.group(1).decode()))
+            return timestamp_ns(datetime.fromisoformat(json.loads(record)["timestamp"]))
+        except (KeyError, TypeError, UnicodeDecodeError) as exc:
+            raise ValueError("Protocol record without timestamp") from exc
+
+    def result(self, record: bytes) -> str:
+        match = _RESULT_FIELD.search(record)
+        return match.group(1).decode() if match else ""
+
+    def result_filter(self, result: str) -> Callable[[bytes], bool]:
+        needle = b'"result": ' + json.dumps(result).encode()
+        return lambda record: needle in record
+
+
+# Binary record: length of the rest of the record, timestamp in epoch ns,
+# result symbol and payload key symbol, followed by the payload values as a
+# compact JSON array.
+BINARY_HEADER = struct.Struct("<IqHH")
+_LENGTH = struct.Struct("<I")
+_TIMESTAMP = struct.Struct("<q")
+_RESULT_OFFSET = 12
+_MAX_SYMBOLS = 0xFFFF
+
+Symbol = Union[str, tuple[str, ...]]
+
+
+class SymbolTable:
+    """Append-only table of result strings and payload key tuples.
+
+    Stored as one JSON value per line; a symbol's code is its line number.
+    New symbols are synced before any record can refer to them.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._symbols: list[Symbol] = []
+        self._codes: dict[Symbol, int] = {}
+        if path.exists():
+            for line in path.read_bytes().splitlines():
+                if not line.strip():
+                    continue
+                value = json.loads(line)
+                self._add(value if isinstance(value, str) else tuple(value))
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def code(self, symbol: Symbol) -> int:
+        code = self._codes.get(symbol)
+        if code is not None:
+            return code
+        with self._lock:
+            code = self._codes.get(symbol)
+            if code is None:
+                if len(self._symbols) > _MAX_SYMBOLS:
+                    raise ValueError(f"Symbol table {self.path} is full")
+                value = symbol if isinstance(symbol, str) else list(symbol)
+                with self.path.open("ab") as file:
+                    file.write(json.dumps(value).encode() + b"\n")
+                    file.flush()
+                    os.fsync(file.fileno())
+                code = self._add(symbol)
+            return code
+
+    def lookup(self, symbol: Symbol) -> int | None:
+        return self._codes.get(symbol)
+
+    def symbol(self, code: int) -> Symbol:
+        try:
+            return self._symbols[code]
+        except IndexError:
+            raise ValueError(f"Unknown symbol {code} in {self.path}") from None
+
+    def _add(self, symbol: Symbol) -> int:
+        code = len(self._symbols)
+        self._symbols.append(symbol)
+        self._codes[symbol] = code
+        return code
+
+
+class BinaryCodec:
+    """Length-prefixed binary records with interned result and payload keys.
+
+    The symbol table is shared by all segments of one protocol. Timestamps are
+    stored as UTC epoch nanoseconds and decoded as UTC datetimes.
+    """
+
+    suffix = ".wpl"
+
+    def __init__(self, symbols: SymbolTable) -> None:
+        self.symbols = symbols
+
+    def split(self, data: bytes) -> list[bytes]:
+        records = []
+        offset, size = 0, len(data)
+        while offset + _LENGTH.size <= size:
+            (length,) = _LENGTH.unpack_from(data, offset)
+            end = offset + _LENGTH.size + length
+            if end > size:
+                # Torn record at the end of a crashed write.
+                break
+            records.append(bytes(data[offset:end]))
+            offset = end
+        return records
+
+    def encode(self, entry: ProtocolEntry) -> bytes:
+        payload = entry.payload
+        values = json.dumps(list(payload.values()), separators=(",", ":")).encode()
+        return (
+            BINARY_HEADER.pack(
+                BINARY_HEADER.size - _LENGTH.size + len(values),
+                timestamp_ns(entry.timestamp),
+                self.symbols.code(entry.result),
+                self.symbols.code(tuple(payload)),
+            )
+            + values
+        )
+
+    def decode(self, record: bytes) -> ProtocolEntry:
+        if len(record) < BINARY_HEADER.size:
+            raise ValueError("Truncated protocol record")
+        _length, ts, result, keys = BINARY_HEADER.unpack_from(record)
+        values: list[Any] = json.loads(record[BINARY_HEADER.size :])
+        return ProtocolEntry(
+            timestamp=_EPOCH + timedelta(microseconds=ts // 1_000),
+            result=str(self.symbols.symbol(result)),
+            payload=dict(zip(self.symbols.symbol(keys), values)),
+        )
+
+    def timestamp(self, record: bytes) -> int:
+        if len(record) < BINARY_HEADER.size:
+            raise ValueError("Truncated protocol record")
+        ts: int
+        (ts,) = _TIMESTAMP.unpack_from(record, _LENGTH.size)
+        return ts
+
+    def result(self, record: bytes) -> str:
+        (code,) = struct.unpack_from("<H", record, _RESULT_OFFSET)
+        return str(self.symbols.symbol(code))
+
+    def result_filter(self, result: str) -> Callable[[bytes], bool]:
+        code = self.symbols.lookup(result)
+        if code is None:
+            return lambda record: False
+        needle = struct.pack("<H", code)
+        end = _RESULT_OFFSET + len(needle)
+        return lambda record: record[_RESULT_OFFSET:end] == needle
+
+
+__all__ = [
+    "BINARY_HEADER",
+    "BinaryCodec",
+    "JsonlCodec",
+    "RecordCodec",
+    "SymbolTable",
+]
@@ -0,0 +1,90 @@
+"""Conversion between stored protocols and plain JSON lines.
+
+Run from the ``backend`` directory::
+
+    python -m wngw_app.services.protocol_convert export soak soak.jsonl --dir data/logs/backend
+    python -m wngw_app.services.protocol_convert import soak.jsonl soak --format binary
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
+
+from ..domain.models import ProtocolEntry
+from .protocol_store import ProtocolStore
+
+
+def _read_entries(file: BinaryIO) -> Iterator[ProtocolEntry]:
+    for line in file:
+        if line.strip():
+            yield ProtocolEntry.from_dict(json.loads(line))
+
+
+def import_jsonl(source: Path, store: ProtocolStore, name: str, *, batch: int = 1000) -> int:
+    """Append the JSON lines of ``source`` to protocol ``name``; returns the count."""
+
+    count = 0
+    with source.open("rb") as file:
+        entries = _read_entries(file)
+        while chunk := list(islice(entries, batch)):
+            store.append_many(name, chunk)
+            count += len(chunk)
+    store.flush()
+    return count
+
+
+def export_jsonl(store: ProtocolStore, name: str, destination: Path, **filters: Any) -> int:
+    """Write protocol ``name`` as JSON lines; ``filters`` are passed to ``read``."""
+
+    count = 0
+    with destination.open("w", encoding="utf-8") as file:
+        for entry in store.read(name, **filters):
+            file.write(json.dumps(entry.to_dict()) + "\n")
+            count += 1
+    return count
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dir", type=Path, default=Path("data/logs/backend"))
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="write a protocol as JSON lines")
+    export.add_argument("name")
+    export.add_argument("destination", type=Path)
+    export.add_argument("--since", type=datetime.fromisoformat)
+    export.add_argument("--until", type=datetime.fromisoformat)
+    export.add_argument("--result")
+    imported = commands.add_parser("import", help="append JSON lines to a protocol")
+    imported.add_argument("source", type=Path)
+    imported.add_argument("name")
+    imported.add_argument("--format", choices=["jsonl", "binary"], default="jsonl")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        store = ProtocolStore(args.dir)
+        count = export_jsonl(
+            store,
+            args.name,
+            args.destination,
+            since=args.since,
+            until=args.until,
+            result=args.result,
+        )
+    else:
+        store = ProtocolStore(args.dir, record_format=args.format)
+        count = import_jsonl(args.source, store, args.name)
+    store.close()
+    print(f"{args.command}ed {count} entries", file=sys.stderr)
+
+
+__all__ = ["export_jsonl", "import_jsonl", "main"]
+
+
+if __name__ == "__main__":
+    main()
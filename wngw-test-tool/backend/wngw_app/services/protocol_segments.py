@@ -0,0 +1,428 @@
+"""Rotating, compressed protocol log segments with a sparse timestamp index."""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Optional, Sequence
+
+if TYPE_CHECKING:
+    from .protocol_codecs import RecordCodec
+
+logger = logging.getLogger(__name__)
+
+# Sidecar record per block: smallest and largest timestamp (epoch ns), byte
+# offset and length of the block in the segment file and its record count.
+INDEX_RECORD = struct.Struct("<qqQII")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_SEGMENT_NAME = re.compile(r"^(\d{8})\.")
+
+
+def timestamp_ns(value: datetime) -> int:
+    """Epoch nanoseconds of ``value``; naive datetimes are taken as local time."""
+
+    if value.tzinfo is None:
+        value = value.astimezone()
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+def split_lines(data: bytes) -> list[bytes]:
+    """Split newline terminated records, keeping the terminators."""
+
+    return data.splitlines(keepends=True)
+
+
+@dataclass(slots=True)
+class BlockIndex:
+    min_ts: int
+    max_ts: int
+    offset: int
+    length: int
+    count: int
+
+    def overlaps(self, since: Optional[int], until: Optional[int]) -> bool:
+        return (since is None or self.max_ts >= since) and (until is None or self.min_ts <= until)
+
+    def pack(self) -> bytes:
+        return INDEX_RECORD.pack(self.min_ts, self.max_ts, self.offset, self.length, self.count)
+
+
+def _load_index(path: Path) -> list[BlockIndex]:
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return []
+    # A torn trailing record from a crash is ignored.
+    usable = len(data) - len(data) % INDEX_RECORD.size
+    return [BlockIndex(*fields) for fields in INDEX_RECORD.iter_unpack(data[:usable])]
+
+
+@dataclass(slots=True)
+class _Segment:
+    seq: int
+    path: Path
+    compressed: bool
+    blocks: list[BlockIndex] = field(default_factory=list)
+    size: int = 0
+
+
+@dataclass(slots=True)
+class _OpenBlock:
+    offset: int
+    count: int = 0
+    min_ts: int = 0
+    max_ts: int = 0
+
+    def add(self, ts: int) -> None:
+        if self.count == 0:
+            self.min_ts = self.max_ts = ts
+        else:
+            self.min_ts = min(self.min_ts, ts)
+            self.max_ts = max(self.max_ts, ts)
+        self.count += 1
+
+    def seal(self, end: int) -> BlockIndex:
+        return BlockIndex(self.min_ts, self.max_ts, self.offset, end - self.offset, self.count)
+
+
+class SegmentedLog:
+    """One protocol stored as a directory of numbered segments.
+
+    Records encoded by ``codec`` are appended to the active ``<seq>.<suffix>``
+    segment. Every ``index_interval`` records a block is sealed and its
+    timestamp range and byte span are appended to the ``<seq>.idx`` sidecar. When the segment
+    exceeds ``segment_bytes`` or ``segment_seconds`` it is closed, and a
+    background thread rewrites it as ``<seq>.<suffix>.gz`` with one gzip
+    member per block, so a block can be decompressed on its own while ``zcat``
+    still reads the whole file. Until then readers use the raw segment.
+
+    Segments left uncompressed by a previous run are compressed on open.
+    ``records`` reads only the segments and blocks overlapping a time range.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        codec: RecordCodec,
+        segment_bytes: Optional[int] = None,
+        segment_seconds: Optional[float] = None,
+        index_interval: int = 256,
+    ) -> None:
+        if index_interval < 1:
+            raise ValueError("index_interval must be at least 1")
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.codec = codec
+        self.suffix = codec.suffix
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.index_interval = index_interval
+        self._timestamp_of = codec.timestamp
+        self._split = codec.split
+        self._lock = threading.Lock()
+        self._segments: list[_Segment] = []
+        self._active: Optional[_Segment] = None
+        self._data: Optional[BinaryIO] = None
+        self._index: Optional[BinaryIO] = None
+        self._block: Optional[_OpenBlock] = None
+        self._opened_at = 0.0
+        # Sealed segments waiting for the compressor thread.
+        self._to_compress: list[_Segment] = []
+        self._compressor: Optional[threading.Thread] = None
+        # Blocks decompressed or read by ``records``; for diagnostics and tests.
+        self.blocks_read = 0
+        self._recover()
+
+    @property
+    def segments(self) -> int:
+        return len(self._segments) + (self._active is not None)
+
+    def append(self, records: Sequence[tuple[int, bytes]]) -> None:
+        """Append ``(timestamp_ns, record)`` pairs and rotate if a limit is hit."""
+
+        if not records:
+            return
+        with self._lock:
+            if self._active is None:
+                self._open_segment()
+            assert self._active is not None and self._data is not None
+            assert self._index is not None and self._block is not None
+            active, block = self._active, self._block
+            offset = active.size
+            index_records = []
+            for ts, data in records:
+                block.add(ts)
+                offset += len(data)
+                if block.count >= self.index_interval:
+                    sealed_block = block.seal(offset)
+                    active.blocks.append(sealed_block)
+                    index_records.append(sealed_block.pack())
+                    block = _OpenBlock(offset)
+            self._block = block
+            self._data.write(b"".join(data for _ts, data in records))
+            active.size = offset
+            if index_records:
+                self._index.write(b"".join(index_records))
+            if self._should_rotate():
+                self._queue_compression(self._seal_active())
+
+    def sync(self, *, fsync: bool = False) -> None:
+        with self._lock:
+            for file in (self._data, self._index):
+                if file is not None:
+                    file.flush()
+                    if fsync:
+                        os.fsync(file.fileno())
+
+    def rotate(self) -> None:
+        """Close the active segment and queue it for compression."""
+
+        with self._lock:
+            if self._active is not None:
+                self._queue_compression(self._seal_active())
+
+    def wait_compressed(self) -> None:
+        """Block until every queued segment has been compressed."""
+
+        while True:
+            with self._lock:
+                compressor = self._compressor
+            if compressor is None:
+                return
+            compressor.join()
+
+    def close(self) -> None:
+        """Close the files; the active segment is compressed on the next open."""
+
+        with self._lock:
+            if self._active is not None:
+                self._seal_active()
+        self.wait_compressed()
+
+    def records(
+        self, *, since: Optional[int] = None, until: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """Records of every block whose timestamps overlap ``[since, until]``.
+
+        Blocks are selected by their index range only; callers filter the
+        individual records.
+        """
+
+        for file, compressed, blocks, tail in self._snapshot(since, until):
+            with file:
+                for block in blocks:
+                    file.seek(block.offset)
+                    data = file.read(block.length)
+                    if compressed:
+                        data = zlib.decompress(data, wbits=31)
+                    self.blocks_read += 1
+                    yield from self._split(data)
+                if tail is not None:
+                    # Records of the active segment not yet sealed into a block.
+                    file.seek(tail[0])
+                    data = file.read(tail[1] - tail[0])
+                    self.blocks_read += 1
+                    yield from self._split(data)
+
+    def _snapshot(
+        self, since: Optional[int], until: Optional[int]
+    ) -> list[tuple[BinaryIO, bool, list[BlockIndex], Optional[tuple[int, int]]]]:
+        """Open the overlapping segment files under the lock.
+
+        Open handles stay valid while a concurrent rotation replaces files.
+        """
+
+        selected: list[tuple[BinaryIO, bool, list[BlockIndex], Optional[tuple[int, int]]]] = []
+        with self._lock:
+            if self._data is not None:
+                self._data.flush()
+            segments = list(self._segments)
+            if self._active is not None:
+                segments.append(self._active)
+            for segment in segments:
+                blocks = [block for block in segment.blocks if block.overlaps(since, until)]
+                tail: Optional[tuple[int, int]] = None
+                if segment is self._active and self._block is not None and self._block.count:
+                    if self._block.seal(segment.size).overlaps(since, until):
+                        tail = (self._block.offset, segment.size)
+                if not blocks and tail is None:
+                    continue
+                selected.append((segment.path.open("rb"), segment.compressed, blocks, tail))
+        return selected
+
+    def _should_rotate(self) -> bool:
+        active = self._active
+        assert active is not None
+        if self.segment_bytes is not None and active.size >= self.segment_bytes:
+            return True
+        if self.segment_seconds is not None:
+            return time.monotonic() - self._opened_at >= self.segment_seconds
+        return False
+
+    def _segment_path(self, seq: int, *, compressed: bool) -> Path:
+        return self.directory / f"{seq:08d}{self.suffix}{'.gz' if compressed else ''}"
+
+    def _index_path(self, seq: int) -> Path:
+        return self.directory / f"{seq:08d}.idx"
+
+    def _open_segment(self) -> None:
+        seq = max((segment.seq for segment in self._segments), default=0) + 1
+        path = self._segment_path(seq, compressed=False)
+        self._active = _Segment(seq, path, compressed=False)
+        self._data = path.open("ab")
+        self._index = self._index_path(seq).open("ab")
+        self._block = _OpenBlock(0)
+        self._opened_at = time.monotonic()
+
+    def _seal_active(self) -> _Segment:
+        """Index the open block and close the active segment; lock held."""
+
+        active, block = self._active, self._block
+        assert active is not None and block is not None
+        assert self._data is not None and self._index is not None
+        if block.count:
+            sealed_block = block.seal(active.size)
+            active.blocks.append(sealed_block)
+            self._index.write(sealed_block.pack())
+        self._data.close()
+        self._index.close()
+        self._data = self._index = None
+        self._block = None
+        self._active = None
+        # Readers keep using the raw file until compression has finished.
+        self._segments.append(active)
+        return active
+
+    def _queue_compression(self, segment: _Segment) -> None:
+        """Hand a sealed segment to the compressor thread; lock held."""
+
+        self._to_compress.append(segment)
+        if self._compressor is None:
+            self._compressor = threading.Thread(
+                target=self._run_compressor, name="protocol-segment-compressor", daemon=True
+            )
+            self._compressor.start()
+
+    def _run_compressor(self) -> None:
+        while True:
+            with self._lock:
+                if not self._to_compress:
+                    self._compressor = None
+                    return
+                segment = self._to_compress.pop(0)
+            try:
+                self._compress(segment)
+            except Exception:
+                # The raw segment stays readable and is compressed on the next open.
+                logger.exception(
+                    "protocol segment compression failed", extra={"segment": str(segment.path)}
+                )
+
+    def _compress(self, segment: _Segment) -> None:
+        raw_path = segment.path
+        gz_path = self._segment_path(segment.seq, compressed=True)
+        index_path = self._index_path(segment.seq)
+        gz_tmp = gz_path.with_name(gz_path.name + ".tmp")
+        index_tmp = index_path.with_name(index_path.name + ".tmp")
+        raw = raw_path.read_bytes()
+        blocks = list(segment.blocks)
+        indexed_end = blocks[-1].offset + blocks[-1].length if blocks else 0
+        if indexed_end < len(raw):
+            blocks.extend(self._scan_blocks(raw, indexed_end))
+        compressed_blocks = []
+        offset = 0
+        with gz_tmp.open("wb") as out:
+            for block in blocks:
+                member = gzip.compress(raw[block.offset : block.offset + block.length], mtime=0)
+                out.write(member)
+                compressed_blocks.append(
+                    BlockIndex(block.min_ts, block.max_ts, offset, len(member), block.count)
+                )
+                offset += len(member)
+            out.flush()
+            os.fsync(out.fileno())
+        index_tmp.write_bytes(b"".join(block.pack() for block in compressed_blocks))
+        # The raw file is removed last: its presence marks an unfinished compression.
+        os.replace(gz_tmp, gz_path)
+        os.replace(index_tmp, index_path)
+        with self._lock:
+            segment.path = gz_path
+            segment.compressed = True
+            segment.blocks = compressed_blocks
+            segment.size = offset
+        raw_path.unlink()
+        logger.info(
+            "protocol segment compressed",
+            extra={"segment": str(gz_path), "raw_bytes": len(raw), "compressed_bytes": offset},
+        )
+
+    def _scan_blocks(self, raw: bytes, start: int) -> list[BlockIndex]:
+        """Index records after ``start`` that have no sidecar entry yet."""
+
+        blocks = []
+        block = _OpenBlock(start)
+        offset = start
+        for record in self._split(raw[start:]):
+            try:
+                ts = self._timestamp_of(record)
+            except ValueError:
+                # A torn record from a crash: drop it and everything after it.
+                break
+            block.add(ts)
+            offset += len(record)
+            if block.count >= self.index_interval:
+                blocks.append(block.seal(offset))
+                block = _OpenBlock(offset)
+        if block.count:
+            blocks.append(block.seal(offset))
+        return blocks
+
+    def _recover(self) -> None:
+        by_seq: dict[int, set[str]] = {}
+        for path in self.directory.iterdir():
+            match = _SEGMENT_NAME.match(path.name)
+            if match:
+                by_seq.setdefault(int(match.group(1)), set()).add(path.name[len(match.group(0)) :])
+        raw_suffix = self.suffix.lstrip(".")
+        for seq in sorted(by_seq):
+            names = by_seq[seq]
+            for leftover in (f"{raw_suffix}.gz.tmp", "idx.tmp"):
+                if leftover in names:
+                    (self.directory / f"{seq:08d}.{leftover}").unlink()
+            if raw_suffix in names:
+                # Interrupted or never started compression: redo it from the raw file.
+                self._segment_path(seq, compressed=True).unlink(missing_ok=True)
+                segment = _Segment(
+                    seq,
+                    self._segment_path(seq, compressed=False),
+                    compressed=False,
+                    blocks=_load_index(self._index_path(seq)),
+                )
+                self._segments.append(segment)
+                self._compress(segment)
+            elif f"{raw_suffix}.gz" in names:
+                path = self._segment_path(seq, compressed=True)
+                self._segments.append(
+                    _Segment(
+                        seq,
+                        path,
+                        compressed=True,
+                        blocks=_load_index(self._index_path(seq)),
+                        size=path.stat().st_size,
+                    )
+                )
+
+
+__all__ = ["BlockIndex", "SegmentedLog", "split_lines", "timestamp_ns"]
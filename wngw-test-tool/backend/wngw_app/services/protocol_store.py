@@ -1,54 +1,512 @@
-"""Simple JSONL based protocol store."""
+"""Protocol store for JSON lines and binary protocol logs."""
 
 from __future__ import annotations
 
-import json
+import logging
+import mmap
+import os
+import threading
+import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Iterable
+from queue import Empty, SimpleQueue
+from typing import BinaryIO, Callable, Iterable, Iterator, Literal, Optional, Sequence, Union
 
 from ..domain.models import ProtocolEntry, ProtocolListEntry
+from .protocol_catalogue import ProtocolCatalogue, ProtocolSummary, Signature
+from .protocol_codecs import BinaryCodec, JsonlCodec, RecordCodec, SymbolTable
+from .protocol_segments import SegmentedLog, timestamp_ns
+
+logger = logging.getLogger(__name__)
+
+Durability = Literal["none", "flush", "fsync"]
+
+# Queue items of the buffered writer: entries of one protocol, a barrier that is
+# set once everything queued before it is written, or the shutdown marker.
+_Batch = tuple[str, tuple[ProtocolEntry, ...]]
+_CLOSE = object()
+_Item = Union[_Batch, threading.Event, object]
+
+RecordFormat = Literal["jsonl", "binary"]
+
+# Reads wait this long for queued entries; ``flush`` polls the writer this often.
+_READ_FLUSH_TIMEOUT = 5.0
+_WRITER_POLL = 0.1
+
+_JSONL = JsonlCodec()
+_SYMBOLS = "symbols.jsonl"
+
+
+def _seek_since(buffer: mmap.mmap, since_ns: int) -> int:
+    """Offset of the first line with a timestamp ``>= since_ns``."""
+
+    low, high = 0, len(buffer)
+    while low < high:
+        middle = (low + high) // 2
+        start = buffer.rfind(b"\n", 0, middle) + 1
+        end = buffer.find(b"\n", start)
+        if end == -1:
+            end = len(buffer)
+        try:
+            before = _JSONL.timestamp(buffer[start:end]) < since_ns
+        except ValueError:
+            # Blank or torn lines never start the range.
+            before = True
+        if before:
+            low = end + 1
+        else:
+            high = start
+    return low
+
+
+def _mapped_records(
+    path: Path, since_ns: Optional[int], until_ns: Optional[int]
+) -> Iterator[bytes]:
+    with path.open("rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            position = _seek_since(buffer, since_ns) if since_ns is not None else 0
+            size = len(buffer)
+            while position < size:
+                end = buffer.find(b"\n", position)
+                end = size if end == -1 else end + 1
+                record = buffer[position:end]
+                position = end
+                if until_ns is not None:
+                    try:
+                        if _JSONL.timestamp(record) > until_ns:
+                            return
+                    except ValueError:
+                        pass
+                yield record
 
 
 class ProtocolStore:
-    """Persist protocol entries as JSON lines."""
+    """Persist protocol entries as JSON lines or compact binary records.
+
+    With ``buffered=True`` appends only enqueue the entries. A writer thread
+    keeps one file handle per protocol open, serializes the entries and writes
+    them in groups of up to ``flush_entries`` or after ``flush_interval``
+    seconds. ``durability`` chooses what happens after each group: ``"none"``
+    leaves the data in the file buffers, ``"flush"`` hands it to the OS and
+    ``"fsync"`` also syncs it to disk. ``close`` drains the queue.
+
+    Setting ``segment_bytes`` or ``segment_seconds`` stores each protocol as a
+    ``SegmentedLog`` directory instead of a single ``<name>.jsonl`` file, so
+    time-range reads only touch the blocks they need.
 
-    def __init__(self, base_dir: Path) -> None:
+    ``record_format="binary"`` writes new protocols as ``BinaryCodec`` records,
+    always in a segment directory. Existing protocols keep the format they
+    were created with.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        *,
+        buffered: bool = False,
+        durability: Durability = "flush",
+        flush_interval: float = 0.05,
+        flush_entries: int = 512,
+        segment_bytes: Optional[int] = None,
+        segment_seconds: Optional[float] = None,
+        index_interval: int = 256,
+        record_format: RecordFormat = "jsonl",
+    ) -> None:
+        if record_format not in ("jsonl", "binary"):
+            raise ValueError(f"Unknown record format {record_format!r}")
+        if durability not in ("none", "flush", "fsync"):
+            raise ValueError(f"Unknown durability {durability!r}")
+        if flush_interval <= 0 or flush_entries < 1:
+            raise ValueError("flush_interval and flush_entries must be positive")
         self.base_dir = base_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.durability: Durability = durability
+        self.flush_interval = flush_interval
+        self.flush_entries = flush_entries
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.index_interval = index_interval
+        self.record_format: RecordFormat = record_format
+        self._files: dict[str, BinaryIO] = {}
+        self._catalogue = ProtocolCatalogue(self._discover_protocols, self._scan_protocol)
+        self._logs: dict[str, SegmentedLog] = {}
+        self._logs_lock = threading.Lock()
+        self._queue: Optional[SimpleQueue[_Item]] = None
+        self._writer: Optional[threading.Thread] = None
+        # Error of an entry the writer thread could not store, raised to the
+        # next caller of ``append_many`` or ``flush``.
+        self._failure: Optional[Exception] = None
+        if buffered:
+            self._queue = SimpleQueue()
+            self._writer = threading.Thread(
+                target=self._run_writer,
+                args=(self._queue,),
+                name="protocol-store-writer",
+                daemon=True,
+            )
+            self._writer.start()
+
+    @property
+    def buffered(self) -> bool:
+        return self._queue is not None
+
+    @property
+    def segmented(self) -> bool:
+        if self.record_format == "binary":
+            return True
+        return self.segment_bytes is not None or self.segment_seconds is not None
 
     def _file_path(self, name: str) -> Path:
         return self.base_dir / f"{name}.jsonl"
 
+    def _is_segmented(self, name: str) -> bool:
+        """Whether ``name`` is written to a segment directory.
+
+        Existing protocols keep their layout whatever the store settings: one
+        with a segment directory stays segmented, a single ``<name>.jsonl``
+        file stays a single file.
+        """
+
+        if name in self._logs or (self.base_dir / name).is_dir():
+            return True
+        return self.segmented and not self._file_path(name).exists()
+
+    def _protocol_path(self, name: str) -> str:
+        return name if self._is_segmented(name) else f"{name}.jsonl"
+
+    def _write(self, name: str, entries: Sequence[ProtocolEntry], *, keep_open: bool) -> None:
+        segmented = self._is_segmented(name)
+        codec = self._log(name).codec if segmented else _JSONL
+        encode = codec.encode
+        records: list[tuple[int, bytes]] = []
+        results: list[str] = []
+        failure: Optional[Exception] = None
+        for entry in entries:
+            try:
+                records.append((timestamp_ns(entry.timestamp), encode(entry)))
+            except (TypeError, ValueError, OverflowError) as exc:
+                # An unserialisable payload only loses its own entry.
+                failure = exc
+                continue
+            results.append(entry.result)
+        data = b"".join(record for _ts, record in records)
+        with self._catalogue.lock:
+            if segmented:
+                self._log(name).append(records)
+            elif keep_open:
+                file = self._files.get(name)
+                if file is None:
+                    file = self._files[name] = self._file_path(name).open("ab")
+                file.write(data)
+            else:
+                with self._file_path(name).open("ab") as file:
+                    file.write(data)
+            self._catalogue.record(
+                name,
+                self._protocol_path(name),
+                (ts for ts, _record in records),
+                results,
+                len(data),
+            )
+        if failure is not None:
+            raise failure
+
+    def _log(self, name: str) -> SegmentedLog:
+        with self._logs_lock:
+            log = self._logs.get(name)
+            if log is None:
+                codec = self._directory_codec(self.base_dir / name)
+                log = self._logs[name] = SegmentedLog(
+                    self.base_dir / name,
+                    codec=codec,
+                    segment_bytes=self.segment_bytes,
+                    segment_seconds=self.segment_seconds,
+                    index_interval=self.index_interval,
+                )
+            return log
+
+    def _directory_codec(self, directory: Path) -> RecordCodec:
+        """Codec of an existing segment directory, else of ``record_format``."""
+
+        if (directory / _SYMBOLS).exists():
+            return BinaryCodec(SymbolTable(directory / _SYMBOLS))
+        if directory.is_dir() and any(directory.iterdir()):
+            return _JSONL
+        if self.record_format == "binary":
+            return BinaryCodec(SymbolTable(directory / _SYMBOLS))
+        return _JSONL
+
     def append(self, name: str, entry: ProtocolEntry) -> Path:
-        path = self._file_path(name)
-        with path.open("a", encoding="utf-8") as file:
-            file.write(json.dumps(entry.to_dict()))
-            file.write("\n")
-        return path
+        return self.append_many(name, (entry,))
+
+    def append_many(self, name: str, entries: Iterable[ProtocolEntry]) -> Path:
+        """Append ``entries`` with a single write."""
+
+        self._raise_failure()
+        queue = self._queue
+        if queue is not None:
+            queue.put((name, tuple(entries)))
+        else:
+            self._write(name, tuple(entries), keep_open=False)
+            if self._is_segmented(name) and self.durability != "none":
+                self._log(name).sync(fsync=self.durability == "fsync")
+        return self.base_dir / self._protocol_path(name)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every entry appended so far is written to the OS.
+
+        Returns ``False`` if ``timeout`` expired first or the writer thread has
+        stopped. Raises the error of an entry the writer failed to store.
+        """
+
+        written = self._wait_written(timeout)
+        self._raise_failure()
+        return written
+
+    def _wait_written(self, timeout: float | None) -> bool:
+        queue, writer = self._queue, self._writer
+        if queue is None or writer is None:
+            return True
+        if not writer.is_alive():
+            return False
+        written = threading.Event()
+        queue.put(written)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not written.wait(_WRITER_POLL):
+            if not writer.is_alive():
+                return False
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+        return True
+
+    def _raise_failure(self) -> None:
+        failure, self._failure = self._failure, None
+        if failure is not None:
+            raise failure
+
+    def close(self) -> None:
+        """Write all queued entries and close the files.
+
+        Later appends are written directly, as in unbuffered mode.
+        """
+
+        queue, writer = self._queue, self._writer
+        if queue is not None and writer is not None:
+            self._queue = None
+            queue.put(_CLOSE)
+            writer.join()
+            self._writer = None
+        with self._logs_lock:
+            for log in self._logs.values():
+                log.close()
 
     def list_protocols(self) -> list[ProtocolListEntry]:
-        entries: list[ProtocolListEntry] = []
-        for file in sorted(self.base_dir.glob("*.jsonl")):
-            stat = file.stat()
-            entries.append(
-                ProtocolListEntry(
-                    path=file.name,
-                    created_at=datetime.fromtimestamp(stat.st_mtime),
-                    description=None,
-                )
-            )
-        return entries
+        """Catalogue of all protocols; rescans only protocols changed by others."""
+
+        # Queued entries must be on disk before their signature is taken.
+        self._wait_written(_READ_FLUSH_TIMEOUT)
+        return self._catalogue.list()
+
+    def _discover_protocols(self) -> dict[str, Signature]:
+        """Signature of every protocol's legacy file and segment files."""
+
+        signatures: dict[str, Signature] = {}
+        for entry in os.scandir(self.base_dir):
+            if entry.is_dir():
+                name = entry.name
+                files = [item.stat() for item in os.scandir(entry.path) if item.is_file()]
+            elif entry.name.endswith(".jsonl"):
+                name = entry.name[: -len(".jsonl")]
+                files = [entry.stat()]
+            else:
+                continue
+            modified, size = signatures.get(name, (0, 0))
+            for stat in files:
+                modified = max(modified, stat.st_mtime_ns)
+                size += stat.st_size
+            signatures[name] = (modified, size)
+        return signatures
 
-    def read(self, name: str) -> Iterable[ProtocolEntry]:
+    def _scan_protocol(self, name: str) -> Optional[ProtocolSummary]:
+        sources: list[tuple[Path, RecordCodec, Callable[[], Iterable[bytes]]]] = []
         path = self._file_path(name)
-        if not path.exists():
-            return []
-        with path.open("r", encoding="utf-8") as file:
-            for line in file:
-                if line.strip():
-                    data = json.loads(line)
-                    yield ProtocolEntry.from_dict(data)
+        if path.is_file():
+            sources.append((path, _JSONL, partial(_mapped_records, path, None, None)))
+        directory = self.base_dir / name
+        if directory.is_dir():
+            log = self._log(name)
+            sources.append((directory, log.codec, log.records))
+        summary: Optional[ProtocolSummary] = None
+        for path, codec, records in sources:
+            try:
+                modified = path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if summary is None:
+                summary = ProtocolSummary(path.name, modified)
+            else:
+                # A legacy file next to a segment directory: report the directory.
+                summary.modified = max(summary.modified, modified)
+                summary.path = path.name
+            timestamps: list[int] = []
+            results: list[str] = []
+            size = 0
+            for record in records():
+                try:
+                    timestamps.append(codec.timestamp(record))
+                    results.append(codec.result(record))
+                except ValueError:
+                    continue
+                size += len(record)
+            summary.add(timestamps, results, size)
+        return summary
+
+    def read(
+        self,
+        name: str,
+        *,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        result: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Iterator[ProtocolEntry]:
+        """Entries of ``name`` with ``since <= timestamp <= until`` and ``result``.
+
+        ``offset`` matching entries are skipped and at most ``limit`` returned.
+        Entries are expected in append order with non-decreasing timestamps:
+        in a plain ``<name>.jsonl`` file the start of a ``since`` query is found
+        by binary search over the memory-mapped file and an ``until`` query
+        stops at the first later entry. Records are only decoded after a
+        byte-level check of the result and timestamp; the result is then
+        confirmed on the decoded entry.
+        """
+
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("limit and offset must not be negative")
+        if not self._wait_written(_READ_FLUSH_TIMEOUT):
+            logger.warning("protocol read without pending writes", extra={"protocol": name})
+        since_ns = timestamp_ns(since) if since is not None else None
+        until_ns = timestamp_ns(until) if until is not None else None
+        skip, remaining = offset, limit
+        if remaining == 0:
+            return
+        for codec, records in self._sources(name, since_ns, until_ns):
+            matches = codec.result_filter(result) if result is not None else None
+            for record in records:
+                if record.isspace() or (matches is not None and not matches(record)):
+                    continue
+                if since_ns is not None or until_ns is not None:
+                    try:
+                        ts = codec.timestamp(record)
+                    except ValueError:
+                        continue
+                    if (since_ns is not None and ts < since_ns) or (
+                        until_ns is not None and ts > until_ns
+                    ):
+                        continue
+                entry = None
+                if matches is not None:
+                    # The byte check may also hit a nested "result" in the payload.
+                    entry = codec.decode(record)
+                    if entry.result != result:
+                        continue
+                if skip:
+                    skip -= 1
+                    continue
+                yield entry if entry is not None else codec.decode(record)
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining == 0:
+                        return
+
+    def _sources(
+        self, name: str, since_ns: Optional[int], until_ns: Optional[int]
+    ) -> Iterator[tuple[RecordCodec, Iterable[bytes]]]:
+        """Records that may fall into the range with their codec, in storage order."""
+
+        path = self._file_path(name)
+        if path.exists():
+            yield _JSONL, _mapped_records(path, since_ns, until_ns)
+        if (self.base_dir / name).is_dir():
+            log = self._log(name)
+            yield log.codec, log.records(since=since_ns, until=until_ns)
+
+    def _run_writer(self, queue: SimpleQueue[_Item]) -> None:
+        try:
+            self._drain(queue)
+        except Exception as exc:
+            logger.exception("protocol writer stopped")
+            self._failure = exc
+            # Later appends are written directly instead of queueing forever.
+            self._queue = None
+
+    def _drain(self, queue: SimpleQueue[_Item]) -> None:
+        pending: dict[str, list[ProtocolEntry]] = {}
+        count = 0
+        deadline: Optional[float] = None
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            try:
+                item = queue.get(timeout=timeout)
+            except Empty:
+                item = None
+            if isinstance(item, tuple):
+                name, entries = item
+                pending.setdefault(name, []).extend(entries)
+                count += len(entries)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                if count < self.flush_entries:
+                    continue
+            # Barriers must see their data in the OS even with durability "none".
+            self._write_group(pending, force=item is not None)
+            pending.clear()
+            count = 0
+            deadline = None
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _CLOSE:
+                for file in self._files.values():
+                    file.close()
+                self._files.clear()
+                return
+
+    def _write_group(self, pending: dict[str, list[ProtocolEntry]], *, force: bool) -> None:
+        sync = self.durability != "none" or force
+        fsync = self.durability == "fsync"
+        for name, entries in pending.items():
+            try:
+                self._write(name, entries, keep_open=True)
+                if self._is_segmented(name) and sync:
+                    self._log(name).sync(fsync=fsync)
+            except OSError:
+                logger.exception("protocol write failed", extra={"protocol": name})
+            except Exception as exc:
+                logger.exception("protocol entry not stored", extra={"protocol": name})
+                self._failure = exc
+        if not sync:
+            return
+        # Without durability, files untouched by this group may still hold data.
+        names = self._files.keys() if self.durability == "none" else pending.keys()
+        for name in names:
+            file = self._files.get(name)
+            if file is None:
+                continue
+            try:
+                file.flush()
+                if fsync:
+                    os.fsync(file.fileno())
+            except OSError:
+                logger.exception("protocol flush failed", extra={"protocol": name})
+        if force and self.durability == "none":
+            with self._logs_lock:
+                logs = list(self._logs.values())
+            for log in logs:
+                log.sync()
 
 
-__all__ = ["ProtocolStore"]
+__all__ = ["Durability", "ProtocolStore", "RecordFormat"]
@@ -57,4 +57,20 @@ def read_signal_list(file: SupportsUploadFile, destination: Path) -> dict[str, A
     return {"records": records, "path": json_destination.name}
 
 
-__all__ = ["read_signal_list", "SignalListError", "REQUIRED_COLUMNS", "SupportsUploadFile"]
+def read_signal_list_ioas(path: Path) -> list[int]:
+    """IOAs of a signal list stored by ``read_signal_list``."""
+
+    try:
+        records = json.loads(path.read_text(encoding="utf-8"))
+        return [int(record["ioa"]) for record in records]
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        raise SignalListError(f"Cannot read signal list {path.name}") from exc
+
+
+__all__ = [
+    "read_signal_list",
+    "read_signal_list_ioas",
+    "SignalListError",
+    "REQUIRED_COLUMNS",
+    "SupportsUploadFile",
+]
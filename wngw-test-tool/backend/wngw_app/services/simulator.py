@@ -0,0 +1,305 @@
+"""Simulated IEC-104 outstation for soak and load tests."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Literal, Optional, Sequence
+
+from iec104 import (
+    ASDUHeader,
+    CauseOfTransmission,
+    CP56Time2a,
+    IEC104Session,
+    MeasuredValueASDU,
+    MeasuredValueFloat,
+    SingleCommandASDU,
+    SinglePointASDU,
+    SinglePointInformation,
+    SinglePointTimeASDU,
+    SinglePointWithCP56Time,
+    TypeID,
+)
+from iec104.errors import SessionClosedError
+
+from .iec104.adapter_lib import IEC104LibServerAdapterImpl
+
+logger = logging.getLogger(__name__)
+
+TrafficType = Literal["M_SP_NA_1", "M_SP_TB_1", "M_ME_NC_1"]
+
+_TICK = 0.01
+# Seconds of traffic a profile may fall behind before the backlog is dropped.
+_MAX_BACKLOG = 1.0
+
+
+@dataclass(slots=True)
+class TrafficProfile:
+    """Spontaneous traffic of one type, per connected session.
+
+    ``rate`` ASDUs per second are spread evenly over time; additionally every
+    ``burst_interval`` seconds ``burst_size`` ASDUs are sent at once.
+    """
+
+    type: TrafficType
+    rate: float = 1.0
+    objects_per_asdu: int = 1
+    burst_size: int = 0
+    burst_interval: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.type not in ("M_SP_NA_1", "M_SP_TB_1", "M_ME_NC_1"):
+            raise ValueError(f"Unsupported traffic type {self.type!r}")
+        if self.rate < 0 or self.burst_size < 0 or self.burst_interval < 0:
+            raise ValueError("rate and burst settings must not be negative")
+        if not 1 <= self.objects_per_asdu <= 127:
+            raise ValueError("objects_per_asdu must be between 1 and 127")
+        if self.burst_size and not self.burst_interval:
+            raise ValueError("burst_size requires a burst_interval")
+
+
+@dataclass(slots=True)
+class SimulatorConfig:
+    ioas: Sequence[int]
+    profiles: list[TrafficProfile] = field(default_factory=list)
+    common_address: int = 1
+    # Seconds between a command and its ACT_CON; negative values never confirm.
+    command_delay: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.ioas:
+            raise ValueError("Simulator needs at least one IOA")
+
+
+@dataclass(slots=True)
+class SimulatorStats:
+    asdus_sent: int = 0
+    objects_sent: int = 0
+    commands_confirmed: int = 0
+    # Sends that had to wait for a session's k window to open.
+    throttled: int = 0
+    # Configured and actually sent ASDUs per second and connected session.
+    target_rate: float = 0.0
+    achieved_rate: float = 0.0
+    # Time with sessions connected, summed over sessions.
+    session_seconds: float = 0.0
+
+
+class _ProfileGenerator:
+    """Builds the ASDUs of one profile, cycling through the configured IOAs."""
+
+    def __init__(self, profile: TrafficProfile, ioas: Sequence[int], common_address: int) -> None:
+        self.profile = profile
+        self._ioas: Iterator[int] = itertools.cycle(ioas)
+        self._common_address = common_address
+        self._counter = 0
+        self.credit = 0.0
+        self.next_burst = time.monotonic() + profile.burst_interval
+
+    def build(self) -> Any:
+        profile = self.profile
+        header = ASDUHeader(
+            type_id=TypeID[profile.type],
+            sequence=False,
+            vsq_number=profile.objects_per_asdu,
+            cause=CauseOfTransmission.SPONTANEOUS,
+            negative_confirm=False,
+            test=False,
+            originator_address=0,
+            common_address=self._common_address,
+            oa=None,
+        )
+        objects = [self._object(next(self._ioas)) for _ in range(profile.objects_per_asdu)]
+        if profile.type == "M_ME_NC_1":
+            return MeasuredValueASDU(header=header, information_objects=objects)
+        if profile.type == "M_SP_TB_1":
+            return SinglePointTimeASDU(header=header, information_objects=objects)
+        return SinglePointASDU(header=header, information_objects=objects)
+
+    def _object(self, ioa: int) -> Any:
+        self._counter += 1
+        counter = self._counter
+        if self.profile.type == "M_ME_NC_1":
+            return MeasuredValueFloat(ioa=ioa, value=round(100 * math.sin(counter / 50), 3))
+        if self.profile.type == "M_SP_TB_1":
+            timestamp = CP56Time2a.from_epoch_ms(time.time_ns() // 1_000_000)
+            return SinglePointWithCP56Time(ioa=ioa, value=bool(counter & 1), timestamp=timestamp)
+        return SinglePointInformation(ioa=ioa, value=bool(counter & 1))
+
+
+class StationSimulator:
+    """Outstation on top of ``IEC104LibServerAdapterImpl``.
+
+    Every connected session receives the spontaneous traffic of all profiles.
+    Sends wait for a session's k window to open, so a slow peer lowers the
+    achieved rate rather than losing ASDUs; ``stats`` reports the achieved
+    against the target rate. Single commands are answered with ACT_CON after
+    ``command_delay`` seconds.
+    """
+
+    def __init__(self, server: IEC104LibServerAdapterImpl, config: SimulatorConfig) -> None:
+        self._server = server
+        self.config = config
+        self.stats = SimulatorStats()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._replies: set[asyncio.Task[None]] = set()
+        self._accounted_at = 0.0
+        server.set_handler(self._handle)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    @property
+    def port(self) -> Optional[int]:
+        return self._server.port
+
+    async def start(self, bind_ip: str, port: int) -> None:
+        if self._task is not None:
+            return
+        await self._server.start(bind_ip, port)
+        self._task = asyncio.get_running_loop().create_task(self._generate())
+        logger.info(
+            "simulator started",
+            extra={
+                "port": port,
+                "profiles": len(self.config.profiles),
+                "ioas": len(self.config.ioas),
+            },
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        tasks = [self._task, *self._replies]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._replies.clear()
+        self._account(time.monotonic())
+        await self._server.stop()
+        logger.info(
+            "simulator stopped",
+            extra={
+                "asdus_sent": self.stats.asdus_sent,
+                "target_rate": self.stats.target_rate,
+                "achieved_rate": round(self.stats.achieved_rate, 1),
+            },
+        )
+
+    def _account(self, now: float) -> None:
+        """Add the connected time since the last call and update the achieved rate."""
+
+        stats = self.stats
+        open_sessions = sum(not session.closed for session in self._server.sessions)
+        stats.session_seconds += (now - self._accounted_at) * open_sessions
+        self._accounted_at = now
+        if stats.session_seconds:
+            stats.achieved_rate = stats.asdus_sent / stats.session_seconds
+
+    async def _generate(self) -> None:
+        config = self.config
+        generators = [
+            _ProfileGenerator(profile, config.ioas, config.common_address)
+            for profile in config.profiles
+        ]
+        stats = self.stats
+        stats.target_rate = sum(
+            profile.rate
+            + (profile.burst_size / profile.burst_interval if profile.burst_size else 0)
+            for profile in config.profiles
+        )
+        last = self._accounted_at = time.monotonic()
+        behind = False
+        while True:
+            await asyncio.sleep(_TICK)
+            now = time.monotonic()
+            elapsed, last = now - last, now
+            self._account(now)
+            sessions = self._server.sessions
+            for generator in generators:
+                profile = generator.profile
+                generator.credit += profile.rate * elapsed
+                if generator.credit > profile.rate * _MAX_BACKLOG:
+                    # Sending is slower than the target rate; ``achieved_rate`` shows by how much.
+                    generator.credit = profile.rate * _MAX_BACKLOG
+                    if not behind:
+                        behind = True
+                        logger.warning(
+                            "simulator behind target rate",
+                            extra={"profile": profile.type, "target_rate": profile.rate},
+                        )
+                due = int(generator.credit)
+                generator.credit -= due
+                if profile.burst_size and now >= generator.next_burst:
+                    due += profile.burst_size
+                    generator.next_burst = now + profile.burst_interval
+                for _ in range(due):
+                    if await self._broadcast(sessions, generator):
+                        # Let acknowledgements in before the windows fill up.
+                        await asyncio.sleep(0)
+
+    async def _broadcast(
+        self, sessions: Sequence[IEC104Session], generator: _ProfileGenerator
+    ) -> bool:
+        """Send the next ASDU to all sessions; ``True`` if a window is half full."""
+
+        asdu = generator.build()
+        stats = self.stats
+        blocked = []
+        sent = 0
+        filling = False
+        for session in sessions:
+            if session.closed:
+                continue
+            unacknowledged = session.unacknowledged
+            if unacknowledged >= session.params.k:
+                blocked.append(session.send_asdu(asdu))
+                continue
+            # Does not suspend: the window has room.
+            await session.send_asdu(asdu)
+            sent += 1
+            filling = filling or 2 * (unacknowledged + 1) >= session.params.k
+        if blocked:
+            # Wait for all full windows together, so one slow peer does not
+            # hold back the others longer than itself.
+            stats.throttled += len(blocked)
+            results = await asyncio.gather(*blocked, return_exceptions=True)
+            for result in results:
+                if result is None:
+                    sent += 1
+                elif not isinstance(result, SessionClosedError):
+                    raise result
+        stats.asdus_sent += sent
+        stats.objects_sent += sent * generator.profile.objects_per_asdu
+        return filling
+
+    async def _handle(self, session: IEC104Session, asdu: object) -> None:
+        if not isinstance(asdu, SingleCommandASDU) or self.config.command_delay < 0:
+            return
+        if asdu.header.cause is not CauseOfTransmission.ACTIVATION:
+            return
+        task = asyncio.get_running_loop().create_task(self._confirm(session, asdu))
+        self._replies.add(task)
+        task.add_done_callback(self._replies.discard)
+
+    async def _confirm(self, session: IEC104Session, asdu: SingleCommandASDU) -> None:
+        if self.config.command_delay:
+            await asyncio.sleep(self.config.command_delay)
+        asdu.header.cause = CauseOfTransmission.ACTIVATION_CON
+        await session.send_asdu(asdu)
+        self.stats.commands_confirmed += 1
+
+
+__all__ = [
+    "SimulatorConfig",
+    "SimulatorStats",
+    "StationSimulator",
+    "TrafficProfile",
+    "TrafficType",
+]
@@ -28,10 +28,20 @@ export async function apiRequest<TResponse, TBody = unknown>(
   return (await response.json()) as TResponse;
 }
 
+export interface LiveFilter {
+  role?: "client" | "server";
+  dir?: "tx" | "rx";
+  typeId?: number | number[];
+  ca?: Array<number | [number, number]>;
+  ioa?: Array<number | [number, number]>;
+}
+
 export class LiveSocket {
   private socket: WebSocket | null = null;
   private shouldReconnect = true;
   private readonly listeners = new Set<(data: unknown) => void>();
+  private filter: LiveFilter | null = null;
+  private nextSeq: number | null = null;
 
   constructor(private readonly url = "ws://localhost:8000/ws/live") {
     this.open();
@@ -41,11 +51,26 @@ export class LiveSocket {
     if (typeof WebSocket === 'undefined') {
       return;
     }
-    this.socket = new WebSocket(this.url);
+    // After a reconnect the server replays what was missed from its history.
+    const url = this.nextSeq === null ? this.url : `${this.url}?since_seq=${this.nextSeq}`;
+    this.socket = new WebSocket(url);
+    this.socket.onopen = () => {
+      if (this.filter) {
+        this.socket?.send(JSON.stringify({ filter: this.filter }));
+      }
+    };
     this.socket.onmessage = (event) => {
       try {
         const payload = JSON.parse(event.data);
-        this.listeners.forEach((listener) => listener(payload));
+        if (payload?.type === "error") {
+          console.warn("Live filter rejected", payload.detail);
+          return;
+        }
+        if (payload?.type === "batch") {
+          this.nextSeq = payload.next_seq;
+        }
+        const items = payload?.type === "batch" ? payload.events : [payload];
+        items.forEach((item: unknown) => this.listeners.forEach((listener) => listener(item)));
       } catch (error) {
         console.error("Failed to parse websocket event", error);
       }
@@ -57,6 +82,13 @@ export class LiveSocket {
     };
   }
 
+  public setFilter(filter: LiveFilter) {
+    this.filter = filter;
+    if (this.socket?.readyState === WebSocket.OPEN) {
+      this.socket.send(JSON.stringify({ filter }));
+    }
+  }
+
   public subscribe(listener: (data: unknown) => void) {
     this.listeners.add(listener);
     return () => this.listeners.delete(listener);
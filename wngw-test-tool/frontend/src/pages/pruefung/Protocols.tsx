@@ -6,6 +6,26 @@ interface ProtocolEntry {
   path: string;
   created_at: string;
   description?: string | null;
+  entries: number;
+  first_timestamp: string | null;
+  last_timestamp: string | null;
+  size_bytes: number;
+  results: Record<string, number>;
+}
+
+function formatSpan(row: ProtocolEntry): string {
+  if (!row.first_timestamp || !row.last_timestamp) {
+    return "–";
+  }
+  const first = new Date(row.first_timestamp).toLocaleString();
+  const last = new Date(row.last_timestamp).toLocaleString();
+  return `${first} – ${last}`;
+}
+
+function formatResults(results: Record<string, number>): string {
+  return Object.entries(results)
+    .map(([result, count]) => `${result}: ${count}`)
+    .join(", ");
 }
 
 export default function ProtocolsPage() {
@@ -21,7 +41,11 @@ export default function ProtocolsPage() {
         data={entries}
         columns={[
           { header: "Datei", accessor: (row) => row.path },
-          { header: "Erstellt", accessor: (row) => new Date(row.created_at).toLocaleString() },
+          { header: "Geändert", accessor: (row) => new Date(row.created_at).toLocaleString() },
+          { header: "Einträge", accessor: (row) => row.entries.toLocaleString() },
+          { header: "Zeitraum", accessor: formatSpan },
+          { header: "Größe", accessor: (row) => `${(row.size_bytes / 1024).toFixed(1)} KiB` },
+          { header: "Ergebnisse", accessor: (row) => formatResults(row.results) },
         ]}
       />
     </div>